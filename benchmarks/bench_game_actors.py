@@ -0,0 +1,119 @@
+"""게임 액터(메일박스) 처리량 벤치마크
+
+게임 수를 늘려가며 드래프트 명령(start_draft, select_champion, confirm_selection) 처리량을 측정합니다.
+emit 지점마다 --io-ms 만큼 대기해 네트워크 전송 지연을 흉내 냅니다.
+
+- actor: 게임별 메일박스에서 순서대로 처리 (SocketService 기본 방식)
+- global-lock: 모든 명령을 하나의 asyncio.Lock으로 직렬화
+
+    python benchmarks/bench_game_actors.py --games 1 10 100 1000
+"""
+import argparse
+import asyncio
+import contextlib
+import io
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import logging
+logging.disable(logging.CRITICAL)
+
+from models import GameSetting
+from services.game_service import GameService
+from services.socket_service import SocketService
+
+CHAMPIONS = ["Ahri", "Zed", "Lux", "Garen", "Jinx", "Thresh", "LeeSin", "Orianna", "Kaisa", "Nautilus"]
+
+
+def build_service(io_seconds: float):
+    game_service = GameService()
+    service = SocketService()
+    service.game_service = game_service
+    game_service.socket_service = service
+
+    async def fake_emit(*args, **kwargs):
+        if io_seconds:
+            await asyncio.sleep(io_seconds)
+
+    service.sio.emit = fake_emit
+    return game_service, service
+
+
+async def setup_games(game_service: GameService, service: SocketService, games: int):
+    sids = []
+    setting = GameSetting(version="14.1.1", draftType="tournament", playerType="single",
+                          matchFormat="bo1", timeLimit=False)
+    for i in range(games):
+        game = await game_service.create_game(setting.model_copy())
+        sid = f"sid{i}"
+        service.clients[sid] = {
+            'sid': sid, 'gameCode': game.gameCode, 'nickname': f"host{i}", 'position': 'all',
+            'isHost': True, 'isReady': True, 'champion': None, 'isConfirmed': False,
+        }
+        service.game_clients[game.gameCode] = {sid: service.clients[sid]}
+        sids.append(sid)
+    return sids
+
+
+async def play(service: SocketService, sid: str, dispatch) -> int:
+    """한 게임의 드래프트를 끝까지 진행하고 처리한 명령 수를 반환"""
+    commands = 1
+    await dispatch(service.handle_start_draft, sid, {})
+    for phase in range(1, 21):
+        await dispatch(service.handle_champion_select, sid, {'champion': CHAMPIONS[phase % len(CHAMPIONS)]})
+        await dispatch(service.handle_confirm_selection, sid, {})
+        commands += 2
+    return commands
+
+
+async def run(mode: str, games: int, io_seconds: float) -> dict:
+    game_service, service = build_service(io_seconds)
+    with contextlib.redirect_stdout(io.StringIO()):
+        sids = await setup_games(game_service, service, games)
+
+        lock = asyncio.Lock()
+
+        async def locked(handler, sid, data):
+            async with lock:
+                return await handler(sid, data)
+
+        async def in_actor(handler, sid, data):
+            game_code = service.clients[sid]['gameCode']
+            return await service.actors.submit(game_code, handler, sid, data)
+
+        dispatch = in_actor if mode == "actor" else locked
+        start = time.perf_counter()
+        counts = await asyncio.gather(*(play(service, sid, dispatch) for sid in sids))
+        elapsed = time.perf_counter() - start
+
+    finished = sum(1 for status in game_service.game_status.values() if status.phase == 21)
+    return {
+        "mode": mode,
+        "games": games,
+        "commands": sum(counts),
+        "seconds": elapsed,
+        "commandsPerSecond": sum(counts) / elapsed,
+        "finished": finished,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--games', type=int, nargs='+', default=[1, 10, 100])
+    parser.add_argument('--io-ms', type=float, default=1.0, help='emit 한 번당 대기 시간 (ms)')
+    parser.add_argument('--modes', nargs='+', default=['global-lock', 'actor'])
+    args = parser.parse_args()
+
+    print(f"{'mode':<12} {'games':>6} {'commands':>9} {'seconds':>8} {'cmd/s':>10} {'finished':>9}")
+    for games in args.games:
+        for mode in args.modes:
+            r = asyncio.run(run(mode, games, args.io_ms / 1000))
+            print(f"{r['mode']:<12} {r['games']:>6} {r['commands']:>9} {r['seconds']:>8.2f} "
+                  f"{r['commandsPerSecond']:>10.0f} {r['finished']:>9}")
+
+
+if __name__ == "__main__":
+    main()
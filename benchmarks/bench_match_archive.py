@@ -0,0 +1,139 @@
+"""종료된 매치 보관소 벤치마크
+
+임시 디렉터리에 세트 N개를 기록한 뒤 다음을 측정합니다.
+
+- 기록: append_match로 대기 행에 추가하고 묶음으로 파일에 기록하는 시간 (세트당)
+- 크기: 세트당 디스크 사용량과, 같은 세트를 GameResult 객체로 메모리에 둘 때의 크기 (pickle 기준)
+- 조회: 요약(필터 없음/버전 필터)과 CSV 내보내기 시간
+
+기록 단계의 입력은 GameResult 객체로 만들기 때문에 큰 N에서는 --generate-rows만큼만 객체로 만들고
+나머지는 같은 분포의 열 배열을 직접 기록합니다.
+
+    python benchmarks/bench_match_archive.py --sets 100000 1000000
+"""
+import argparse
+import os
+import pickle
+import random
+import shutil
+import sys
+import tempfile
+import time
+from types import SimpleNamespace
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+
+from models import GameResult, SetResult
+from services.match_archive import COLUMNS, MatchArchive
+
+CHAMPIONS = [f"Champion{i}" for i in range(170)]
+VERSIONS = ["14.1.1", "14.2.1", "14.3.1", "14.4.1"]
+DRAFT_TYPES = ["tournament", "hardFearless", "softFearless"]
+SETS_PER_MATCH = 3
+
+
+def make_match(rng: random.Random):
+    settings = SimpleNamespace(version=rng.choice(VERSIONS), draftType=rng.choice(DRAFT_TYPES), matchFormat="bo5")
+    status = SimpleNamespace(team1Name=f"Team{rng.randrange(500)}", team2Name=f"Team{rng.randrange(500)}",
+                             lastUpdatedAt=time.time_ns() // 1000)
+    result = GameResult(results=[
+        SetResult(phaseData=[""] + rng.sample(CHAMPIONS, 20) + ["team1"], team1Side=rng.choice(["blue", "red"]),
+                  team2Side="red", winner=rng.choice(["team1", "team2"]))
+        for _ in range(SETS_PER_MATCH)
+    ])
+    return f"{rng.getrandbits(32):08x}", SimpleNamespace(createdAt=status.lastUpdatedAt), settings, status, result
+
+
+def fill(archive: MatchArchive, rows: int, batch_rows: int = 100_000):
+    """append_match와 같은 분포의 열 배열을 묶음으로 직접 기록"""
+    rng = np.random.default_rng(1)
+    d = archive.dictionaries
+    champion_ids = np.array([d["champion"].encode(name) for name in CHAMPIONS], dtype=np.uint16)
+    version_ids = np.array([d["version"].encode(v) for v in VERSIONS])
+    draft_ids = np.array([d["draftType"].encode(v) for v in DRAFT_TYPES])
+    team_ids = np.array([d["team"].encode(f"Team{i}") for i in range(500)])
+    format_id = d["matchFormat"].encode("bo5")
+    now = time.time_ns() // 1000
+    for start in range(0, rows, batch_rows):
+        n = min(batch_rows, rows - start)
+        columns = {
+            "gameCode": rng.integers(0, 2 ** 32, n, dtype=np.uint32),
+            "setNumber": rng.integers(1, 6, n),
+            "createdAt": np.full(n, now),
+            "finishedAt": now + rng.integers(0, 10 ** 9, n),
+            "version": rng.choice(version_ids, n),
+            "draftType": rng.choice(draft_ids, n),
+            "matchFormat": np.full(n, format_id),
+            "team1Name": rng.choice(team_ids, n),
+            "team2Name": rng.choice(team_ids, n),
+            "team1Side": rng.integers(0, 2, n),
+            "winner": rng.integers(1, 3, n),
+            "slots": champion_ids[np.argsort(rng.random((n, len(champion_ids))), axis=1)[:, :20]],  # 중복 없는 20개
+        }
+        columns = {name: np.asarray(values, dtype=COLUMNS[name][0]) for name, values in columns.items()}
+        new_values = {name: dictionary.new_values() for name, dictionary in d.items()}
+        counts = {name: len(dictionary.values) for name, dictionary in d.items()}
+        archive._write_batch((n, columns, new_values, counts))
+
+
+def timed(func, *args, **kwargs):
+    start = time.perf_counter()
+    result = func(*args, **kwargs)
+    return result, (time.perf_counter() - start) * 1000
+
+
+def run(sets: int, args) -> dict:
+    path = tempfile.mkdtemp(prefix="archive-")
+    try:
+        archive = MatchArchive(path)
+        archive.open()
+        rng = random.Random(1)
+
+        matches = [make_match(rng) for _ in range(min(sets, args.generate_rows) // SETS_PER_MATCH)]
+        object_bytes = sum(len(pickle.dumps(match[4])) for match in matches)
+        start = time.perf_counter()
+        for match in matches:
+            archive.append_match(*match)
+            if archive.pending_rows >= args.batch_rows:
+                archive.flush()
+        archive.flush()
+        appended = archive.rows
+        append_us = (time.perf_counter() - start) * 1_000_000 / max(appended, 1)
+        fill(archive, sets - appended)
+
+        _, summary_ms = timed(archive.summary)
+        _, filtered_ms = timed(archive.summary, version=VERSIONS[0])
+        _, csv_ms = timed(lambda: sum(len(chunk) for chunk in archive.iter_csv()))
+        metrics = archive.metrics()
+        return {
+            "sets": archive.rows,
+            "appendUs": append_us,
+            "bytesPerSet": metrics["bytesPerSet"],
+            "objectBytesPerSet": object_bytes / max(appended, 1),
+            "summaryMs": summary_ms,
+            "filteredMs": filtered_ms,
+            "csvMs": csv_ms,
+        }
+    finally:
+        shutil.rmtree(path, ignore_errors=True)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--sets', type=int, nargs='+', default=[100000, 1000000], help='보관할 세트 수')
+    parser.add_argument('--generate-rows', type=int, default=30000, help='GameResult 객체로 만들어 기록할 최대 세트 수')
+    parser.add_argument('--batch-rows', type=int, default=256, help='묶음 기록 단위')
+    args = parser.parse_args()
+
+    print(f"{'sets':>9} {'append us':>9} {'disk B/set':>10} {'object B/set':>12} "
+          f"{'summary ms':>10} {'filtered ms':>11} {'csv ms':>8}")
+    for sets in args.sets:
+        r = run(sets, args)
+        print(f"{r['sets']:>9} {r['appendUs']:>9.1f} {r['bytesPerSet']:>10.1f} {r['objectBytesPerSet']:>12.0f} "
+              f"{r['summaryMs']:>10.1f} {r['filteredMs']:>11.1f} {r['csvMs']:>8.0f}")
+
+
+if __name__ == "__main__":
+    main()
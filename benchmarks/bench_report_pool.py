@@ -0,0 +1,108 @@
+"""리포트 작업 중 이벤트 루프 지연 벤치마크
+
+세트 결과를 쌓아 둔 GameService로 리포트를 만들면서, 같은 루프에서 5ms마다 깨어나는
+태스크(드래프트 이벤트 처리를 대신함)가 예정보다 얼마나 늦게 실행되는지 측정합니다.
+
+- inline: 이벤트 루프에서 리포트 함수를 직접 실행
+- pool: ReportPool로 스냅샷만 작업 프로세스에 보내 실행
+
+    python benchmarks/bench_report_pool.py --games 2000 6000 --jobs 4
+"""
+import argparse
+import asyncio
+import contextlib
+import io
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from models import GameResult, GameSetting, SetResult
+from services import report_jobs
+from services.game_service import GameService
+from services.report_pool import ReportPool, snapshot_results
+
+CHAMPIONS = [f"Champion{i}" for i in range(170)]
+TICK = 0.005
+
+
+async def setup_results(games: int) -> GameService:
+    service = GameService()
+    rng = random.Random(1)
+    for _ in range(games):
+        game = await service.create_game(GameSetting(
+            version=rng.choice(["14.1.1", "14.2.1"]), draftType="tournament",
+            playerType="single", matchFormat="bo5", timeLimit=False,
+        ))
+        service.game_results[game.gameCode] = GameResult(results=[
+            SetResult(phaseData=[""] + rng.sample(CHAMPIONS, 20), team1Side="blue", team2Side="red",
+                      winner=rng.choice(["team1", "team2"]))
+            for _ in range(rng.randint(3, 5))
+        ])
+    return service
+
+
+async def probe(samples: list, stop: asyncio.Event):
+    while not stop.is_set():
+        start = time.perf_counter()
+        await asyncio.sleep(TICK)
+        samples.append((time.perf_counter() - start - TICK) * 1000)
+
+
+async def run(mode: str, service: GameService, pool: ReportPool, jobs: int) -> dict:
+    samples = []
+    stop = asyncio.Event()
+    probe_task = asyncio.create_task(probe(samples, stop))
+    await asyncio.sleep(0.05)
+
+    async def job(func):
+        snapshot = await snapshot_results(service, list(service.game_results))
+        if mode == "pool":
+            return await pool.run(func, snapshot)
+        return func(snapshot)
+
+    start = time.perf_counter()
+    await asyncio.gather(*[job(report_jobs.sets_csv if i % 2 else report_jobs.summary) for i in range(jobs)])
+    elapsed = time.perf_counter() - start
+    stop.set()
+    await probe_task
+
+    samples.sort()
+    return {
+        "mode": mode,
+        "elapsedMs": elapsed * 1000,
+        "p50": samples[len(samples) // 2],
+        "p99": samples[min(len(samples) - 1, int(len(samples) * 0.99))],
+        "max": samples[-1],
+    }
+
+
+async def main_async(args):
+    pool = ReportPool(workers=args.workers, max_pending=args.jobs)
+    await pool.run(int)  # 작업 프로세스 시작 시간은 측정에서 제외
+    print(f"{'mode':<7} {'games':>6} {'sets':>7} {'total ms':>9} {'lag p50':>8} {'lag p99':>8} {'lag max':>8}")
+    for games in args.games:
+        with contextlib.redirect_stdout(io.StringIO()):  # 게임 생성 로그 숨김
+            service = await setup_results(games)
+        sets = sum(len(result.results) for result in service.game_results.values())
+        for mode in args.modes:
+            r = await run(mode, service, pool, args.jobs)
+            print(f"{r['mode']:<7} {games:>6} {sets:>7} {r['elapsedMs']:>9.0f} "
+                  f"{r['p50']:>8.2f} {r['p99']:>8.2f} {r['max']:>8.2f}")
+    pool.shutdown()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--games', type=int, nargs='+', default=[2000, 6000], help='세트 결과가 있는 게임 수')
+    parser.add_argument('--jobs', type=int, default=4, help='동시에 실행할 리포트 수')
+    parser.add_argument('--workers', type=int, default=2, help='작업 프로세스 수')
+    parser.add_argument('--modes', nargs='+', default=['inline', 'pool'])
+    args = parser.parse_args()
+    asyncio.run(main_async(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+"""연결별 클라이언트 정보 메모리 벤치마크
+
+SocketService.clients에 연결 N개의 클라이언트 정보를 만들 때 늘어나는 메모리를 tracemalloc으로 측정합니다.
+sid 문자열은 Engine.IO가 이미 가지고 있으므로 측정에서 제외하고, 참가 요청의 문자열은
+실제처럼 연결마다 JSON에서 새로 만들어집니다.
+
+- dict: 기존 방식 (연결할 때 키 10개짜리 딕셔너리)
+- slots: Client (게임에 참가하기 전에는 sid와 socketId만, 참가하면 ClientSeat 할당)
+
+상태별로 측정합니다.
+- connected: 연결만 하고 게임에 참가하지 않음
+- spectator: 한 게임에 관전자로 참가
+
+    python benchmarks/bench_session_memory.py --sockets 10000 100000
+"""
+import argparse
+import gc
+import json
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from models import Client
+
+GAME_CODE = "a1b2c3d4"
+
+
+def legacy_client(sid: str) -> dict:
+    return {
+        'sid': sid,
+        'socketId': None,
+        'gameCode': None,
+        'nickname': None,
+        'position': None,
+        'isHost': False,
+        'isReady': False,
+        'champion': None,
+        'isConfirmed': False
+    }
+
+
+def join(client, payload: str):
+    """handle_join_game과 같은 방식으로 참가 정보 기록"""
+    data = json.loads(payload)
+    client.update({
+        'gameCode': data['gameCode'],
+        'nickname': data['nickname'],
+        'position': data['position'],
+        'isHost': False,
+        'joinedAt': time.time_ns() // 1000
+    })
+
+
+def measure(mode: str, state: str, sids, payloads) -> int:
+    gc.collect()
+    tracemalloc.start()
+    clients = {}
+    for i, sid in enumerate(sids):
+        client = legacy_client(sid) if mode == 'dict' else Client(sid)
+        if state == 'spectator':
+            join(client, payloads[i])
+        clients[sid] = client
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del clients
+    return current
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--sockets', type=int, nargs='+', default=[10000, 100000], help='연결 수')
+    parser.add_argument('--modes', nargs='+', default=['dict', 'slots'], choices=['dict', 'slots'])
+    parser.add_argument('--states', nargs='+', default=['connected', 'spectator'], choices=['connected', 'spectator'])
+    args = parser.parse_args()
+
+    print(f"{'state':<10} {'mode':<6} {'sockets':>8} {'total MB':>9} {'B/conn':>7}")
+    for sockets in args.sockets:
+        sids = [f"{i:020d}" for i in range(sockets)]
+        payloads = [json.dumps({"gameCode": GAME_CODE, "nickname": f"viewer{i}", "position": "spectator"})
+                    for i in range(sockets)]
+        for state in args.states:
+            for mode in args.modes:
+                used = measure(mode, state, sids, payloads)
+                print(f"{state:<10} {mode:<6} {sockets:>8} {used / 1024 / 1024:>9.2f} {used / sockets:>7.0f}")
+
+
+if __name__ == "__main__":
+    main()
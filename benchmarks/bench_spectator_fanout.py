@@ -0,0 +1,132 @@
+"""관전자 브로드캐스트 팬아웃 벤치마크
+
+게임당 관전자 수를 늘려가며 `phase_progressed` 한 번을 전송하는 비용을 비교합니다.
+
+- room: 관전자를 게임 방에 넣고 sio.emit(room=...)으로 전송 (기존 방식)
+- per-sid: 관전자마다 sio.emit(to=sid)로 개별 인코딩해 전송
+- channel: SpectatorChannel로 한 번 인코딩한 패킷을 공유해 전송
+
+실제 소켓 대신 Engine.IO 전송 계층을 교체해 패킷 인코딩까지만 수행합니다.
+
+    python benchmarks/bench_spectator_fanout.py --spectators 1000 --games 1 10
+"""
+import argparse
+import asyncio
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import logging
+logging.disable(logging.CRITICAL)
+
+from engineio import packet as eio_packet
+from services.socket_service import SocketService
+
+EVENT = {
+    'gameCode': 'bench000',
+    'confirmedBy': 'Player1',
+    'fromPhase': 7,
+    'toPhase': 8,
+    'confirmedChampion': 'Ahri',
+    'timestamp': 1700000000000000,
+}
+
+
+class Counter:
+    encodes = 0
+    sends = 0
+
+
+_original_encode = eio_packet.Packet.encode
+
+
+def _counting_encode(self, b64=False):
+    if not self.encode_cache:
+        Counter.encodes += 1
+    return _original_encode(self, b64)
+
+
+eio_packet.Packet.encode = _counting_encode
+
+
+def install_fake_transport(service: SocketService):
+    """Engine.IO 소켓 대신 인코딩 횟수와 전송 횟수만 기록"""
+    async def send_packet(eio_sid, pkt):
+        Counter.sends += 1
+        pkt.encode()
+
+    service.sio.eio.send_packet = send_packet
+
+
+async def setup_games(service: SocketService, games: int, spectators: int, mode: str):
+    codes = []
+    eio_id = 0
+    for g in range(games):
+        code = f"game{g:04d}"
+        codes.append(code)
+        for _ in range(spectators):
+            eio_id += 1
+            sid = await service.sio.manager.connect(f"eio{eio_id}", '/')
+            if mode == "channel":
+                service.spectators.add(code, sid)
+            elif mode == "room":
+                await service.sio.enter_room(sid, code)
+            else:
+                service.game_clients.setdefault(code, {})[sid] = None
+    return codes
+
+
+async def run(mode: str, games: int, spectators: int, rounds: int) -> dict:
+    service = SocketService()
+    install_fake_transport(service)
+    codes = await setup_games(service, games, spectators, mode)
+
+    Counter.encodes = Counter.sends = 0
+    start = time.perf_counter()
+    for _ in range(rounds):
+        for code in codes:
+            if mode == "channel":
+                await service.spectators.broadcast(code, 'phase_progressed', EVENT)
+            elif mode == "room":
+                await service.sio.emit('phase_progressed', EVENT, room=code)
+            else:
+                for sid in service.game_clients[code]:
+                    await service.sio.emit('phase_progressed', EVENT, to=sid)
+        # room 모드는 수신자별 전송 태스크를 만들기 때문에 모두 끝날 때까지 대기
+        await asyncio.sleep(0)
+        while len(asyncio.all_tasks()) > 1:
+            await asyncio.sleep(0)
+    elapsed = time.perf_counter() - start
+
+    broadcasts = rounds * games
+    return {
+        "mode": mode,
+        "games": games,
+        "spectators": spectators,
+        "usPerBroadcast": elapsed / broadcasts * 1e6,
+        "usPerViewer": elapsed / (broadcasts * spectators) * 1e6,
+        "encodesPerBroadcast": Counter.encodes / broadcasts,
+        "sendsPerBroadcast": Counter.sends / broadcasts,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--spectators', type=int, default=1000, help='게임당 관전자 수')
+    parser.add_argument('--games', type=int, nargs='+', default=[1, 10], help='동시 게임 수')
+    parser.add_argument('--rounds', type=int, default=20, help='게임당 브로드캐스트 횟수')
+    parser.add_argument('--modes', nargs='+', default=['per-sid', 'room', 'channel'])
+    args = parser.parse_args()
+
+    print(f"{'mode':<8} {'games':>6} {'viewers':>8} {'us/bcast':>10} {'us/viewer':>10} {'encodes':>8} {'sends':>8}")
+    for games in args.games:
+        for mode in args.modes:
+            r = asyncio.run(run(mode, games, args.spectators, args.rounds))
+            print(f"{r['mode']:<8} {r['games']:>6} {r['spectators']:>8} {r['usPerBroadcast']:>10.1f} "
+                  f"{r['usPerViewer']:>10.3f} {r['encodesPerBroadcast']:>8.1f} {r['sendsPerBroadcast']:>8.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,223 @@
+"""Socket.IO 전송 프로필 비교 벤치마크
+
+프로필마다 서버(run.py)를 별도 프로세스로 띄우고, 바이트 수를 세는 TCP 프록시를 거쳐
+게임당 플레이어 1명과 관전자 여러 명을 연결한 뒤 다음을 측정합니다.
+
+- 연결 설정 시간: connect 호출부터 join_game 응답까지 (평균, p95)
+- 드래프트당 전송량: 드래프트 한 번(밴/픽 20회 선택과 확정) 동안 모든 참가자가 주고받은 바이트
+- 클라이언트당 서버 CPU: 드래프트 중, 그리고 대기 중(하트비트, long-polling) 서버 프로세스 CPU 시간
+
+    python benchmarks/bench_transport_profiles.py --clients 100 --idle-seconds 10
+"""
+import argparse
+import asyncio
+import logging
+import os
+import subprocess
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+logging.disable(logging.CRITICAL)
+
+import aiohttp
+import socketio
+
+from services.transport_profiles import PROFILES
+
+CHAMPIONS = ["Ahri", "Zed", "Lux", "Garen", "Jinx", "Thresh", "LeeSin", "Orianna", "Kaisa", "Nautilus",
+             "Ezreal", "Yasuo", "Sylas", "Viego", "Rell", "Azir", "Aphelios", "Renekton", "Gnar", "Rakan"]
+
+
+class ByteCounter:
+    def __init__(self):
+        self.up = 0
+        self.down = 0
+
+    @property
+    def total(self) -> int:
+        return self.up + self.down
+
+
+async def start_proxy(listen_port: int, target_port: int, counter: ByteCounter):
+    """클라이언트와 서버 사이의 모든 바이트(HTTP/웹소켓 프레임 포함)를 세는 TCP 프록시"""
+    async def pipe(reader, writer, upstream: bool):
+        try:
+            while True:
+                data = await reader.read(65536)
+                if not data:
+                    break
+                if upstream:
+                    counter.up += len(data)
+                else:
+                    counter.down += len(data)
+                writer.write(data)
+                await writer.drain()
+        except (ConnectionError, asyncio.CancelledError):
+            pass
+        finally:
+            writer.close()
+
+    async def handle(client_reader, client_writer):
+        server_reader, server_writer = await asyncio.open_connection("127.0.0.1", target_port)
+        await asyncio.gather(pipe(client_reader, server_writer, True), pipe(server_reader, client_writer, False))
+
+    return await asyncio.start_server(handle, "127.0.0.1", listen_port)
+
+
+def cpu_seconds(pid: int):
+    """서버 프로세스의 누적 CPU 시간 (user + system)"""
+    try:
+        with open(f"/proc/{pid}/stat") as f:
+            fields = f.read().rsplit(")", 1)[1].split()
+        return (int(fields[11]) + int(fields[12])) / os.sysconf("SC_CLK_TCK")
+    except OSError:
+        try:
+            import psutil
+        except ImportError:
+            return None
+        times = psutil.Process(pid).cpu_times()
+        return times.user + times.system
+
+
+async def wait_ready(url: str, timeout: float = 20):
+    deadline = time.monotonic() + timeout
+    async with aiohttp.ClientSession() as session:
+        while time.monotonic() < deadline:
+            try:
+                async with session.get(f"{url}/ping") as response:
+                    if response.status == 200:
+                        return
+            except aiohttp.ClientError:
+                pass
+            await asyncio.sleep(0.2)
+    raise RuntimeError("server did not start")
+
+
+async def connect_and_join(url: str, transports, game_code: str, nickname: str, position: str):
+    # 브라우저처럼 웹소켓 압축(permessage-deflate)을 제안
+    client = socketio.AsyncClient(reconnection=False, websocket_extra_options={"compress": 15})
+    start = time.perf_counter()
+    await client.connect(url, transports=transports)
+    ack = await client.call("join_game", {"gameCode": game_code, "nickname": nickname, "position": position})
+    if ack.get("status") != "success":
+        raise RuntimeError(f"join failed: {ack}")
+    return client, (time.perf_counter() - start) * 1000
+
+
+async def play_draft(host: socketio.AsyncClient):
+    await host.call("start_draft", {})
+    for phase in range(1, 21):
+        await host.call("select_champion", {"champion": CHAMPIONS[phase - 1]})
+        await host.call("confirm_selection", {})
+
+
+def pct(values, p):
+    values = sorted(values)
+    return values[min(len(values) - 1, int(len(values) * p))]
+
+
+async def run_profile(name: str, args) -> dict:
+    profile = PROFILES[name]
+    env = dict(os.environ, STATE_HANDOFF="0", SOCKET_TRANSPORT_PROFILE=name)
+    server = subprocess.Popen(
+        [sys.executable, "run.py", "--port", str(args.port), "--log-level", "critical"],
+        cwd=ROOT, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+    )
+    counter = ByteCounter()
+    proxy = await start_proxy(args.port + 1, args.port, counter)
+    url = f"http://127.0.0.1:{args.port + 1}"
+    clients = []
+    try:
+        await wait_ready(f"http://127.0.0.1:{args.port}")
+        games = max(1, args.clients // args.clients_per_game)
+        async with aiohttp.ClientSession() as session:
+            codes = []
+            for _ in range(games):
+                async with session.post(f"{url}/games", json={
+                    "version": "14.1.1", "draftType": "tournament", "playerType": "single",
+                    "matchFormat": "bo1", "timeLimit": False,
+                }) as response:
+                    codes.append((await response.json())["gameCode"])
+
+        # 연결 설정
+        setup_ms = []
+        hosts = []
+        for g, code in enumerate(codes):
+            host, ms = await connect_and_join(url, profile.transports, code, f"host{g}", "all")
+            hosts.append(host)
+            clients.append(host)
+            setup_ms.append(ms)
+            joined = await asyncio.gather(*[
+                connect_and_join(url, profile.transports, code, f"viewer{g}-{i}", "spectator")
+                for i in range(args.clients_per_game - 1)
+            ])
+            for client, ms in joined:
+                clients.append(client)
+                setup_ms.append(ms)
+        await asyncio.sleep(1)  # long-polling 프로필의 웹소켓 업그레이드가 끝나도록 대기
+
+        # 드래프트
+        pid = server.pid
+        bytes_before, cpu_before = counter.total, cpu_seconds(pid)
+        await asyncio.gather(*[play_draft(host) for host in hosts])
+        await asyncio.sleep(0.5)
+        draft_bytes = counter.total - bytes_before
+        cpu_after = cpu_seconds(pid)
+        draft_cpu = cpu_after - cpu_before if cpu_before is not None else None
+
+        # 대기 (하트비트)
+        bytes_before, cpu_before = counter.total, cpu_after
+        await asyncio.sleep(args.idle_seconds)
+        idle_bytes = counter.total - bytes_before
+        cpu_after = cpu_seconds(pid)
+        idle_cpu = cpu_after - cpu_before if cpu_before is not None else None
+
+        connected = len(clients)
+        return {
+            "profile": name,
+            "clients": connected,
+            "setupMs": sum(setup_ms) / len(setup_ms),
+            "setupP95Ms": pct(setup_ms, 0.95),
+            "bytesPerDraft": draft_bytes / len(hosts),
+            "bytesPerClientDraft": draft_bytes / connected,
+            "draftCpuMsPerClient": draft_cpu * 1000 / connected if draft_cpu is not None else None,
+            "idleCpuMsPerClientMin": idle_cpu * 1000 / connected * 60 / args.idle_seconds if idle_cpu is not None else None,
+            "idleBytesPerClientMin": idle_bytes / connected * 60 / args.idle_seconds,
+        }
+    finally:
+        await asyncio.gather(*[client.disconnect() for client in clients], return_exceptions=True)
+        proxy.close()
+        server.terminate()
+        server.wait()
+
+
+def fmt(value, spec):
+    return format(value, spec) if value is not None else "n/a".rjust(int(spec.lstrip(">").split(".")[0]))
+
+
+async def main_async(args):
+    print(f"{'profile':<10} {'clients':>7} {'setup ms':>9} {'p95 ms':>7} {'B/draft':>9} {'B/client':>9} "
+          f"{'cpu ms/client':>13} {'idle cpu ms/min':>15} {'idle B/min':>10}")
+    for name in args.profiles:
+        r = await run_profile(name, args)
+        print(f"{r['profile']:<10} {r['clients']:>7} {r['setupMs']:>9.1f} {r['setupP95Ms']:>7.1f} "
+              f"{r['bytesPerDraft']:>9.0f} {r['bytesPerClientDraft']:>9.0f} "
+              f"{fmt(r['draftCpuMsPerClient'], '>13.2f')} {fmt(r['idleCpuMsPerClientMin'], '>15.2f')} "
+              f"{r['idleBytesPerClientMin']:>10.0f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--profiles', nargs='+', default=list(PROFILES), choices=list(PROFILES))
+    parser.add_argument('--clients', type=int, default=50, help='전체 연결 수')
+    parser.add_argument('--clients-per-game', type=int, default=10, help='게임당 연결 수 (플레이어 1 + 관전자)')
+    parser.add_argument('--idle-seconds', type=float, default=10, help='대기 중 CPU를 측정할 시간')
+    parser.add_argument('--port', type=int, default=8700, help='서버 포트 (프록시는 port + 1)')
+    args = parser.parse_args()
+    asyncio.run(main_async(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,357 @@
+"""드래프트 상태 머신과 게임 조회 경로 마이크로 벤치마크
+
+서버에 게임과 클라이언트가 size개씩 있을 때 자주 호출되는 함수를 하나씩 떼어 호출당 시간을 측정합니다.
+
+- games: 서버 전체 게임 수 (측정 대상 게임 외에는 참가자가 없는 대기 게임)
+- clients: 측정 대상 게임의 참가자 수 (team1 호스트, team2 플레이어, 나머지는 관전자 채널의 관전자, 최소 2명)
+
+측정 함수
+- SocketService._is_clients_turn, _are_all_players_ready, _is_position_available
+- SocketService._extract_set_picks (하드피어리스 이전 세트 픽 추출)
+- SocketService.handle_confirm_selection, handle_confirm_result (하드피어리스 bo5)
+- GameService.get_game, create_game
+
+핸들러는 명령 확인, 상태 저장, 타임라인 기록까지 실제 경로를 그대로 지나고 브로드캐스트 전송만 제외합니다
+(관전자 팬아웃 비용은 bench_spectator_fanout.py로 측정). 각 함수는 --min-time 이상 걸리도록 호출 횟수를 정한 뒤
+--repeat번 반복해 가장 빠른 값을 씁니다. 공유 CPU에서는 머신 속도가 수십 % 흔들리므로, 측정할 때마다
+고정된 기준 작업의 시간도 재서 그 비율(relative)로 기준값과 비교합니다.
+
+결과를 JSON 기준값으로 저장하고, 변경 후 같은 머신에서 기준값과 비교할 수 있습니다.
+--threshold보다 느려진 함수는 --retries번까지 다시 측정하고, 그래도 느리면 종료 코드 1로 끝납니다.
+
+    python benchmarks/suite.py --save baseline.json
+    python benchmarks/suite.py --compare baseline.json --threshold 0.25
+    python benchmarks/suite.py --sizes 1 1000 --only get_game create_game
+"""
+import argparse
+import asyncio
+import contextlib
+import gc
+import json
+import os
+import platform
+import statistics
+import sys
+import time
+from datetime import datetime, timezone
+from functools import partial
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import logging
+logging.disable(logging.CRITICAL)
+
+from models import Client, GameSetting
+from services.draft_phases import side_of_phase
+from services.game_service import GameService
+from services.socket_service import SocketService
+
+FORMAT = 1
+CHAMPIONS = [f"Champion{i}" for i in range(20)]
+BENCHMARKS = [
+    "_is_clients_turn",
+    "_are_all_players_ready",
+    "_is_position_available",
+    "_extract_set_picks",
+    "handle_confirm_selection",
+    "handle_confirm_result",
+    "get_game",
+    "create_game",
+]
+
+
+class Fixture:
+    """게임 size개, 측정 대상 게임의 참가자 size명이 있는 서버 상태"""
+
+    def __init__(self, game_service: GameService, service: SocketService, setting: GameSetting,
+                 game_code: str, players: dict):
+        self.game_service = game_service
+        self.service = service
+        self.setting = setting
+        self.game_code = game_code
+        self.players = players  # team1/team2 → sid
+
+    @property
+    def status(self):
+        return self.game_service.game_status[self.game_code]
+
+
+def join(service: SocketService, sid: str, game_code: str, nickname: str, position: str, is_host: bool = False):
+    """handle_join_game과 같은 상태로 참가 정보 기록 (알림 전송 없이)"""
+    client = Client(sid)
+    client.update({'gameCode': game_code, 'nickname': nickname, 'position': position,
+                   'isHost': is_host, 'isReady': position != 'spectator', 'joinedAt': service._get_timestamp()})
+    service.clients[sid] = client
+    service.membership.join(game_code, sid, is_host)
+    if position == 'spectator':
+        service.spectators.add(game_code, sid)
+    else:
+        service.game_clients.setdefault(game_code, {})[sid] = client
+
+
+async def build_fixture(size: int) -> Fixture:
+    game_service = GameService()
+    service = SocketService()
+    service.game_service = game_service
+    game_service.socket_service = service
+
+    async def broadcast(event, data, game_code):
+        pass
+
+    service._broadcast = broadcast
+
+    setting = GameSetting(version="14.1.1", draftType="hardFearless", playerType="1v1",
+                          matchFormat="bo5", timeLimit=False)
+    game_code = None
+    for _ in range(size):
+        game = await game_service.create_game(setting.model_copy())
+        game_code = game_code or game.gameCode
+
+    players = {"team1": "sid-team1", "team2": "sid-team2"}
+    join(service, players["team1"], game_code, "Player1", "team1", is_host=True)
+    join(service, players["team2"], game_code, "Player2", "team2")
+    for i in range(size - 2):
+        sid = await service.sio.manager.connect(f"eio{i}", '/')
+        join(service, sid, game_code, f"viewer{i}", 'spectator')
+
+    status = game_service.game_status[game_code]
+    status.phaseData = [""] + CHAMPIONS + [""]
+    status.phase = 1
+    game_service.update_game_status(game_code, status)
+    return Fixture(game_service, service, setting, game_code, players)
+
+
+def benchmark_ops(fixture: Fixture) -> dict:
+    """이름 → (호출 함수, 비동기 여부)"""
+    service = fixture.service
+    game_service = fixture.game_service
+    game_code = fixture.game_code
+    team2 = service.clients[fixture.players["team2"]]
+    turn_sids = {phase: fixture.players["team1" if side_of_phase(phase) == fixture.status.team1Side else "team2"]
+                 for phase in range(1, 21)}
+
+    async def confirm_selection():
+        status = game_service.game_status[game_code]
+        if status.phase >= 21:
+            status.phase = 1
+        return await service.handle_confirm_selection(turn_sids[status.phase], {})
+
+    async def confirm_result():
+        status = game_service.game_status[game_code]
+        status.phase = 21
+        result = game_service.game_results.get(game_code)
+        if result:
+            result.team1Score = result.team2Score = 0
+        return await service.handle_confirm_result(fixture.players["team1"], {'winner': 'blue'})
+
+    return {
+        "_is_clients_turn": (partial(service._is_clients_turn, team2, 8, "1v1"), False),
+        "_are_all_players_ready": (partial(service._are_all_players_ready, game_code, "1v1"), False),
+        "_is_position_available": (partial(service._is_position_available, "team2", game_code), False),
+        "_extract_set_picks": (partial(service._extract_set_picks, fixture.status.phaseData), False),
+        "handle_confirm_selection": (confirm_selection, True),
+        "handle_confirm_result": (confirm_result, True),
+        "get_game": (partial(game_service.get_game, game_code), False),
+        "create_game": (partial(game_service.create_game, fixture.setting), True),
+    }
+
+
+EXPECTED_SET_PICKS = CHAMPIONS[6:12] + CHAMPIONS[16:20]  # 픽 페이즈 7-12, 17-20의 챔피언
+
+
+async def check_ops(ops: dict):
+    """측정 전에 핸들러가 오류 없이 끝나는지 확인 (오류 응답을 빠른 경로로 측정하지 않도록)"""
+    picks = ops["_extract_set_picks"][0]()
+    if picks != EXPECTED_SET_PICKS:
+        raise RuntimeError(f"_extract_set_picks 결과가 픽 페이즈와 다릅니다: {picks}")
+    for name in ("handle_confirm_selection", "handle_confirm_result"):
+        ack = await ops[name][0]()
+        if ack.get("status") != "success":
+            raise RuntimeError(f"{name} 실패: {ack}")
+
+
+def reference_work(loops: int = 1000):
+    """기준 작업: 머신 속도 변화를 보정하기 위해 함수 측정과 번갈아 실행"""
+    values = {}
+    for i in range(loops):
+        values[i & 63] = i
+    return values
+
+
+def time_reference(rounds: int = 50) -> float:
+    """기준 작업 한 번의 시간 (ns)"""
+    start = time.perf_counter()
+    for _ in range(rounds):
+        reference_work()
+    return (time.perf_counter() - start) / rounds * 1e9
+
+
+def run_sync(op, number: int) -> float:
+    start = time.perf_counter()
+    for _ in range(number):
+        op()
+    return time.perf_counter() - start
+
+
+async def run_async(op, number: int) -> float:
+    start = time.perf_counter()
+    for _ in range(number):
+        await op()
+    return time.perf_counter() - start
+
+
+async def measure(op, is_async: bool, min_time: float, repeat: int) -> dict:
+    async def timed(number):
+        return await run_async(op, number) if is_async else run_sync(op, number)
+
+    # 한 번 측정에 min_time 이상 걸리는 호출 횟수 찾기
+    number = 1
+    while True:
+        elapsed = await timed(number)
+        if elapsed >= min_time:
+            break
+        number = number * 10 if elapsed < min_time / 10 else number * 2
+
+    # 측정할 때마다 기준 작업 시간도 재서 가장 빠른 값끼리의 비율(relative)로 비교 (공유 CPU의 속도 변화 보정)
+    samples = []
+    references = []
+    for _ in range(repeat):
+        samples.append(await timed(number) / number * 1e9)
+        references.append(time_reference())
+    return {"nsPerOp": min(samples), "medianNs": statistics.median(samples),
+            "relative": min(samples) / min(references), "number": number}
+
+
+async def measure_isolated(op, is_async: bool, min_time: float, repeat: int) -> dict:
+    """timeit처럼 측정 중에는 GC를 끄고 미리 수거"""
+    gc.collect()
+    gc.disable()
+    try:
+        return await measure(op, is_async, min_time, repeat)
+    finally:
+        gc.enable()
+
+
+async def run_size(size: int, names, args, baseline: dict = None) -> list:
+    fixture = await build_fixture(size)
+    ops = benchmark_ops(fixture)
+    await check_ops(ops)
+    results = []
+    for name in names:
+        op, is_async = ops[name]
+        r = {"name": name, "size": size, **await measure_isolated(op, is_async, args.min_time, args.repeat)}
+        # 기준값보다 느리면 일시적인 머신 부하일 수 있으므로 다시 측정해 가장 빠른 값 사용
+        for _ in range(args.retries):
+            change = relative_change(r, baseline)
+            if change is None or change <= args.threshold:
+                break
+            retry = await measure_isolated(op, is_async, args.min_time, args.repeat)
+            if retry["relative"] < r["relative"]:
+                r.update(retry)
+        results.append(r)
+    return results
+
+
+def relative_change(r: dict, baseline: dict = None):
+    """기준값 대비 변화율 (기준값에 없으면 None)"""
+    base = (baseline or {}).get(result_key(r))
+    if base is None:
+        return None
+    return r['relative'] / base['relative'] - 1
+
+
+def result_key(r: dict) -> str:
+    return f"{r['name']}[{r['size']}]"
+
+
+def load_baseline(path: str) -> dict:
+    with open(path, encoding="utf-8") as f:
+        data = json.load(f)
+    if data.get("format") != FORMAT:
+        raise ValueError(f"지원하지 않는 기준값 형식입니다: {data.get('format')}")
+    return {result_key(r): r for r in data["results"]}
+
+
+def save_baseline(path: str, results: list, args):
+    data = {
+        "format": FORMAT,
+        "createdAt": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "platform": platform.platform(),
+        "minTime": args.min_time,
+        "repeat": args.repeat,
+        "results": results,
+    }
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(data, f, indent=2)
+        f.write("\n")
+
+
+def print_table(results: list, baseline: dict, threshold: float) -> list:
+    """결과 표를 출력하고 기준값보다 threshold 넘게 느려진 항목 반환"""
+    regressions = []
+    header = f"{'function':<26} {'size':>7} {'ns/op':>11} {'median':>11}"
+    if baseline is not None:
+        header += f" {'baseline':>11} {'change':>8}  status"
+    print(header)
+    for r in results:
+        line = f"{r['name']:<26} {r['size']:>7} {r['nsPerOp']:>11.0f} {r['medianNs']:>11.0f}"
+        if baseline is not None:
+            base = baseline.get(result_key(r))
+            if base is None:
+                line += f" {'-':>11} {'-':>8}  new"
+            else:
+                change = relative_change(r, baseline)
+                status = "ok"
+                if change > threshold:
+                    status = "REGRESSION"
+                    regressions.append((r, change))
+                elif change < -threshold:
+                    status = "faster"
+                line += f" {base['nsPerOp']:>11.0f} {change:>+8.1%}  {status}"
+        print(line)
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--sizes', type=int, nargs='+', default=[1, 100, 10000, 100000],
+                        help='게임 수와 측정 대상 게임의 참가자 수')
+    parser.add_argument('--only', nargs='+', choices=BENCHMARKS, help='측정할 함수 (기본: 전체)')
+    parser.add_argument('--min-time', type=float, default=0.05, help='한 번 측정의 최소 시간 (초)')
+    parser.add_argument('--repeat', type=int, default=7, help='측정 반복 횟수')
+    parser.add_argument('--save', metavar='PATH', help='결과를 JSON 기준값으로 저장')
+    parser.add_argument('--compare', metavar='PATH', help='JSON 기준값과 비교')
+    parser.add_argument('--threshold', type=float, default=0.25, help='회귀로 판단할 느려짐 비율 (0.25 = 25%%)')
+    parser.add_argument('--retries', type=int, default=2, help='기준값보다 느린 함수를 다시 측정할 횟수')
+    args = parser.parse_args()
+
+    baseline = None
+    if args.compare:
+        try:
+            baseline = load_baseline(args.compare)
+        except (OSError, ValueError, KeyError) as e:
+            parser.error(f"기준값을 읽을 수 없습니다: {e}")
+
+    names = args.only or BENCHMARKS
+    results = []
+    for size in args.sizes:
+        print(f"size {size} 측정 중...", file=sys.stderr)
+        # 게임 생성/페이즈 진행 로그는 측정에 방해되므로 버림
+        with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+            results.extend(asyncio.run(run_size(size, names, args, baseline)))
+
+    regressions = print_table(results, baseline, args.threshold)
+    if args.save:
+        save_baseline(args.save, results, args)
+        print(f"\n기준값 저장: {args.save}")
+    if regressions:
+        print(f"\n{len(regressions)}개 항목이 기준값보다 {args.threshold:.0%} 넘게 느려졌습니다:")
+        for r, change in regressions:
+            print(f"  {result_key(r)}: {change:+.1%}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -2,8 +2,10 @@ import os
 import platform
 from datetime import datetime
 from fastapi import FastAPI, HTTPException
-from routes import game_routes
+from routes import game_routes, admin_routes, stats_routes, asset_routes, champion_routes, webhook_routes, report_routes, archive_routes
+from services.state_handoff import dump_state, load_state
 from services.socket_service import SocketService
+from services.tracing import TracingMiddleware, tracer
 from starlette.middleware.cors import CORSMiddleware
 
 app = FastAPI(title="LoL Draft Server")
@@ -31,6 +33,9 @@ app.add_middleware(
     max_age=3600,
 )
 
+# REST 요청 추적 (TRACE_SAMPLE_RATE가 0이면 비활성화)
+app.add_middleware(TracingMiddleware, tracer=tracer)
+
 # Health check endpoint (Socket.IO 마운트 이전에 정의)
 @app.get("/ping")
 async def ping():
@@ -41,7 +46,8 @@ async def ping():
         "environment": os.environ.get("ENVIRONMENT", "development"),
         "python_version": platform.python_version(),
         "message": "LoL Draft Server is running",
-        "allowed_origins": allowed_origins  # 허용된 Origin 목록 추가 (디버깅용)
+        "allowed_origins": allowed_origins,  # 허용된 Origin 목록 추가 (디버깅용)
+        "transport": socket_service.transport_profile.describe(),  # 클라이언트가 연결 방식을 맞출 수 있도록
     }
 
 @app.get("/games/{game_code}")
@@ -59,11 +65,106 @@ async def get_game(game_code: str):
 # 라우터 등록 - API 라우터는 /api 접두사로 등록하고, 기존 경로도 유지
 app.include_router(game_routes.router)  # 기존 경로 유지 
 app.include_router(game_routes.router, prefix="/api")  # /api 접두사 추가
+app.include_router(admin_routes.router)
+app.include_router(admin_routes.router, prefix="/api")
+app.include_router(stats_routes.router)
+app.include_router(stats_routes.router, prefix="/api")
+app.include_router(asset_routes.router)
+app.include_router(asset_routes.router, prefix="/api")
+app.include_router(champion_routes.router)
+app.include_router(champion_routes.router, prefix="/api")
+app.include_router(webhook_routes.router)
+app.include_router(webhook_routes.router, prefix="/api")
+app.include_router(report_routes.router)
+app.include_router(report_routes.router, prefix="/api")
+app.include_router(archive_routes.router)
+app.include_router(archive_routes.router, prefix="/api")
 
 # Socket.IO 서비스 설정
 socket_service = SocketService()
 game_routes.game_service.socket_service = socket_service
 socket_service.game_service = game_routes.game_service
+socket_service.stats_service = stats_routes.stats_service
+socket_service.webhooks = webhook_routes.webhook_dispatcher
+game_routes.game_service.asset_store = asset_routes.asset_store
+game_routes.game_service.archive = archive_routes.match_archive
+game_routes.recommendation_service.catalog = champion_routes.champion_catalog
+stats_routes.stats_service.catalog = champion_routes.champion_catalog  # 카탈로그에 있는 챔피언만 통계에 집계
+
+# 재시작 인계 파일 - 종료 직전 게임 상태를 저장하고 다음 프로세스가 시작할 때 불러옴
+HANDOFF_FILE = os.getenv("HANDOFF_FILE", "data/handoff.json")
+HANDOFF_MAX_AGE_SECONDS = float(os.getenv("HANDOFF_MAX_AGE_SECONDS", "300"))
+HANDOFF_ENABLED = os.getenv("STATE_HANDOFF", "1") != "0"
+handoff_saved = False
+
+
+@app.on_event("startup")
+async def start_admission_monitor():
+    socket_service.admission.start()
+
+
+@app.on_event("startup")
+async def start_match_archive():
+    # 종료된 매치를 묶음으로 기록하고 보관 기간이 지나면 메모리에서 제거
+    try:
+        archive_routes.match_archive.start(game_routes.game_service.evict_finished_games)
+    except Exception as e:
+        # 보관소를 열 수 없으면 기록과 메모리 제거 없이 기존처럼 동작
+        archive_routes.match_archive.enabled = False
+        print(f"Error opening match archive: {e}")
+        return
+    # 이전 프로세스까지 보관소에 기록된 세트로 챔피언 통계와 추천 모델을 채움
+    if archive_routes.match_archive.enabled:
+        try:
+            loaded = archive_routes.match_archive.load_stats(stats_routes.stats_service)
+            if loaded:
+                print(f"Loaded {loaded} archived sets into champion stats")
+        except Exception as e:
+            print(f"Error loading champion stats from match archive: {e}")
+
+
+@app.on_event("startup")
+async def restore_handoff():
+    if not HANDOFF_ENABLED:
+        return
+    try:
+        restored = load_state(game_routes.game_service, HANDOFF_FILE, HANDOFF_MAX_AGE_SECONDS)
+        if restored:
+            print(f"Restored {len(restored)} games from handoff file {HANDOFF_FILE}")
+    except Exception as e:
+        print(f"Error restoring handoff file: {e}")
+
+
+async def prepare_shutdown(reconnect_after_ms: int = 2000):
+    """새 게임 생성을 막고 클라이언트에게 재접속을 안내한 뒤 게임 상태를 인계 파일로 저장합니다."""
+    global handoff_saved
+    game_routes.game_service.accepting_games = False
+    try:
+        await socket_service.notify_restart(reconnect_after_ms)
+    except Exception as e:
+        print(f"Error notifying clients of restart: {e}")
+    if HANDOFF_ENABLED and not handoff_saved:
+        saved = dump_state(game_routes.game_service, HANDOFF_FILE)
+        handoff_saved = True
+        print(f"Saved {saved} games to handoff file {HANDOFF_FILE}")
+
+
+@app.on_event("shutdown")
+async def save_handoff():
+    # run.py --production 없이 종료된 경우에도 상태는 저장
+    if HANDOFF_ENABLED and not handoff_saved:
+        try:
+            await prepare_shutdown()
+        except Exception as e:
+            print(f"Error saving handoff file: {e}")
+
+@app.on_event("shutdown")
+async def close_background_services():
+    await webhook_routes.webhook_dispatcher.close()
+    report_routes.report_pool.shutdown()
+    await archive_routes.match_archive.close()
+    await socket_service.admission.stop()
+    tracer.shutdown()
 
 # Socket.IO 앱 마운트 (원래 경로 유지)
 app.mount("/", socket_service.setup())
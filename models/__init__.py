@@ -1,3 +1,4 @@
+import sys
 from pydantic import BaseModel
 from typing import List, Optional, Literal, Dict
 
@@ -26,6 +27,7 @@ class GameStatus(BaseModel):
     team1Side: str = "blue"    # Team 1의 현재 진영 (blue 또는 red)
     team2Side: str = "red"     # Team 2의 현재 진영 (red 또는 blue)
     previousSetPicks: Optional[Dict[str, List[str]]] = {}  # 하드피어리스를 위한 이전 세트 픽 정보
+    stateVersion: int = 0  # 상태가 저장될 때마다 증가하는 버전 (낙관적 동시성 제어용)
 
 class SetResult(BaseModel):
     phaseData: List[str]
@@ -39,8 +41,96 @@ class GameResult(BaseModel):
     results: List[SetResult] = []
     sideChoices: List[str] = []
 
-class Client(dict):
-    """클라이언트 정보를 저장하는 딕셔너리 클래스"""
-    pass
+# 클라이언트 상태 플래그 (ClientSeat.flags 비트)
+IS_HOST = 1
+IS_READY = 2
+IS_CONFIRMED = 4
+_FLAG_BITS = {'isHost': IS_HOST, 'isReady': IS_READY, 'isConfirmed': IS_CONFIRMED}
+_SEAT_FIELDS = ('gameCode', 'nickname', 'position', 'champion', 'joinedAt')
+_INTERNED_FIELDS = ('gameCode', 'position', 'champion')  # 같은 값을 많은 연결이 공유하는 필드
+_CLIENT_KEYS = ('sid', 'socketId') + _SEAT_FIELDS + tuple(_FLAG_BITS)
 
-__all__ = ['Game', 'GameSetting', 'GameStatus', 'GameResult', 'SetResult', 'Client']
+
+class ClientSeat:
+    """게임에 참가한 클라이언트의 게임 정보"""
+    __slots__ = ('gameCode', 'nickname', 'position', 'champion', 'joinedAt', 'flags')
+
+    def __init__(self):
+        self.gameCode = None
+        self.nickname = None
+        self.position = None
+        self.champion = None
+        self.joinedAt = None
+        self.flags = 0
+
+
+class Client:
+    """소켓 연결별 클라이언트 정보 (기존 딕셔너리처럼 get, [], update로 접근)
+
+    관전자 수만큼 만들어지므로 __slots__를 사용하고, 게임에 참가하기 전에는 sid와 socketId만 가집니다.
+    게임 정보(ClientSeat)는 처음 값이 기록될 때 할당하고, 게임 코드와 포지션은 intern해서
+    같은 게임의 연결들이 문자열을 공유하며, isHost/isReady/isConfirmed는 비트 플래그로 저장합니다.
+    """
+    __slots__ = ('sid', 'socketId', 'seat')
+
+    def __init__(self, sid: str, socketId: Optional[str] = None):
+        self.sid = sid
+        self.socketId = socketId
+        self.seat: Optional[ClientSeat] = None
+
+    def __getitem__(self, key: str):
+        if key == 'sid' or key == 'socketId':
+            return getattr(self, key)
+        seat = self.seat
+        bit = _FLAG_BITS.get(key)
+        if bit is not None:
+            return bool(seat.flags & bit) if seat else False
+        if key in _SEAT_FIELDS:
+            return getattr(seat, key) if seat else None
+        raise KeyError(key)
+
+    def __setitem__(self, key: str, value):
+        if key == 'sid' or key == 'socketId':
+            setattr(self, key, value)
+            return
+        bit = _FLAG_BITS.get(key)
+        if bit is None and key not in _SEAT_FIELDS:
+            raise KeyError(key)
+        seat = self.seat
+        if seat is None:
+            if not value:
+                return  # 기본값이므로 게임 정보를 할당할 필요 없음
+            seat = self.seat = ClientSeat()
+        if bit is not None:
+            seat.flags = seat.flags | bit if value else seat.flags & ~bit
+        else:
+            if key in _INTERNED_FIELDS and type(value) is str:
+                value = sys.intern(value)
+            setattr(seat, key, value)
+
+    def __contains__(self, key) -> bool:
+        return key in _CLIENT_KEYS
+
+    def get(self, key: str, default=None):
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def update(self, values: Optional[dict] = None, **kwargs):
+        for key, value in {**(values or {}), **kwargs}.items():
+            self[key] = value
+
+    def keys(self):
+        return _CLIENT_KEYS
+
+    def items(self):
+        return [(key, self[key]) for key in _CLIENT_KEYS]
+
+    def to_dict(self) -> dict:
+        return dict(self.items())
+
+    def __repr__(self) -> str:
+        return f"Client({self.to_dict()!r})"
+
+__all__ = ['Game', 'GameSetting', 'GameStatus', 'GameResult', 'SetResult', 'Client', 'ClientSeat']
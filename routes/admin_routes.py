@@ -0,0 +1,184 @@
+import hmac
+import os
+from fastapi import APIRouter, Depends, Header, HTTPException, Query
+from pydantic import BaseModel, Field
+from typing import Optional, Literal
+from routes.game_routes import game_service
+from services.server_clock import server_clock
+
+PhaseFilter = Literal["lobby", "drafting", "side_choice", "finished"]
+
+
+def verify_admin_token(x_admin_token: Optional[str] = Header(None)):
+    """관리자 토큰을 확인합니다. ADMIN_TOKEN 환경 변수가 없으면 관리자 API를 열지 않습니다."""
+    admin_token = os.getenv("ADMIN_TOKEN")
+    if not admin_token:
+        raise HTTPException(status_code=503, detail="관리자 API가 비활성화되어 있습니다. ADMIN_TOKEN을 설정하세요.")
+    if not x_admin_token or not hmac.compare_digest(x_admin_token.encode(), admin_token.encode()):
+        raise HTTPException(status_code=401, detail="관리자 인증에 실패했습니다.")
+
+
+router = APIRouter(prefix="/admin", dependencies=[Depends(verify_admin_token)])
+
+
+class CloseGamesRequest(BaseModel):
+    phase: Optional[PhaseFilter] = None
+    draftType: Optional[Literal["tournament", "hardFearless", "softFearless"]] = None
+    matchFormat: Optional[Literal["bo1", "bo3", "bo5"]] = None
+    updatedSince: Optional[int] = None
+    updatedBefore: Optional[int] = None
+    reason: str = "closed"
+
+
+@router.get("/games")
+async def list_games(
+    phase: Optional[PhaseFilter] = None,
+    draftType: Optional[Literal["tournament", "hardFearless", "softFearless"]] = None,
+    matchFormat: Optional[Literal["bo1", "bo3", "bo5"]] = None,
+    updatedSince: Optional[int] = None,
+    updatedBefore: Optional[int] = None,
+    cursor: Optional[str] = None,
+    limit: int = Query(50, ge=1, le=500),
+):
+    """게임 목록을 최근 활동 순으로 반환합니다."""
+    try:
+        return game_service.list_games(
+            phase=phase,
+            draft_type=draftType,
+            match_format=matchFormat,
+            updated_since=updatedSince,
+            updated_before=updatedBefore,
+            cursor=cursor,
+            limit=limit,
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+
+@router.get("/games/stats")
+async def game_counts():
+    """구분별 게임 수를 반환합니다."""
+    directory = game_service.directory
+    return {
+        "total": directory.count(),
+        "lobby": directory.count("lobby"),
+        "drafting": directory.count("drafting"),
+        "side_choice": directory.count("side_choice"),
+        "finished": directory.count("finished"),
+    }
+
+
+@router.delete("/games/{game_code}")
+async def close_game(game_code: str, reason: str = "closed"):
+    """게임을 강제 종료합니다."""
+    try:
+        await game_service.close_game(game_code, reason)
+        return {"status": "success", "closed": [game_code]}
+    except ValueError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+
+
+@router.post("/games/close")
+async def close_games(request: CloseGamesRequest):
+    """필터에 맞는 게임을 일괄 강제 종료합니다."""
+    if not any([request.phase, request.draftType, request.matchFormat,
+                request.updatedSince is not None, request.updatedBefore is not None]):
+        raise HTTPException(status_code=400, detail="최소 한 개 이상의 필터가 필요합니다.")
+
+    closed = await game_service.close_games(
+        phase=request.phase,
+        draft_type=request.draftType,
+        match_format=request.matchFormat,
+        updated_since=request.updatedSince,
+        updated_before=request.updatedBefore,
+        reason=request.reason,
+    )
+    return {"status": "success", "closed": closed}
+
+
+class RestoreDraftRequest(BaseModel):
+    steps: int = Field(1, ge=1)
+    setNumber: Optional[int] = None  # setNumber와 phase를 주면 steps 대신 그 페이즈로 이동
+    phase: Optional[int] = None
+
+
+@router.get("/games/{game_code}/history")
+async def draft_history(game_code: str):
+    """되돌리기/다시 실행할 수 있는 페이즈 버전 목록을 반환합니다 (cursor는 현재 상태가 시작된 버전)."""
+    if game_code not in game_service.games:
+        raise HTTPException(status_code=404, detail="게임을 찾을 수 없습니다.")
+    return {"gameCode": game_code, **game_service.history.describe(game_code)}
+
+
+async def restore_draft(game_code: str, request: RestoreDraftRequest, direction: int):
+    if game_code not in game_service.games:
+        raise HTTPException(status_code=404, detail="게임을 찾을 수 없습니다.")
+    socket_service = game_service.socket_service
+    if socket_service is None:
+        raise HTTPException(status_code=503, detail="소켓 서비스가 준비되지 않았습니다.")
+    try:
+        # 소켓 명령과 순서가 섞이지 않도록 게임 메일박스에서 실행
+        state = await socket_service.actors.submit(
+            game_code, socket_service.restore_draft, game_code, request.steps * direction,
+            request.setNumber, request.phase, "admin"
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return {"status": "success", "state": state}
+
+
+@router.post("/games/{game_code}/undo")
+async def undo_draft(game_code: str, request: RestoreDraftRequest = RestoreDraftRequest()):
+    """게임 상태를 이전 페이즈로 되돌립니다."""
+    return await restore_draft(game_code, request, -1)
+
+
+@router.post("/games/{game_code}/redo")
+async def redo_draft(game_code: str, request: RestoreDraftRequest = RestoreDraftRequest()):
+    """되돌린 페이즈를 다시 실행합니다."""
+    return await restore_draft(game_code, request, 1)
+
+
+@router.get("/metrics/actors")
+async def actor_metrics():
+    """게임별 메일박스 큐 길이와 처리 시간 지표를 반환합니다."""
+    if not game_service.socket_service:
+        return {"activeActors": 0, "trackedGames": 0, "games": {}}
+    return game_service.socket_service.actors.metrics()
+
+
+@router.get("/metrics/clock")
+async def clock_metrics(gameCode: Optional[str] = None):
+    """서버 시계와 clock_sync로 측정한 연결별 RTT 추정치를 반환합니다."""
+    socket_service = game_service.socket_service
+    if not socket_service:
+        return {"serverTime": server_clock.now_us(), "wallDriftUs": server_clock.wall_drift_us(), "rtt": {}}
+    result = {
+        "serverTime": server_clock.now_us(),
+        "wallDriftUs": server_clock.wall_drift_us(),
+        "rtt": socket_service.rtt.metrics(),
+    }
+    if gameCode:
+        result["clients"] = [
+            {
+                "clientId": client["sid"],
+                "nickname": client.get("nickname"),
+                "position": client.get("position"),
+                "rttMs": round(rtt_ms, 2) if (rtt_ms := socket_service.rtt.get(client["sid"])) is not None else None,
+                "graceMs": round(socket_service.rtt.grace_ms(client["sid"]), 2),
+            }
+            for client in socket_service.get_members(gameCode)
+        ]
+    return result
+
+
+@router.get("/load")
+async def load_status():
+    """이벤트 루프 지연, 메모리 사용량, 연결 수와 부하 차단 상태를 반환합니다."""
+    socket_service = game_service.socket_service
+    if socket_service is None:
+        raise HTTPException(status_code=503, detail="소켓 서비스가 준비되지 않았습니다.")
+    return {
+        "connections": len(socket_service.clients),
+        **socket_service.admission.metrics(),
+    }
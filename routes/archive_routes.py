@@ -0,0 +1,55 @@
+import asyncio
+from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.responses import StreamingResponse
+from typing import Optional, Literal
+from routes.admin_routes import verify_admin_token
+from services.match_archive import MatchArchive
+
+router = APIRouter(prefix="/archive", dependencies=[Depends(verify_admin_token)])
+match_archive = MatchArchive()
+
+
+def require_archive():
+    """보관소를 사용하지 않거나(MATCH_ARCHIVE=0, 다른 워커가 사용 중) 열지 못한 경우 503"""
+    if not match_archive.enabled:
+        raise HTTPException(status_code=503, detail="이 서버 프로세스는 매치 보관소를 사용하지 않습니다.")
+
+
+def archive_filters(
+    version: Optional[str] = None,
+    draftType: Optional[Literal["tournament", "hardFearless", "softFearless"]] = None,
+    matchFormat: Optional[Literal["bo1", "bo3", "bo5"]] = None,
+    gameCode: Optional[str] = None,
+    finishedSince: Optional[int] = None,
+    finishedBefore: Optional[int] = None,
+) -> dict:
+    return {
+        "version": version,
+        "draft_type": draftType,
+        "match_format": matchFormat,
+        "game_code": gameCode,
+        "finished_since": finishedSince,
+        "finished_before": finishedBefore,
+    }
+
+
+@router.get("/sets.csv", dependencies=[Depends(require_archive)])
+async def export_archived_sets(filters: dict = Depends(archive_filters)):
+    """보관된 세트를 세트마다 한 줄인 CSV로 내보냅니다 (묶음 단위로 스트리밍)."""
+    return StreamingResponse(
+        match_archive.iter_csv(**filters),
+        media_type="text/csv",
+        headers={"Content-Disposition": 'attachment; filename="archive.csv"'},
+    )
+
+
+@router.get("/summary", dependencies=[Depends(require_archive)])
+async def archived_summary(filters: dict = Depends(archive_filters), top: int = Query(10, ge=1, le=100)):
+    """보관된 세트의 진영 승률과 많이 픽/밴된 챔피언을 요약합니다."""
+    return await asyncio.to_thread(match_archive.summary, top, **filters)
+
+
+@router.get("/metrics")
+async def archive_metrics():
+    """보관소 행 수, 디스크 사용량, 대기 행 수를 반환합니다."""
+    return match_archive.metrics()
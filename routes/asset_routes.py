@@ -0,0 +1,98 @@
+import os
+import re
+from fastapi import APIRouter, HTTPException, Request
+from fastapi.responses import Response
+from typing import Optional
+from services.asset_store import AssetQuotaExceeded, AssetStore
+
+router = APIRouter(prefix="/assets")
+asset_store = AssetStore()
+
+CACHE_CONTROL = "public, max-age=31536000, immutable"
+RANGE_PATTERN = re.compile(r"^bytes=(\d*)-(\d*)$")
+
+
+def parse_range(range_header: str, size: int) -> Optional[tuple]:
+    """단일 바이트 범위(Range) 헤더 파싱. 만족할 수 없는 범위면 ValueError"""
+    match = RANGE_PATTERN.match(range_header.strip())
+    if not match:
+        return None  # 다중 범위 등 지원하지 않는 형식은 전체 응답
+    start, end = match.groups()
+    if not start and not end:
+        raise ValueError
+    if not start:
+        length = int(end)
+        if length == 0:
+            raise ValueError
+        return max(size - length, 0), size - 1
+    start = int(start)
+    end = min(int(end), size - 1) if end else size - 1
+    if start >= size or start > end:
+        raise ValueError
+    return start, end
+
+
+@router.post("")
+async def upload_asset(request: Request):
+    """이미지 바이트를 업로드하고 자산 참조를 반환합니다."""
+    content_length = request.headers.get("content-length")
+    if content_length and content_length.isdigit() and int(content_length) > asset_store.max_bytes:
+        raise HTTPException(status_code=413, detail="이미지 크기가 너무 큽니다.")
+
+    # Content-Length가 없는 chunked 업로드도 받은 만큼 세어 한도를 넘으면 중단
+    data = bytearray()
+    async for chunk in request.stream():
+        data += chunk
+        if len(data) > asset_store.max_bytes:
+            raise HTTPException(status_code=413, detail="이미지 크기가 너무 큽니다.")
+
+    base_url = str(request.base_url)
+    try:
+        if data.startswith(b"data:"):
+            return asset_store.put_data_url(data.decode("ascii", errors="ignore"), base_url)
+        return asset_store.put(bytes(data), base_url)
+    except AssetQuotaExceeded as e:
+        raise HTTPException(status_code=507, detail=str(e))
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+
+@router.api_route("/{asset_id}", methods=["GET", "HEAD"])
+async def get_asset(asset_id: str, request: Request):
+    """저장된 이미지를 영구 캐시 헤더와 함께 반환합니다."""
+    found = asset_store.lookup(asset_id)
+    if not found:
+        raise HTTPException(status_code=404, detail="이미지를 찾을 수 없습니다.")
+    path, content_type = found
+
+    etag = f'"{asset_id}"'
+    headers = {
+        "Cache-Control": CACHE_CONTROL,
+        "ETag": etag,
+        "Accept-Ranges": "bytes",
+    }
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match and etag in [tag.strip() for tag in if_none_match.split(",")]:
+        return Response(status_code=304, headers=headers)
+
+    size = os.path.getsize(path)
+    byte_range = None
+    range_header = request.headers.get("range")
+    if range_header:
+        try:
+            byte_range = parse_range(range_header, size)
+        except ValueError:
+            return Response(status_code=416, headers={**headers, "Content-Range": f"bytes */{size}"})
+
+    start, end = byte_range or (0, size - 1)
+    body = b""
+    if request.method == "GET":
+        with open(path, "rb") as f:
+            f.seek(start)
+            body = f.read(end - start + 1)
+
+    headers["Content-Length"] = str(end - start + 1)
+    if byte_range:
+        headers["Content-Range"] = f"bytes {start}-{end}/{size}"
+        return Response(body, status_code=206, media_type=content_type, headers=headers)
+    return Response(body, media_type=content_type, headers=headers)
@@ -0,0 +1,47 @@
+from fastapi import APIRouter, HTTPException, Query, Response
+from typing import Optional
+from routes.game_routes import game_service
+from services.champion_search import ChampionCatalog
+
+router = APIRouter(prefix="/champions")
+champion_catalog = ChampionCatalog()
+
+
+@router.get("/search")
+async def search_champions(
+    response: Response,
+    q: str = "",
+    version: Optional[str] = None,
+    gameCode: Optional[str] = None,
+    limit: int = Query(10, ge=1, le=200),
+):
+    """챔피언 이름 자동완성 (영문/한글 접두어, 초성, 줄임말)
+
+    gameCode를 지정하면 게임 버전을 사용하고 해당 게임에서 선택할 수 없는 챔피언을 제외합니다.
+    """
+    exclude = ()
+    if gameCode:
+        game_settings = game_service.game_settings.get(gameCode)
+        if not game_settings:
+            raise HTTPException(status_code=404, detail="게임을 찾을 수 없습니다.")
+        version = version or game_settings.version
+        exclude = game_service.get_unavailable_champions(gameCode)
+    if not version:
+        raise HTTPException(status_code=400, detail="version 또는 gameCode가 필요합니다.")
+
+    try:
+        index = await champion_catalog.get_index(version)
+    except ValueError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+    except Exception as e:
+        print(f"Error loading champion catalog {version}: {e}")
+        raise HTTPException(status_code=503, detail="챔피언 목록을 불러오지 못했습니다.")
+
+    # 게임과 무관한 검색 결과는 패치 버전마다 고정이므로 브라우저 캐시 허용
+    if not gameCode:
+        response.headers["Cache-Control"] = "public, max-age=3600"
+    return {
+        "version": version,
+        "query": q,
+        "results": index.lookup(q, exclude=exclude, limit=limit),
+    }
@@ -1,26 +1,54 @@
-from fastapi import APIRouter, HTTPException, Request
+from fastapi import APIRouter, Header, HTTPException, Query, Request
+from fastapi.responses import StreamingResponse
 from models import Game, GameSetting, GameStatus
+from services.admission import AdmissionError
+from services.asset_store import AssetQuotaExceeded
 from services.game_service import GameService
+from services.recommendation_service import RecommendationService
+from routes.stats_routes import stats_service
 from pydantic import BaseModel
 from typing import List, Optional, Literal
 
 router = APIRouter()
 game_service = GameService()
+recommendation_service = RecommendationService(game_service, stats_service)
+
+
+def admission_rejected(e: AdmissionError) -> HTTPException:
+    """부하 차단 거절을 Retry-After 헤더가 있는 503 응답으로 변환"""
+    return HTTPException(status_code=503, detail=e.as_detail(),
+                         headers={"Retry-After": str(-(-e.retry_after_ms // 1000))})
 
 @router.post("/games")
 async def create_game(setting: GameSetting, request: Request):
     """새로운 게임을 생성합니다."""
+    if not game_service.accepting_games:
+        raise HTTPException(status_code=503, detail="서버가 재시작 중입니다. 잠시 후 다시 시도해주세요.",
+                            headers={"Retry-After": "5"})
+    if game_service.socket_service:
+        # 과부하 상태에서는 진행 중인 드래프트를 위해 새 게임 생성을 먼저 거절
+        try:
+            game_service.socket_service.admission.check_new_game()
+        except AdmissionError as e:
+            raise admission_rejected(e)
     try:
         # 요청 디버깅
         print(f"게임 생성 요청: {setting}")
         
         # 게임 생성
         game = await game_service.create_game(setting, request)
+        # 세트 결과를 통계에 반영할 때 챔피언을 검증할 수 있도록 카탈로그를 미리 불러옴
+        stats_service.prefetch(setting.version)
         
         # 생성된 게임 정보 출력
         print(f"게임 생성 성공: {game.gameCode}")
         
         return game
+    except AssetQuotaExceeded as e:
+        raise HTTPException(status_code=507, detail=str(e))
+    except ValueError as e:
+        # 지원하지 않는 형식이거나 너무 큰 data URL 배너 이미지
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         print(f"Error in create_game endpoint: {e}")
         raise HTTPException(status_code=500, detail=f"게임 생성에 실패했습니다: {str(e)}")
@@ -66,6 +94,84 @@ async def get_game(game_code: str):
         print(f"Error in get_game endpoint: {e}")
         raise HTTPException(status_code=500, detail="게임 정보를 불러오는데 실패했습니다.")
 
+@router.get("/games/{game_code}/events")
+async def stream_game_events(
+    game_code: str,
+    lastEventId: Optional[int] = None,
+    last_event_id: Optional[str] = Header(None),
+):
+    """게임 상태 변경을 Server-Sent Events로 스트리밍합니다."""
+    if game_code not in game_service.game_status or not game_service.socket_service:
+        raise HTTPException(status_code=404, detail="게임을 찾을 수 없습니다.")
+
+    # SSE 구독자는 관전자와 같은 한도와 부하 차단을 적용
+    socket_service = game_service.socket_service
+    try:
+        subscribers = socket_service.event_stream.subscriber_count(game_code)
+        socket_service.admission.check_join(
+            members=socket_service.membership.count(game_code) + subscribers,
+            spectators=socket_service.spectators.count(game_code) + subscribers,
+            spectator=True,
+        )
+    except AdmissionError as e:
+        raise admission_rejected(e)
+
+    # 재연결 시 브라우저가 보내는 Last-Event-ID 헤더를 우선 사용
+    resume_id = lastEventId
+    if last_event_id and last_event_id.isdigit():
+        resume_id = int(last_event_id)
+
+    stream = game_service.socket_service.event_stream.subscribe(
+        game_code,
+        lambda: game_service.get_snapshot(game_code),
+        last_event_id=resume_id,
+    )
+    return StreamingResponse(
+        stream,
+        media_type="text/event-stream",
+        headers={
+            "Cache-Control": "no-cache",
+            "X-Accel-Buffering": "no",
+        },
+    )
+
+@router.get("/games/{game_code}/timeline")
+async def get_game_timeline(game_code: str, since: int = Query(0, ge=0)):
+    """게임의 선택/확정/결과/진영 선택 기록을 NDJSON으로 스트리밍합니다."""
+    game_settings = game_service.game_settings.get(game_code)
+    game_status = game_service.game_status.get(game_code)
+    if not game_settings or not game_status:
+        raise HTTPException(status_code=404, detail="게임을 찾을 수 없습니다.")
+
+    # 첫 줄은 타임라인을 해석하는 데 필요한 게임 정보
+    header = {
+        "type": "header",
+        "gameCode": game_code,
+        "version": game_settings.version,
+        "draftType": game_settings.draftType,
+        "matchFormat": game_settings.matchFormat,
+        "team1Name": game_status.team1Name,
+        "team2Name": game_status.team2Name,
+        "entries": game_service.timeline.count(game_code),
+    }
+    return StreamingResponse(
+        game_service.timeline.stream(game_code, header, since=since),
+        media_type="application/x-ndjson",
+    )
+
+@router.get("/games/{game_code}/recommendations")
+async def get_recommendations(game_code: str, top: int = Query(10, ge=1, le=50)):
+    """현재 페이즈에서 행동할 진영의 밴/픽 추천을 반환합니다."""
+    game_settings = game_service.game_settings.get(game_code)
+    if game_code not in game_service.game_status or not game_settings:
+        raise HTTPException(status_code=404, detail="게임을 찾을 수 없습니다.")
+    # 후보는 게임 버전의 전체 챔피언 (목록을 불러오지 못하면 통계에 등장한 챔피언)
+    pool = await recommendation_service.champion_pool(game_settings.version)
+    try:
+        return recommendation_service.recommend(game_code, top, pool)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
 @router.get("/games/{game_code}/clients", response_model=GameClients)
 async def get_game_clients(game_code: str):
     try:
@@ -73,31 +179,17 @@ async def get_game_clients(game_code: str):
         if game_code not in game_service.games:
             raise ValueError(f"Game not found: {game_code}")
             
-        # socket_service에서 해당 게임에 연결된 클라이언트 조회
-        from main import socket_service
-        game_clients = [
-            client for client in socket_service.clients.values()
-            if client.gameCode == game_code
-        ]
-        
-        # Determine host (client with earliest joinedAt)
-        host_client_id = None
-        if game_clients:
-            earliest_join_time = min(client.joinedAt for client in game_clients)
-            host_client_id = next(
-                client.socketId for client in game_clients 
-                if client.joinedAt == earliest_join_time
-            )
-        
-        # Create client list with host flag
+        # 관전자를 포함한 참가자를 입장 순서대로 조회 (호스트는 소켓 서비스에 저장된 값 사용)
+        socket_service = game_service.socket_service
+        members = socket_service.get_members(game_code) if socket_service else []
         clients = [
             ClientInfo(
-                nickname=client.nickname, 
-                position=client.position, 
-                isReady=client.isReady,
-                isHost=(client.socketId == host_client_id)
+                nickname=client.get('nickname'),
+                position=client.get('position'),
+                isReady=client.get('isReady', False),
+                isHost=client.get('isHost', False)
             )
-            for client in game_clients
+            for client in members
         ]
         
         return GameClients(clients=clients)
@@ -0,0 +1,78 @@
+import asyncio
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
+from typing import Optional, Literal
+from routes.admin_routes import verify_admin_token
+from routes.game_routes import game_service
+from services import report_jobs
+from services.report_pool import ReportPool, ReportQueueFull, snapshot_results
+
+router = APIRouter(prefix="/reports", dependencies=[Depends(verify_admin_token)])
+report_pool = ReportPool()
+
+
+async def run_report(job, version, draftType, matchFormat, updatedSince, updatedBefore, *args):
+    """필터에 맞는 게임의 스냅샷을 만들어 작업 프로세스에서 리포트를 계산합니다.
+
+    스냅샷은 이벤트 루프에서 만들므로, 작업 자리를 먼저 확보해 거절될 요청은 스냅샷을 만들지 않습니다.
+    """
+    try:
+        with report_pool.reserve():
+            codes, _ = game_service.directory.query(
+                draft_type=draftType,
+                match_format=matchFormat,
+                updated_since=updatedSince,
+                updated_before=updatedBefore,
+                limit=None,
+            )
+            # 보관 기간이 지나 메모리에서 제거된 매치는 보관소에서 읽음 (세트 결과 확정 시각으로 기간 필터)
+            archive_filters = {
+                "draft_type": draftType,
+                "match_format": matchFormat,
+                "finished_since": updatedSince,
+                "finished_before": updatedBefore,
+            }
+            snapshot = await snapshot_results(game_service, codes, version, archive_filters=archive_filters)
+            return await report_pool.execute(job, snapshot, *args)
+    except ReportQueueFull as e:
+        raise HTTPException(status_code=503, detail=str(e), headers={"Retry-After": "1"})
+    except asyncio.TimeoutError:
+        raise HTTPException(status_code=504, detail="리포트 작업 시간이 초과되었습니다.")
+    except Exception as e:
+        print(f"Error in report job {job.__name__}: {e}")
+        raise HTTPException(status_code=500, detail="리포트를 만들지 못했습니다.")
+
+
+@router.get("/sets.csv")
+async def export_sets(
+    version: Optional[str] = None,
+    draftType: Optional[Literal["tournament", "hardFearless", "softFearless"]] = None,
+    matchFormat: Optional[Literal["bo1", "bo3", "bo5"]] = None,
+    updatedSince: Optional[int] = None,
+    updatedBefore: Optional[int] = None,
+):
+    """확정된 세트 결과를 세트마다 한 줄인 CSV로 내보냅니다."""
+    body = await run_report(report_jobs.sets_csv, version, draftType, matchFormat, updatedSince, updatedBefore)
+    return Response(
+        content=body,
+        media_type="text/csv",
+        headers={"Content-Disposition": 'attachment; filename="sets.csv"'},
+    )
+
+
+@router.get("/summary")
+async def report_summary(
+    version: Optional[str] = None,
+    draftType: Optional[Literal["tournament", "hardFearless", "softFearless"]] = None,
+    matchFormat: Optional[Literal["bo1", "bo3", "bo5"]] = None,
+    updatedSince: Optional[int] = None,
+    updatedBefore: Optional[int] = None,
+    top: int = Query(10, ge=1, le=100),
+):
+    """세트 수, 진영 승률, 많이 픽/밴된 챔피언을 요약합니다."""
+    return await run_report(report_jobs.summary, version, draftType, matchFormat, updatedSince, updatedBefore, top)
+
+
+@router.get("/metrics")
+async def report_metrics():
+    """리포트 작업 풀의 대기/완료/시간 초과/거절 건수를 반환합니다."""
+    return report_pool.metrics()
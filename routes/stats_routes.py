@@ -0,0 +1,36 @@
+from fastapi import APIRouter, HTTPException, Query
+from typing import Optional, Literal
+from services.stats_service import StatsService
+
+router = APIRouter(prefix="/stats")
+stats_service = StatsService()
+
+DraftTypeFilter = Optional[Literal["tournament", "hardFearless", "softFearless"]]
+
+
+@router.get("/champions")
+async def get_champion_stats(
+    version: Optional[str] = None,
+    draftType: DraftTypeFilter = None,
+    sort: Literal["presence", "pickRate", "banRate", "winRate", "picks", "bans", "wins"] = "presence",
+    limit: Optional[int] = Query(None, ge=1, le=500),
+):
+    """챔피언별 픽/밴/승률 통계를 반환합니다."""
+    try:
+        return stats_service.champion_table(version, draftType, sort=sort, limit=limit)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+
+@router.get("/champions/{champion}")
+async def get_champion_detail(
+    champion: str,
+    version: Optional[str] = None,
+    draftType: DraftTypeFilter = None,
+    top: int = Query(10, ge=1, le=100),
+):
+    """챔피언의 드래프트 슬롯 분포, 시너지, 상대 전적을 반환합니다."""
+    try:
+        return stats_service.champion_detail(champion, version, draftType, top=top)
+    except ValueError as e:
+        raise HTTPException(status_code=404, detail=str(e))
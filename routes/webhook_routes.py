@@ -0,0 +1,49 @@
+from fastapi import APIRouter, Depends, HTTPException
+from pydantic import BaseModel
+from typing import List, Optional, Literal
+from routes.admin_routes import verify_admin_token
+from routes.game_routes import game_service
+from services.webhook_service import WebhookDispatcher
+
+router = APIRouter(prefix="/webhooks", dependencies=[Depends(verify_admin_token)])
+webhook_dispatcher = WebhookDispatcher()
+
+
+class WebhookRequest(BaseModel):
+    url: str
+    gameCode: Optional[str] = None  # 없으면 모든 게임의 결과를 전송
+    events: Optional[List[Literal["side_choice_phase", "match_finished"]]] = None
+    secret: Optional[str] = None  # 지정하면 X-Webhook-Signature(HMAC-SHA256) 헤더로 서명
+
+
+@router.post("")
+async def create_webhook(request: WebhookRequest):
+    """게임 결과 웹훅을 등록합니다."""
+    if request.gameCode and request.gameCode not in game_service.games:
+        raise HTTPException(status_code=404, detail="게임을 찾을 수 없습니다.")
+    try:
+        return webhook_dispatcher.subscribe(request.url, request.gameCode, request.events, request.secret)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+
+@router.get("")
+async def list_webhooks(gameCode: Optional[str] = None):
+    """등록된 웹훅 목록을 반환합니다."""
+    return {"webhooks": webhook_dispatcher.list_subscriptions(gameCode)}
+
+
+@router.get("/metrics")
+async def webhook_metrics():
+    """전송 대상별 대기/전송/실패 건수를 반환합니다."""
+    return webhook_dispatcher.metrics()
+
+
+@router.delete("/{webhook_id}")
+async def delete_webhook(webhook_id: str):
+    """웹훅 등록을 해제합니다."""
+    try:
+        webhook_dispatcher.unsubscribe(webhook_id)
+        return {"status": "success"}
+    except ValueError as e:
+        raise HTTPException(status_code=404, detail=str(e))
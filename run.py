@@ -1,10 +1,62 @@
 import uvicorn
 import argparse
+import asyncio
+import importlib.util
+import os
+from services.transport_profiles import PROFILES, get_transport_profile
+
+
+class DrainingServer(uvicorn.Server):
+    """첫 종료 신호(SIGTERM/SIGINT)에서 게임 상태를 인계 파일로 저장한 뒤 종료를 시작하는 서버
+
+    두 번째 신호를 받으면 신호 종류와 관계없이 연결 정리를 기다리지 않고 바로 강제 종료합니다.
+    """
+
+    def __init__(self, config: uvicorn.Config, reconnect_after_ms: int):
+        super().__init__(config)
+        self.reconnect_after_ms = reconnect_after_ms
+        self.draining = False
+
+    def handle_exit(self, sig, frame):
+        if self.draining:
+            # uvicorn은 두 번째 SIGINT에서만 강제 종료하므로 SIGTERM도 직접 강제 종료로 처리
+            self.should_exit = True
+            self.force_exit = True
+            return
+        self.draining = True
+        asyncio.get_event_loop().create_task(self._drain(sig, frame))
+
+    async def _drain(self, sig, frame):
+        try:
+            import main  # uvicorn이 불러온 앱 모듈
+            await main.prepare_shutdown(self.reconnect_after_ms)
+            # server_restarting 이벤트가 전송될 시간을 잠깐 둠
+            await asyncio.sleep(0.5)
+        except Exception as e:
+            print(f"Error preparing shutdown: {e}")
+        finally:
+            # super().handle_exit는 이미 종료 중인 SIGINT를 강제 종료로 처리하므로 정상 종료만 시작
+            self.should_exit = True
+
+
+def resolve_loop(loop: str) -> str:
+    if loop == 'uvloop' and importlib.util.find_spec('uvloop') is None:
+        print("uvloop is not installed, falling back to asyncio")
+        return 'asyncio'
+    return loop
+
+
+def resolve_http(http: str) -> str:
+    if http == 'httptools' and importlib.util.find_spec('httptools') is None:
+        print("httptools is not installed, falling back to h11")
+        return 'h11'
+    return http
+
 
 def main():
     parser = argparse.ArgumentParser(description='Run LoL Draft Server')
-    parser.add_argument('--host', default='127.0.0.1', help='Host IP address')
-    parser.add_argument('--port', type=int, default=8000, help='Port number')
+    parser.add_argument('--host', default=None, help='Host IP address (기본값: 127.0.0.1, 프로덕션 모드는 0.0.0.0)')
+    parser.add_argument('--port', type=int, default=int(os.getenv('PORT', '8000')), help='Port number')
     parser.add_argument('--reload', action='store_true', help='Enable auto-reload')
     parser.add_argument(
         '--log-level',
@@ -12,16 +64,78 @@ def main():
         choices=['debug', 'info', 'warning', 'error', 'critical'],
         help='Logging level'
     )
-    
+    parser.add_argument('--production', action='store_true',
+                        help='종료 신호 시 게임 상태를 인계 파일로 저장하고 클라이언트에게 재접속을 안내')
+    parser.add_argument('--workers', type=int, default=int(os.getenv('WEB_CONCURRENCY', '1')),
+                        help='Worker process count')
+    parser.add_argument('--loop', default='auto', choices=['auto', 'asyncio', 'uvloop'],
+                        help='Event loop implementation (auto: uvloop이 설치되어 있으면 사용)')
+    parser.add_argument('--http', default='auto', choices=['auto', 'h11', 'httptools'],
+                        help='HTTP parser (auto: httptools가 설치되어 있으면 사용)')
+    parser.add_argument('--drain-seconds', type=float, default=float(os.getenv('DRAIN_SECONDS', '5')),
+                        help='종료 시 연결이 정리되기를 기다리는 최대 시간 (초)')
+    parser.add_argument('--reconnect-after-ms', type=int, default=2000,
+                        help='server_restarting 이벤트로 안내할 재접속 대기 시간 (ms)')
+    parser.add_argument('--transport-profile', choices=list(PROFILES), default=None,
+                        help='Socket.IO 전송 프로필 (기본값: SOCKET_TRANSPORT_PROFILE 환경 변수 또는 default)')
+
     args = parser.parse_args()
-    
-    uvicorn.run(
+    host = args.host or ('0.0.0.0' if args.production else '127.0.0.1')
+    if args.transport_profile:
+        os.environ['SOCKET_TRANSPORT_PROFILE'] = args.transport_profile
+    profile = get_transport_profile()
+    print(f"Socket.IO transport profile: {profile.name} ({', '.join(profile.transports)})")
+
+    if not args.production:
+        uvicorn.run(
+            "main:app",
+            host=host,
+            port=args.port,
+            reload=args.reload,
+            log_level=args.log_level,
+            loop=resolve_loop(args.loop),
+            http=resolve_http(args.http),
+            **profile.uvicorn_options(),
+        )
+        return
+
+    if args.reload:
+        print("--reload is ignored in production mode")
+
+    if args.workers > 1:
+        # 게임 상태는 프로세스 메모리에 있으므로 워커끼리 공유되지 않음.
+        # 같은 게임의 클라이언트가 같은 워커로 가도록 sticky session이 필요하며 인계 파일은 사용하지 않음
+        print(f"Warning: running {args.workers} workers. Games are kept in per-process memory, "
+              "so sticky sessions are required and state handoff is disabled. "
+              "Only the first worker to open ARCHIVE_DIR uses the match archive.")
+        os.environ['STATE_HANDOFF'] = '0'
+        uvicorn.run(
+            "main:app",
+            host=host,
+            port=args.port,
+            workers=args.workers,
+            log_level=args.log_level,
+            loop=resolve_loop(args.loop),
+            http=resolve_http(args.http),
+            proxy_headers=True,
+            timeout_graceful_shutdown=args.drain_seconds,
+            **profile.uvicorn_options(),
+        )
+        return
+
+    config = uvicorn.Config(
         "main:app",
-        host=args.host,
+        host=host,
         port=args.port,
-        reload=args.reload,
-        log_level=args.log_level
+        log_level=args.log_level,
+        loop=resolve_loop(args.loop),
+        http=resolve_http(args.http),
+        proxy_headers=True,
+        timeout_graceful_shutdown=args.drain_seconds,
+        **profile.uvicorn_options(),
     )
+    DrainingServer(config, args.reconnect_after_ms).run()
+
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,154 @@
+import asyncio
+import os
+import random
+import time
+from typing import Dict, Optional
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+# 거절 코드
+SERVER_FULL = "SERVER_FULL"            # 전체 연결 수 한도
+GAME_FULL = "GAME_FULL"                # 게임당 연결 수 한도
+SPECTATORS_FULL = "SPECTATORS_FULL"    # 게임당 관전자 수 한도
+SERVER_BUSY = "SERVER_BUSY"            # 이벤트 루프 지연/메모리 과부하로 관전자와 새 게임을 받지 않음
+
+MESSAGES = {
+    SERVER_FULL: "서버 접속자가 너무 많습니다. 잠시 후 다시 시도해주세요.",
+    GAME_FULL: "게임 참가자가 가득 찼습니다.",
+    SPECTATORS_FULL: "관전자 수가 가득 찼습니다. 잠시 후 다시 시도해주세요.",
+    SERVER_BUSY: "서버가 혼잡합니다. 잠시 후 다시 시도해주세요.",
+}
+
+
+class AdmissionError(Exception):
+    def __init__(self, code: str, retry_after_ms: int):
+        super().__init__(MESSAGES[code])
+        self.code = code
+        self.retry_after_ms = retry_after_ms
+
+    def as_detail(self) -> dict:
+        return {"code": self.code, "message": str(self), "retryAfterMs": self.retry_after_ms}
+
+    def as_ack(self) -> dict:
+        """소켓 이벤트 응답 형식"""
+        return {"status": "error", **self.as_detail()}
+
+
+def _env_int(name: str, default: str = "0") -> int:
+    return int(os.getenv(name, default))
+
+
+def _rss_mb() -> Optional[float]:
+    """현재 프로세스의 메모리 사용량(MB)"""
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") / (1024 * 1024)
+    except (OSError, ValueError, AttributeError):
+        pass
+    if resource is not None:
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024  # 최대 사용량(KB)
+    return None
+
+
+class AdmissionController:
+    """연결/참가 수 한도와 과부하 시 부하 차단
+
+    관전자가 몰려 이벤트 루프가 ping_timeout을 넘길 만큼 느려지면 플레이어까지 끊기므로,
+    이벤트 루프 지연이나 메모리 사용량이 기준을 넘으면 새 관전자와 새 게임 생성부터 거절합니다.
+    자리가 있는 플레이어(재시작 전 자리, 이미 참가한 게임)는 항상 받습니다.
+    한도가 0이면 제한하지 않습니다.
+    """
+
+    def __init__(self):
+        self.max_connections = _env_int("MAX_CONNECTIONS")
+        self.max_connections_per_game = _env_int("MAX_CONNECTIONS_PER_GAME")
+        self.max_spectators_per_game = _env_int("MAX_SPECTATORS_PER_GAME")
+        self.shed_loop_lag_ms = float(os.getenv("SHED_LOOP_LAG_MS", "250"))
+        self.shed_memory_mb = float(os.getenv("SHED_MEMORY_MB", "0"))
+        self.retry_after_ms = _env_int("ADMISSION_RETRY_AFTER_MS", "5000")
+        self.sample_seconds = float(os.getenv("LOOP_LAG_SAMPLE_MS", "500")) / 1000
+        self.loop_lag_ms = 0.0
+        self.memory_mb: Optional[float] = None
+        self.rejected: Dict[str, int] = {}
+        self.task: Optional[asyncio.Task] = None
+
+    def start(self):
+        if self.task is None:
+            self.task = asyncio.create_task(self._monitor())
+
+    async def stop(self):
+        if self.task:
+            self.task.cancel()
+            try:
+                await self.task
+            except asyncio.CancelledError:
+                pass
+            self.task = None
+
+    async def _monitor(self):
+        """정해진 간격으로 깨어나 예정보다 늦어진 시간(이벤트 루프 지연)과 메모리를 측정"""
+        while True:
+            started = time.perf_counter()
+            await asyncio.sleep(self.sample_seconds)
+            lag_ms = max(0.0, (time.perf_counter() - started - self.sample_seconds) * 1000)
+            # 지연이 늘면 바로 반영하고, 줄어들 때는 천천히 낮춰 차단이 반복해서 켜졌다 꺼지지 않도록 함
+            if lag_ms >= self.loop_lag_ms:
+                self.loop_lag_ms = lag_ms
+            else:
+                self.loop_lag_ms = self.loop_lag_ms * 0.7 + lag_ms * 0.3
+            self.memory_mb = _rss_mb()
+
+    def overload(self) -> Optional[str]:
+        """과부하 원인 ('loop_lag', 'memory') 또는 None"""
+        if self.shed_loop_lag_ms and self.loop_lag_ms >= self.shed_loop_lag_ms:
+            return "loop_lag"
+        if self.shed_memory_mb and self.memory_mb is not None and self.memory_mb >= self.shed_memory_mb:
+            return "memory"
+        return None
+
+    def _reject(self, code: str):
+        self.rejected[code] = self.rejected.get(code, 0) + 1
+        # 거절된 클라이언트들이 동시에 재시도하지 않도록 지터 추가
+        retry_after_ms = int(self.retry_after_ms * random.uniform(1.0, 1.5))
+        raise AdmissionError(code, retry_after_ms)
+
+    def check_connection(self, connections: int, seated: bool = False):
+        if seated:
+            return
+        if self.max_connections and connections >= self.max_connections:
+            self._reject(SERVER_FULL)
+
+    def check_join(self, members: int, spectators: int, spectator: bool, seated: bool = False):
+        """게임 참가 허용 여부 확인. members와 spectators는 참가 전 인원"""
+        if seated:
+            return
+        if self.max_connections_per_game and members >= self.max_connections_per_game:
+            self._reject(GAME_FULL)
+        if not spectator:
+            return
+        if self.max_spectators_per_game and spectators >= self.max_spectators_per_game:
+            self._reject(SPECTATORS_FULL)
+        if self.overload():
+            self._reject(SERVER_BUSY)
+
+    def check_new_game(self):
+        if self.overload():
+            self._reject(SERVER_BUSY)
+
+    def metrics(self) -> dict:
+        return {
+            "loopLagMs": round(self.loop_lag_ms, 2),
+            "memoryMb": round(self.memory_mb, 1) if self.memory_mb is not None else None,
+            "shedding": self.overload(),
+            "limits": {
+                "maxConnections": self.max_connections,
+                "maxConnectionsPerGame": self.max_connections_per_game,
+                "maxSpectatorsPerGame": self.max_spectators_per_game,
+                "shedLoopLagMs": self.shed_loop_lag_ms,
+                "shedMemoryMb": self.shed_memory_mb,
+            },
+            "rejected": dict(self.rejected),
+        }
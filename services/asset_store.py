@@ -0,0 +1,138 @@
+import base64
+import binascii
+import hashlib
+import os
+import tempfile
+from typing import Dict, Optional, Tuple
+
+# 허용하는 이미지 형식 (매직 바이트, Content-Type, 확장자)
+IMAGE_SIGNATURES = (
+    (b"\x89PNG\r\n\x1a\n", "image/png", "png"),
+    (b"\xff\xd8\xff", "image/jpeg", "jpg"),
+    (b"GIF87a", "image/gif", "gif"),
+    (b"GIF89a", "image/gif", "gif"),
+)
+EXTENSION_TYPES = {"png": "image/png", "jpg": "image/jpeg", "gif": "image/gif", "webp": "image/webp"}
+
+
+class AssetQuotaExceeded(ValueError):
+    """저장소 전체 파일 수나 용량 한도에 도달함"""
+
+
+def detect_image_type(data: bytes) -> Optional[Tuple[str, str]]:
+    """파일 앞부분으로 이미지 형식 판별"""
+    for signature, content_type, extension in IMAGE_SIGNATURES:
+        if data.startswith(signature):
+            return content_type, extension
+    if data[:4] == b"RIFF" and data[8:12] == b"WEBP":
+        return "image/webp", "webp"
+    return None
+
+
+class AssetStore:
+    """내용 해시(SHA-256)로 주소가 정해지는 로컬 디스크 이미지 저장소
+
+    같은 이미지는 한 번만 저장되며, 저장된 파일은 내용이 바뀌지 않으므로
+    영구 캐시 헤더로 제공할 수 있습니다.
+    """
+
+    URL_PREFIX = "/assets/"
+
+    def __init__(self, root: Optional[str] = None, max_bytes: Optional[int] = None,
+                 max_total_bytes: Optional[int] = None, max_count: Optional[int] = None):
+        self.root = root or os.getenv("ASSET_STORE_DIR", os.path.join("data", "assets"))
+        self.max_bytes = max_bytes or int(os.getenv("ASSET_MAX_BYTES", str(5 * 1024 * 1024)))
+        # 업로드는 인증하지 않으므로 저장소 전체 용량과 파일 수를 제한
+        self.max_total_bytes = max_total_bytes or int(os.getenv("ASSET_MAX_TOTAL_BYTES", str(1024 * 1024 * 1024)))
+        self.max_count = max_count or int(os.getenv("ASSET_MAX_COUNT", "10000"))
+        # 응답에 넣는 이미지 주소의 기준 (다른 도메인의 프런트엔드가 그대로 쓸 수 있도록 절대 주소)
+        self.public_base_url = os.getenv("PUBLIC_BASE_URL", "").rstrip("/")
+        self._index: Dict[str, Tuple[str, str]] = {}  # assetId -> (경로, Content-Type)
+        self._usage: Optional[Tuple[int, int]] = None  # (파일 수, 전체 바이트), 처음 저장할 때 디스크에서 계산
+
+    def _path(self, asset_id: str, extension: str) -> str:
+        return os.path.join(self.root, asset_id[:2], f"{asset_id}.{extension}")
+
+    def _disk_usage(self) -> Tuple[int, int]:
+        if self._usage is None:
+            count = size = 0
+            for directory, _, files in os.walk(self.root):
+                for name in files:
+                    if name.rsplit(".", 1)[-1] in EXTENSION_TYPES:
+                        count += 1
+                        size += os.path.getsize(os.path.join(directory, name))
+            self._usage = count, size
+        return self._usage
+
+    def put(self, data: bytes, base_url: Optional[str] = None) -> dict:
+        """이미지를 저장하고 자산 정보를 반환합니다. url은 base_url(PUBLIC_BASE_URL 우선) 기준 절대 주소"""
+        if not data:
+            raise ValueError("이미지 데이터가 비어 있습니다.")
+        if len(data) > self.max_bytes:
+            raise ValueError(f"이미지 크기는 {self.max_bytes} 바이트를 넘을 수 없습니다.")
+        detected = detect_image_type(data)
+        if not detected:
+            raise ValueError("지원하지 않는 이미지 형식입니다. (png, jpeg, gif, webp)")
+        content_type, extension = detected
+
+        asset_id = hashlib.sha256(data).hexdigest()
+        path = self._path(asset_id, extension)
+        if not os.path.exists(path):
+            count, size = self._disk_usage()
+            if count >= self.max_count or size + len(data) > self.max_total_bytes:
+                raise AssetQuotaExceeded("이미지 저장 공간이 가득 찼습니다.")
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            # 임시 파일에 쓴 뒤 교체해 동시 업로드에도 완전한 파일만 노출
+            fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path))
+            try:
+                with os.fdopen(fd, "wb") as f:
+                    f.write(data)
+                os.replace(tmp_path, path)
+            except Exception:
+                if os.path.exists(tmp_path):
+                    os.remove(tmp_path)
+                raise
+            self._usage = (count + 1, size + len(data))
+        self._index[asset_id] = (path, content_type)
+        return {
+            "assetId": asset_id,
+            "url": self.url_for(asset_id, base_url),
+            "contentType": content_type,
+            "size": len(data),
+        }
+
+    def put_data_url(self, data_url: str, base_url: Optional[str] = None) -> dict:
+        """data URL(base64) 형식의 이미지를 저장"""
+        header, _, payload = data_url.partition(",")
+        if not header.startswith("data:") or ";base64" not in header:
+            raise ValueError("base64 data URL 형식이 아닙니다.")
+        try:
+            data = base64.b64decode(payload, validate=True)
+        except (binascii.Error, ValueError):
+            raise ValueError("이미지 데이터를 디코딩할 수 없습니다.")
+        return self.put(data, base_url)
+
+    def url_for(self, asset_id: str, base_url: Optional[str] = None) -> str:
+        """이미지 주소. PUBLIC_BASE_URL이 없으면 요청 주소(base_url)를 기준으로 하고, 둘 다 없으면 상대 경로"""
+        base = self.public_base_url or (base_url or "").rstrip("/")
+        return f"{base}{self.URL_PREFIX}{asset_id}"
+
+    def absolute_url(self, url: str, base_url: Optional[str] = None) -> str:
+        """이전 형식의 상대 참조(/assets/{id})를 절대 주소로 바꿈 (다른 주소는 그대로)"""
+        if url.startswith(self.URL_PREFIX):
+            return self.url_for(url[len(self.URL_PREFIX):], base_url)
+        return url
+
+    def lookup(self, asset_id: str) -> Optional[Tuple[str, str]]:
+        """자산 ID로 (파일 경로, Content-Type) 조회"""
+        if len(asset_id) != 64 or not all(c in "0123456789abcdef" for c in asset_id):
+            return None
+        found = self._index.get(asset_id)
+        if found:
+            return found
+        for extension, content_type in EXTENSION_TYPES.items():
+            path = self._path(asset_id, extension)
+            if os.path.exists(path):
+                self._index[asset_id] = (path, content_type)
+                return path, content_type
+        return None
@@ -0,0 +1,257 @@
+import asyncio
+import json
+import os
+import re
+from bisect import bisect_left
+from collections import OrderedDict
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+import aiohttp
+
+DDRAGON_URL = "https://ddragon.leagueoflegends.com/cdn"
+VERSION_PATTERN = r"[0-9]+(\.[0-9]+)*"
+
+CHOSUNG = "ㄱㄲㄴㄷㄸㄹㅁㅂㅃㅅㅆㅇㅈㅉㅊㅋㅌㅍㅎ"
+JONGSEONG = ["", "ㄱ", "ㄲ", "ㄳ", "ㄴ", "ㄵ", "ㄶ", "ㄷ", "ㄹ", "ㄺ", "ㄻ", "ㄼ", "ㄽ", "ㄾ", "ㄿ", "ㅀ",
+             "ㅁ", "ㅂ", "ㅄ", "ㅅ", "ㅆ", "ㅇ", "ㅈ", "ㅊ", "ㅋ", "ㅌ", "ㅍ", "ㅎ"]
+HANGUL_BASE = 0xAC00
+HANGUL_LAST = 0xD7A3
+
+# 자주 쓰는 줄임말 (이름의 접두어로 이미 찾을 수 있는 것은 제외)
+ALIASES: Dict[str, List[str]] = {
+    "AurelionSol": ["asol", "아솔"],
+    "Blitzcrank": ["블츠"],
+    "Caitlyn": ["케틀"],
+    "Draven": ["드븐"],
+    "Gangplank": ["gp"],
+    "JarvanIV": ["j4", "자르반"],
+    "KSante": ["크산"],
+    "Leblanc": ["lb"],
+    "MasterYi": ["마이"],
+    "MissFortune": ["mf", "미포"],
+    "MonkeyKing": ["monkeyking", "오공"],
+    "TahmKench": ["tk"],
+    "TwistedFate": ["tf", "트페"],
+    "Warwick": ["ww"],
+}
+
+# 매치 순위: 정확히 일치 < 이름 접두어 < 단어/줄임말 접두어 < 초성
+RANK_EXACT, RANK_NAME, RANK_WORD, RANK_CHOSUNG = range(4)
+
+_STRIP = re.compile(r"[\s'.&:\-]")
+
+
+def normalize(text: str) -> str:
+    """공백과 기호를 제거하고 소문자로 변환"""
+    return _STRIP.sub("", text).lower()
+
+
+def is_jamo(ch: str) -> bool:
+    return "ㄱ" <= ch <= "ㅎ"
+
+
+def is_syllable(ch: str) -> bool:
+    return HANGUL_BASE <= ord(ch) <= HANGUL_LAST
+
+
+def to_chosung(text: str) -> str:
+    """한글 음절을 초성으로 변환 (그 외 문자는 그대로)"""
+    return "".join(
+        CHOSUNG[(ord(ch) - HANGUL_BASE) // 588] if is_syllable(ch) else ch
+        for ch in text
+    )
+
+
+def split_last_jongseong(text: str) -> Optional[str]:
+    """입력 중인 마지막 글자의 받침을 다음 글자의 초성으로 분리 ("갈" → "가ㄹ")"""
+    if not text or not is_syllable(text[-1]):
+        return None
+    code = ord(text[-1]) - HANGUL_BASE
+    jong = JONGSEONG[code % 28]
+    if not jong or jong not in CHOSUNG:
+        return None
+    return text[:-1] + chr(ord(text[-1]) - code % 28) + jong
+
+
+class ChampionIndex:
+    """한 패치 버전의 챔피언 자동완성 인덱스
+
+    모든 검색 키를 정렬된 목록으로 만들어 두고 이진 탐색으로 접두어 범위를 찾습니다.
+    같은 검색어의 결과(순위가 매겨진 챔피언 번호)는 LRU 캐시에 보관합니다.
+    """
+
+    def __init__(self, version: str, champions: List[dict], cache_size: int = 4096):
+        self.version = version
+        self.champions = champions  # [{id, name, nameKo, image}]
+        self.positions = {champion["id"]: i for i, champion in enumerate(champions)}
+
+        keys: List[Tuple[str, int, int]] = []
+        chosung_keys: List[Tuple[str, int, str]] = []
+        for i, champion in enumerate(champions):
+            for name in (champion["name"], champion["nameKo"]):
+                keys.append((normalize(name), i, RANK_NAME))
+                # 여러 단어로 된 이름은 두 번째 단어부터도 검색 ("신" → 리 신)
+                words = name.split()
+                for start in range(1, len(words)):
+                    keys.append((normalize("".join(words[start:])), i, RANK_WORD))
+            keys.append((normalize(champion["id"]), i, RANK_NAME))
+            for alias in ALIASES.get(champion["id"], []):
+                keys.append((normalize(alias), i, RANK_WORD))
+            ko_key = normalize(champion["nameKo"])
+            chosung_keys.append((to_chosung(ko_key), i, ko_key))
+
+        keys.sort()
+        chosung_keys.sort()
+        self.keys = keys
+        self.key_strings = [key for key, _, _ in keys]
+        self.chosung_keys = chosung_keys
+        self.chosung_strings = [key for key, _, _ in chosung_keys]
+        self.cache: "OrderedDict[str, Tuple[int, ...]]" = OrderedDict()
+        self.cache_size = cache_size
+
+    @staticmethod
+    def _prefix_range(strings: List[str], prefix: str) -> Tuple[int, int]:
+        return bisect_left(strings, prefix), bisect_left(strings, prefix + "\uffff")
+
+    def _match_keys(self, query: str, best: Dict[int, Tuple[int, int]]):
+        lo, hi = self._prefix_range(self.key_strings, query)
+        last = query[-1]
+        if is_syllable(last) and (ord(last) - HANGUL_BASE) % 28 == 0:
+            # 받침 없는 마지막 글자는 받침이 붙을 수 있음 ("가" → 갈리오)
+            hi = bisect_left(self.key_strings, query[:-1] + chr(ord(last) + 27) + "\uffff")
+        for key, i, rank in self.keys[lo:hi]:
+            rank = RANK_EXACT if key == query else rank
+            if i not in best or (rank, len(key)) < best[i]:
+                best[i] = (rank, len(key))
+
+    def _match_chosung(self, query: str, best: Dict[int, Tuple[int, int]]):
+        """초성이 섞인 검색어 ("ㄱㄹ", "가ㄹ") 매칭. 완성된 음절은 같은 자리의 음절과 일치해야 함"""
+        lo, hi = self._prefix_range(self.chosung_strings, to_chosung(query))
+        for key, i, ko_key in self.chosung_keys[lo:hi]:
+            if all(is_jamo(ch) or ko_key[pos] == ch for pos, ch in enumerate(query)):
+                rank = (RANK_CHOSUNG, len(key))
+                if i not in best or rank < best[i]:
+                    best[i] = rank
+
+    def search(self, query: str) -> Tuple[int, ...]:
+        """검색어에 맞는 챔피언 번호를 순위대로 반환"""
+        query = normalize(query)
+        cached = self.cache.get(query)
+        if cached is not None:
+            self.cache.move_to_end(query)
+            return cached
+
+        best: Dict[int, Tuple[int, int]] = {}
+        if query:
+            self._match_keys(query, best)
+            if any(is_jamo(ch) for ch in query):
+                self._match_chosung(query, best)
+            split = split_last_jongseong(query)
+            if split:
+                self._match_chosung(split, best)
+            ranked = tuple(sorted(best, key=lambda i: (best[i], self.champions[i]["nameKo"])))
+        else:
+            ranked = tuple(sorted(range(len(self.champions)), key=lambda i: self.champions[i]["nameKo"]))
+
+        self.cache[query] = ranked
+        if len(self.cache) > self.cache_size:
+            self.cache.popitem(last=False)
+        return ranked
+
+    def lookup(self, query: str, exclude: Iterable[str] = (), limit: int = 10) -> List[dict]:
+        """검색 결과에서 제외할 챔피언을 빼고 limit개까지 반환"""
+        excluded: Set[int] = {self.positions[c] for c in exclude if c in self.positions}
+        results = []
+        for i in self.search(query):
+            if i in excluded:
+                continue
+            results.append(self.champions[i])
+            if len(results) >= limit:
+                break
+        return results
+
+
+def parse_catalog(version: str, english: dict, korean: dict) -> List[dict]:
+    """Data Dragon champion.json(en_US, ko_KR)을 챔피언 목록으로 변환"""
+    champions = []
+    for champion_id, data in english["data"].items():
+        ko = korean["data"].get(champion_id, {})
+        champions.append({
+            "id": champion_id,
+            "name": data["name"],
+            "nameKo": ko.get("name", data["name"]),
+            "image": f"{DDRAGON_URL}/{version}/img/champion/{data['image']['full']}",
+        })
+    return champions
+
+
+class ChampionCatalog:
+    """패치 버전별 챔피언 목록과 검색 인덱스
+
+    목록은 Data Dragon에서 버전마다 한 번만 받아 디스크에 저장하고, 인덱스는 메모리에 보관합니다.
+    """
+
+    def __init__(self, cache_dir: Optional[str] = None, timeout_seconds: float = 10.0):
+        self.cache_dir = cache_dir or os.getenv("CHAMPION_CATALOG_DIR", "data/champions")
+        self.timeout_seconds = timeout_seconds
+        self.indexes: Dict[str, ChampionIndex] = {}
+        self.loading: Dict[str, asyncio.Task] = {}
+
+    async def get_index(self, version: str) -> ChampionIndex:
+        index = self.indexes.get(version)
+        if index is not None:
+            return index
+        # 같은 버전을 동시에 요청해도 한 번만 불러옴
+        task = self.loading.get(version)
+        if task is None:
+            task = self.loading[version] = asyncio.create_task(self._load(version))
+        try:
+            index = await asyncio.shield(task)
+        finally:
+            if task.done():
+                self.loading.pop(version, None)
+        self.indexes[version] = index
+        return index
+
+    def cached_index(self, version: str) -> Optional[ChampionIndex]:
+        """이미 불러왔거나 디스크에 저장된 버전의 인덱스 (없으면 None, 네트워크는 사용하지 않음)"""
+        index = self.indexes.get(version)
+        if index is None and re.fullmatch(VERSION_PATTERN, version):
+            path = os.path.join(self.cache_dir, f"{version}.json")
+            if os.path.exists(path):
+                with open(path, encoding="utf-8") as f:
+                    index = self.indexes[version] = ChampionIndex(version, json.load(f))
+        return index
+
+    async def _load(self, version: str) -> ChampionIndex:
+        if not re.fullmatch(VERSION_PATTERN, version):
+            raise ValueError(f"잘못된 패치 버전입니다: {version}")
+
+        path = os.path.join(self.cache_dir, f"{version}.json")
+        if os.path.exists(path):
+            with open(path, encoding="utf-8") as f:
+                return ChampionIndex(version, json.load(f))
+
+        timeout = aiohttp.ClientTimeout(total=self.timeout_seconds)
+        async with aiohttp.ClientSession(timeout=timeout) as session:
+            english, korean = await asyncio.gather(
+                self._fetch(session, version, "en_US"),
+                self._fetch(session, version, "ko_KR"),
+            )
+        champions = parse_catalog(version, english, korean)
+
+        os.makedirs(self.cache_dir, exist_ok=True)
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(champions, f, ensure_ascii=False)
+        os.replace(tmp_path, path)
+        print(f"Champion catalog loaded: {version} ({len(champions)} champions)")
+        return ChampionIndex(version, champions)
+
+    async def _fetch(self, session: aiohttp.ClientSession, version: str, locale: str) -> dict:
+        url = f"{DDRAGON_URL}/{version}/data/{locale}/champion.json"
+        async with session.get(url) as response:
+            if response.status == 403 or response.status == 404:
+                raise ValueError(f"Data Dragon에 없는 패치 버전입니다: {version}")
+            response.raise_for_status()
+            return await response.json(content_type=None)
@@ -0,0 +1,32 @@
+from collections import OrderedDict
+from typing import Dict, Optional
+
+
+class CommandWindow:
+    """게임별로 최근 처리한 명령 ID와 응답(ack)을 보관하는 중복 제거 창
+
+    클라이언트가 응답 지연으로 같은 명령을 다시 보내면 저장된 응답을 그대로 반환해
+    페이즈가 두 번 진행되거나 선택이 덮어써지지 않도록 합니다.
+    """
+
+    def __init__(self, size: int = 64):
+        self.size = size
+        self.acks: Dict[str, "OrderedDict[str, dict]"] = {}
+
+    def get(self, game_code: str, command_id: Optional[str]) -> Optional[dict]:
+        if not command_id:
+            return None
+        window = self.acks.get(game_code)
+        return window.get(command_id) if window else None
+
+    def remember(self, game_code: str, command_id: Optional[str], ack: dict):
+        if not command_id:
+            return
+        window = self.acks.setdefault(game_code, OrderedDict())
+        window[command_id] = ack
+        window.move_to_end(command_id)
+        while len(window) > self.size:
+            window.popitem(last=False)
+
+    def drop(self, game_code: str):
+        self.acks.pop(game_code, None)
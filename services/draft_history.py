@@ -0,0 +1,153 @@
+import os
+from typing import Dict, List, Optional, Tuple
+
+HISTORY_SIZE = int(os.getenv("DRAFT_HISTORY_SIZE", "64"))  # 게임별로 보관할 페이즈 버전 수
+
+
+def _freeze_picks(picks: dict) -> tuple:
+    return tuple((key, tuple(champions)) for key, champions in picks.items())
+
+
+class DraftVersion:
+    """한 페이즈가 시작될 때의 드래프트 상태 (변경하지 않음)
+
+    phaseData는 챔피언 문자열을 복사하지 않고 참조만 담은 튜플로, 이전 세트 픽/세트 결과/진영 선택 기록은
+    직전 버전과 같으면 직전 버전의 튜플을 그대로 공유합니다. 되돌릴 때 새 리스트와 딕셔너리를 만들어
+    게임 상태에 넣으므로 이후 핸들러가 상태를 바꿔도 기록은 바뀌지 않습니다.
+    """
+    __slots__ = ('setNumber', 'phase', 'phaseData', 'team1Side', 'team2Side', 'previousSetPicks',
+                 'team1Score', 'team2Score', 'results', 'sideChoices', 'stateVersion', 'recordedAt')
+
+    def __init__(self, game_status, game_result, previous: Optional["DraftVersion"] = None):
+        self.setNumber = game_status.setNumber
+        self.phase = game_status.phase
+        self.team1Side = game_status.team1Side
+        self.team2Side = game_status.team2Side
+        self.stateVersion = game_status.stateVersion
+        self.recordedAt = game_status.lastUpdatedAt
+        self.phaseData = tuple(game_status.phaseData)
+        if game_result:
+            self.team1Score = game_result.team1Score
+            self.team2Score = game_result.team2Score
+            results = tuple(game_result.results)
+            side_choices = tuple(game_result.sideChoices)
+        else:
+            self.team1Score = self.team2Score = 0
+            results = side_choices = ()
+        picks = game_status.previousSetPicks or {}
+
+        # 바뀌지 않은 필드는 직전 버전과 공유 (세트 결과와 이전 세트 픽은 세트가 끝날 때만 바뀜)
+        if previous is None:
+            self.results = results
+            self.sideChoices = side_choices
+            self.previousSetPicks = _freeze_picks(picks)
+            return
+        self.results = previous.results if results == previous.results else results
+        self.sideChoices = previous.sideChoices if side_choices == previous.sideChoices else side_choices
+        if len(picks) == len(previous.previousSetPicks) and \
+                all(tuple(picks.get(key, ())) == frozen for key, frozen in previous.previousSetPicks):
+            self.previousSetPicks = previous.previousSetPicks
+        else:
+            self.previousSetPicks = _freeze_picks(picks)
+
+    @property
+    def key(self) -> Tuple[int, int]:
+        return self.setNumber, self.phase
+
+    def apply(self, game_status, game_result):
+        """게임 상태와 결과를 이 버전으로 되돌림 (stateVersion과 lastUpdatedAt은 저장할 때 새로 정해짐)"""
+        game_status.setNumber = self.setNumber
+        game_status.phase = self.phase
+        game_status.phaseData = list(self.phaseData)
+        game_status.team1Side = self.team1Side
+        game_status.team2Side = self.team2Side
+        game_status.previousSetPicks = {key: list(picks) for key, picks in self.previousSetPicks}
+        if game_result is not None:
+            game_result.team1Score = self.team1Score
+            game_result.team2Score = self.team2Score
+            game_result.results = list(self.results)
+            game_result.sideChoices = list(self.sideChoices)
+
+    def describe(self) -> dict:
+        return {
+            "setNumber": self.setNumber,
+            "phase": self.phase,
+            "team1Side": self.team1Side,
+            "team2Side": self.team2Side,
+            "scores": {"team1": self.team1Score, "team2": self.team2Score},
+            "stateVersion": self.stateVersion,
+            "recordedAt": self.recordedAt,
+        }
+
+
+class GameHistory:
+    __slots__ = ('versions', 'cursor')
+
+    def __init__(self):
+        self.versions: List[DraftVersion] = []
+        self.cursor = -1  # 현재 상태가 시작된 버전의 위치 (되돌리면 앞으로, 다시 실행하면 뒤로 이동)
+
+
+class DraftHistory:
+    """게임별 페이즈 버전 기록 (되돌리기/다시 실행)
+
+    (세트, 페이즈)가 바뀌어 처음 저장될 때만 버전을 만들고, 같은 페이즈 안의 챔피언 선택은 기록하지 않습니다.
+    되돌린 뒤 새로 상태가 바뀌면 다시 실행할 버전은 버립니다. 게임별로 최근 size개만 보관합니다.
+    """
+
+    def __init__(self, size: int = HISTORY_SIZE):
+        self.size = max(1, size)
+        self.games: Dict[str, GameHistory] = {}
+
+    def record(self, game_code: str, game_status, game_result) -> bool:
+        """상태가 저장될 때 호출. 새 버전을 만들었으면 True"""
+        history = self.games.get(game_code)
+        if history is None:
+            history = self.games[game_code] = GameHistory()
+        versions = history.versions
+        current = versions[history.cursor] if versions else None
+        # 되돌린 상태에서 바뀌었으면 다시 실행할 버전은 더 이상 유효하지 않음
+        del versions[history.cursor + 1:]
+        if current and current.key == (game_status.setNumber, game_status.phase):
+            return False
+        versions.append(DraftVersion(game_status, game_result, current))
+        if len(versions) > self.size:
+            del versions[0]
+        history.cursor = len(versions) - 1
+        return True
+
+    def target(self, game_code: str, steps: int = 0, set_number: int = None, phase: int = None) -> int:
+        """이동할 버전 위치. steps가 음수면 되돌리기, 양수면 다시 실행, (set_number, phase)를 주면 그 페이즈"""
+        history = self.games.get(game_code)
+        if not history or not history.versions:
+            raise ValueError("되돌릴 기록이 없습니다.")
+        if set_number is not None or phase is not None:
+            for index, version in enumerate(history.versions):
+                if version.setNumber == set_number and version.phase == phase:
+                    return index
+            raise ValueError("해당 페이즈의 기록이 없습니다.")
+        index = history.cursor + steps
+        if steps < 0 and index < 0:
+            raise ValueError("더 이상 되돌릴 기록이 없습니다.")
+        if steps > 0 and index >= len(history.versions):
+            raise ValueError("다시 실행할 기록이 없습니다.")
+        return index
+
+    def move(self, game_code: str, index: int) -> DraftVersion:
+        """현재 위치를 index로 옮기고 그 버전을 반환"""
+        history = self.games[game_code]
+        history.cursor = index
+        return history.versions[index]
+
+    def position(self, game_code: str) -> int:
+        history = self.games.get(game_code)
+        return history.cursor if history else -1
+
+    def describe(self, game_code: str) -> dict:
+        history = self.games.get(game_code)
+        if not history:
+            return {"cursor": -1, "versions": []}
+        return {"cursor": history.cursor, "versions": [v.describe() for v in history.versions]}
+
+    def drop(self, game_code: str):
+        self.games.pop(game_code, None)
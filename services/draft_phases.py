@@ -0,0 +1,23 @@
+# 토너먼트 드래프트 페이즈 구성 (phaseData의 인덱스 = 페이즈 번호)
+BAN_PHASES = (1, 2, 3, 4, 5, 6, 13, 14, 15, 16)
+PICK_PHASES = (7, 8, 9, 10, 11, 12, 17, 18, 19, 20)
+DRAFT_PHASES = tuple(range(1, 21))
+
+# 블루/레드 진영이 선택하는 페이즈
+BLUE_TURN_PHASES = (1, 3, 5, 7, 10, 11, 14, 16, 18, 19)
+RED_TURN_PHASES = (2, 4, 6, 8, 9, 12, 13, 15, 17, 20)
+
+BLUE_PICK_PHASES = tuple(p for p in PICK_PHASES if p in BLUE_TURN_PHASES)
+RED_PICK_PHASES = tuple(p for p in PICK_PHASES if p in RED_TURN_PHASES)
+BLUE_BAN_PHASES = tuple(p for p in BAN_PHASES if p in BLUE_TURN_PHASES)
+RED_BAN_PHASES = tuple(p for p in BAN_PHASES if p in RED_TURN_PHASES)
+
+
+def side_of_phase(phase: int) -> str:
+    """해당 페이즈에서 선택하는 진영 ('blue' 또는 'red')"""
+    return "blue" if phase in BLUE_TURN_PHASES else "red"
+
+
+def winner_side(set_result) -> str:
+    """세트 결과의 승리 진영"""
+    return set_result.team1Side if set_result.winner == "team1" else set_result.team2Side
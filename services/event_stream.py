@@ -0,0 +1,171 @@
+import asyncio
+import json
+import time
+from collections import deque
+from itertools import islice
+from typing import AsyncIterator, Callable, Deque, Dict, Optional, Tuple
+
+HEARTBEAT_SECONDS = 15
+RETRY_MILLISECONDS = 3000
+
+
+def encode_frame(event_id: int, event: str, data) -> bytes:
+    """Server-Sent Events 프레임 인코딩"""
+    payload = json.dumps(data, ensure_ascii=False, separators=(',', ':'))
+    return f"id: {event_id}\nevent: {event}\ndata: {payload}\n\n".encode()
+
+
+class GameEventLog:
+    """게임별 SSE 프레임 버퍼
+
+    프레임은 발행 시 한 번만 인코딩되며, 모든 구독자가 같은 bytes 객체를 그대로 전송합니다.
+    delay_seconds가 설정되면 프레임을 지연 버퍼에 모았다가 그 시간이 지난 뒤 구독자에게 공개합니다.
+    """
+
+    def __init__(self, buffer_size: int, delay_seconds: float = 0.0):
+        self.seq = 0  # 마지막으로 발행한 이벤트 ID
+        self.released = 0  # 구독자에게 공개한 마지막 이벤트 ID
+        self.frames: Deque[Tuple[int, bytes]] = deque(maxlen=buffer_size)
+        self.delay_seconds = delay_seconds
+        self.pending: Deque[Tuple[float, int, bytes]] = deque()
+        self.flush_task: Optional[asyncio.Task] = None
+        self.changed = asyncio.Event()
+        self.closed = False
+        self.subscribers = 0
+
+    @property
+    def first_id(self) -> int:
+        return self.frames[0][0] if self.frames else self.released + 1
+
+    def append(self, event: str, data):
+        self.seq += 1
+        frame = encode_frame(self.seq, event, data)
+        if not self.delay_seconds:
+            self._release(self.seq, frame)
+            return
+        self.pending.append((time.monotonic() + self.delay_seconds, self.seq, frame))
+        if self.flush_task is None:
+            self.flush_task = asyncio.create_task(self._flush())
+
+    def _release(self, event_id: int, frame: bytes):
+        self.frames.append((event_id, frame))
+        self.released = event_id
+        self._notify()
+
+    async def _flush(self):
+        """지연 시간이 지난 프레임을 순서대로 공개"""
+        try:
+            while self.pending:
+                due, event_id, frame = self.pending[0]
+                wait = due - time.monotonic()
+                if wait > 0:
+                    await asyncio.sleep(wait)
+                self.pending.popleft()
+                self._release(event_id, frame)
+        finally:
+            self.flush_task = None
+
+    def close(self):
+        if self.flush_task:
+            self.flush_task.cancel()
+        self.pending.clear()
+        self.closed = True
+        self._notify()
+
+    def _notify(self):
+        # 현재 대기 중인 구독자를 깨우고 다음 변경을 위한 이벤트를 새로 만듦
+        changed, self.changed = self.changed, asyncio.Event()
+        changed.set()
+
+    def frames_after(self, event_id: int):
+        """event_id 이후에 공개된 프레임 (버퍼 범위를 벗어나면 None)"""
+        if event_id < self.first_id - 1 or event_id > self.seq:
+            return None
+        return [frame for _, frame in islice(self.frames, event_id - self.first_id + 1, None)]
+
+
+class EventStreamHub:
+    """SocketService 브로드캐스트를 SSE 구독자에게 전달하는 허브
+
+    게임별 버퍼는 첫 구독 시 만들어지며, 이후 발생하는 이벤트는 Last-Event-ID 재개를 위해
+    최근 buffer_size개까지 보관됩니다. delay_seconds가 설정되면 관전자 채널과 같이 이벤트와
+    스냅샷을 그 시간만큼 늦춰 전송합니다 (고스팅 방지).
+    """
+
+    def __init__(self, buffer_size: int = 256, delay_seconds: float = 0.0):
+        self.buffer_size = buffer_size
+        self.delay_seconds = max(0.0, delay_seconds)
+        self.logs: Dict[str, GameEventLog] = {}
+
+    def publish(self, game_code: str, event: str, data):
+        log = self.logs.get(game_code)
+        if log:
+            log.append(event, data)
+
+    def close(self, game_code: str):
+        log = self.logs.pop(game_code, None)
+        if log:
+            log.close()
+
+    def subscriber_count(self, game_code: Optional[str] = None) -> int:
+        if game_code:
+            log = self.logs.get(game_code)
+            return log.subscribers if log else 0
+        return sum(log.subscribers for log in self.logs.values())
+
+    async def subscribe(self, game_code: str, snapshot: Callable[[], dict],
+                        last_event_id: Optional[int] = None) -> AsyncIterator[bytes]:
+        """SSE 프레임 스트림. 재개할 수 없으면 현재 상태 스냅샷부터 전송합니다."""
+        log = self.logs.get(game_code)
+        if log is None:
+            log = self.logs[game_code] = GameEventLog(self.buffer_size, self.delay_seconds)
+        log.subscribers += 1
+        try:
+            yield f"retry: {RETRY_MILLISECONDS}\n\n".encode()
+
+            frames = log.frames_after(last_event_id) if last_event_id is not None else None
+            if frames is None:
+                cursor = log.seq
+                async for frame in self._snapshot(cursor, snapshot):
+                    yield frame
+            else:
+                cursor = max(last_event_id, log.released)
+                for frame in frames:
+                    yield frame
+
+            while True:
+                changed = log.changed
+                if cursor >= log.released:
+                    if log.closed:
+                        break
+                    try:
+                        await asyncio.wait_for(changed.wait(), HEARTBEAT_SECONDS)
+                    except asyncio.TimeoutError:
+                        yield b": keepalive\n\n"
+                    continue
+
+                frames = log.frames_after(cursor)
+                if frames is None:
+                    # 느린 구독자가 버퍼 범위를 벗어나면 스냅샷으로 다시 동기화
+                    cursor = log.seq
+                    async for frame in self._snapshot(cursor, snapshot):
+                        yield frame
+                else:
+                    cursor = log.released
+                    for frame in frames:
+                        yield frame
+        finally:
+            log.subscribers -= 1
+
+    async def _snapshot(self, cursor: int, snapshot: Callable[[], dict]) -> AsyncIterator[bytes]:
+        """현재 상태 스냅샷 프레임. 지연 설정 시 그 시간이 지난 뒤 전송하며, 기다리는 동안 keepalive 전송"""
+        frame = encode_frame(cursor, "snapshot", snapshot())
+        due = time.monotonic() + self.delay_seconds
+        wait = self.delay_seconds
+        while wait > HEARTBEAT_SECONDS:
+            await asyncio.sleep(HEARTBEAT_SECONDS)
+            yield b": keepalive\n\n"
+            wait = due - time.monotonic()
+        if wait > 0:
+            await asyncio.sleep(wait)
+        yield frame
@@ -0,0 +1,130 @@
+import asyncio
+import contextvars
+import logging
+import time
+from typing import Awaitable, Callable, Dict
+
+logger = logging.getLogger(__name__)
+
+
+class ActorStats:
+    """게임별 메일박스 처리 지표"""
+
+    __slots__ = ("processed", "failed", "total_seconds", "max_seconds", "max_depth", "last_active")
+
+    def __init__(self):
+        self.processed = 0
+        self.failed = 0
+        self.total_seconds = 0.0
+        self.max_seconds = 0.0
+        self.max_depth = 0
+        self.last_active = time.monotonic()
+
+
+class GameActor:
+    """한 게임의 명령을 도착 순서대로 하나씩 처리하는 메일박스"""
+
+    __slots__ = ("queue", "task")
+
+    def __init__(self):
+        self.queue: asyncio.Queue = asyncio.Queue()
+        self.task = None
+
+
+class GameActorRegistry:
+    """게임별 액터 관리
+
+    같은 게임의 명령은 해당 게임의 메일박스에서 순서대로 실행되므로 await 지점을
+    지나더라도 상태 변경이 섞이지 않으며, 서로 다른 게임은 전역 락 없이 동시에 진행됩니다.
+    idle_seconds 동안 명령이 없는 액터는 작업 태스크와 큐를 해제(park)합니다.
+    """
+
+    def __init__(self, idle_seconds: float = 30.0):
+        self.idle_seconds = idle_seconds
+        self.actors: Dict[str, GameActor] = {}
+        self.stats: Dict[str, ActorStats] = {}
+
+    async def submit(self, game_code: str, handler: Callable[..., Awaitable], *args):
+        """게임 메일박스에 명령을 넣고 처리 결과를 기다립니다."""
+        return await self.post(game_code, handler, *args)
+
+    def post(self, game_code: str, handler: Callable[..., Awaitable], *args) -> asyncio.Future:
+        """게임 메일박스에 명령을 바로 넣고 결과 future를 반환합니다.
+
+        다른 게임의 액터 안에서 명령을 보낼 때 사용합니다. 두 액터가 서로의 처리를
+        기다리며 멈추지 않도록 결과를 기다리지 않아도 되며, 넣은 순서는 지켜집니다.
+        """
+        actor = self.actors.get(game_code)
+        if actor is None:
+            actor = self.actors[game_code] = GameActor()
+        stats = self.stats.get(game_code)
+        if stats is None:
+            stats = self.stats[game_code] = ActorStats()
+
+        future = asyncio.get_running_loop().create_future()
+        actor.queue.put_nowait((handler, args, future))
+        stats.max_depth = max(stats.max_depth, actor.queue.qsize())
+        if actor.task is None:
+            # 액터는 여러 요청의 명령을 처리하므로 처음 명령을 보낸 요청의 컨텍스트(추적 span 등)를 물려받지 않음
+            actor.task = asyncio.create_task(self._run(game_code, actor, stats), context=contextvars.Context())
+        return future
+
+    async def _run(self, game_code: str, actor: GameActor, stats: ActorStats):
+        queue = actor.queue
+        try:
+            while True:
+                try:
+                    handler, args, future = await asyncio.wait_for(queue.get(), self.idle_seconds)
+                except asyncio.TimeoutError:
+                    if queue.empty():
+                        break
+                    continue
+
+                started = time.perf_counter()
+                try:
+                    result = await handler(*args)
+                    if not future.done():
+                        future.set_result(result)
+                except Exception as e:
+                    stats.failed += 1
+                    logger.error(f"Error in game actor {game_code}: {e}")
+                    if not future.done():
+                        future.set_exception(e)
+                finally:
+                    elapsed = time.perf_counter() - started
+                    stats.processed += 1
+                    stats.total_seconds += elapsed
+                    stats.max_seconds = max(stats.max_seconds, elapsed)
+                    stats.last_active = time.monotonic()
+        finally:
+            # 유휴 상태가 된 액터는 해제. 그 사이 새 액터가 등록됐으면 건드리지 않음
+            if self.actors.get(game_code) is actor:
+                del self.actors[game_code]
+            while not queue.empty():
+                _, _, future = queue.get_nowait()
+                if not future.done():
+                    future.set_exception(RuntimeError("게임 액터가 종료되었습니다."))
+
+    def drop(self, game_code: str):
+        """종료된 게임의 액터와 지표 제거 (남은 명령은 처리 후 유휴 시간이 지나면 종료)"""
+        self.stats.pop(game_code, None)
+        self.actors.pop(game_code, None)
+
+    def metrics(self) -> dict:
+        games = {}
+        for game_code, stats in self.stats.items():
+            actor = self.actors.get(game_code)
+            games[game_code] = {
+                "active": actor is not None,
+                "queueDepth": actor.queue.qsize() if actor else 0,
+                "maxQueueDepth": stats.max_depth,
+                "processed": stats.processed,
+                "failed": stats.failed,
+                "avgMs": round(stats.total_seconds / stats.processed * 1000, 3) if stats.processed else 0.0,
+                "maxMs": round(stats.max_seconds * 1000, 3),
+            }
+        return {
+            "activeActors": len(self.actors),
+            "trackedGames": len(self.stats),
+            "games": games,
+        }
@@ -0,0 +1,156 @@
+import base64
+from bisect import bisect_left, insort
+from typing import Dict, List, Optional, Tuple
+
+# 관리자 목록 조회에서 사용하는 페이즈 구분
+PHASE_BUCKETS = ("lobby", "drafting", "side_choice", "finished")
+
+
+def phase_bucket(phase: int) -> str:
+    """게임 페이즈를 목록 필터용 구분으로 변환"""
+    if phase == 0:
+        return "lobby"
+    if phase == 22:
+        return "side_choice"
+    if phase >= 23:
+        return "finished"
+    return "drafting"
+
+
+def encode_cursor(key: Tuple[int, str]) -> str:
+    """정렬 키를 불투명한 커서 문자열로 변환"""
+    raw = f"{key[0]}:{key[1]}".encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Tuple[int, str]:
+    """커서 문자열을 정렬 키로 복원"""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        updated_at, game_code = base64.urlsafe_b64decode(padded).decode().split(":", 1)
+        return int(updated_at), game_code
+    except Exception:
+        raise ValueError("유효하지 않은 커서입니다.")
+
+
+class GameDirectory:
+    """게임 목록 조회를 위한 보조 인덱스
+
+    모든 인덱스는 (lastUpdatedAt, gameCode) 키로 정렬된 리스트이며,
+    게임 상태가 저장될 때마다 GameService가 update()를 호출해 점진적으로 갱신합니다.
+    """
+
+    def __init__(self):
+        self.entries: Dict[str, dict] = {}  # gameCode -> 인덱싱된 속성
+        self.by_updated: List[Tuple[int, str]] = []
+        self.by_phase: Dict[str, List[Tuple[int, str]]] = {}
+        self.by_draft_type: Dict[str, List[Tuple[int, str]]] = {}
+        self.by_match_format: Dict[str, List[Tuple[int, str]]] = {}
+
+    def __len__(self):
+        return len(self.entries)
+
+    @staticmethod
+    def _insert(index: Dict[str, List[Tuple[int, str]]], value: str, key: Tuple[int, str]):
+        insort(index.setdefault(value, []), key)
+
+    @staticmethod
+    def _remove(keys: List[Tuple[int, str]], key: Tuple[int, str]):
+        pos = bisect_left(keys, key)
+        if pos < len(keys) and keys[pos] == key:
+            del keys[pos]
+
+    def update(self, game_code: str, game_status, game_settings):
+        """게임 상태 변경을 인덱스에 반영"""
+        key = (game_status.lastUpdatedAt, game_code)
+        entry = {
+            "key": key,
+            "phase": phase_bucket(game_status.phase),
+            "draftType": game_settings.draftType,
+            "matchFormat": game_settings.matchFormat,
+        }
+        old = self.entries.get(game_code)
+        if old == entry:
+            return
+        if old:
+            self._unindex(old)
+        self.entries[game_code] = entry
+        insort(self.by_updated, key)
+        self._insert(self.by_phase, entry["phase"], key)
+        self._insert(self.by_draft_type, entry["draftType"], key)
+        self._insert(self.by_match_format, entry["matchFormat"], key)
+
+    def remove(self, game_code: str):
+        """게임을 인덱스에서 제거"""
+        old = self.entries.pop(game_code, None)
+        if old:
+            self._unindex(old)
+
+    def _unindex(self, entry: dict):
+        key = entry["key"]
+        self._remove(self.by_updated, key)
+        self._remove(self.by_phase.get(entry["phase"], []), key)
+        self._remove(self.by_draft_type.get(entry["draftType"], []), key)
+        self._remove(self.by_match_format.get(entry["matchFormat"], []), key)
+
+    def _candidates(self, phase, draft_type, match_format) -> List[Tuple[int, str]]:
+        """적용된 필터 중 가장 작은 인덱스를 선택"""
+        lists = [self.by_updated]
+        if phase:
+            lists.append(self.by_phase.get(phase, []))
+        if draft_type:
+            lists.append(self.by_draft_type.get(draft_type, []))
+        if match_format:
+            lists.append(self.by_match_format.get(match_format, []))
+        return min(lists, key=len)
+
+    def query(
+        self,
+        phase: Optional[str] = None,
+        draft_type: Optional[str] = None,
+        match_format: Optional[str] = None,
+        updated_since: Optional[int] = None,
+        updated_before: Optional[int] = None,
+        cursor: Optional[str] = None,
+        limit: Optional[int] = 50,
+    ) -> Tuple[List[str], Optional[str]]:
+        """필터에 맞는 게임 코드를 최근 활동 순으로 반환
+
+        limit이 None이면 모든 결과를 반환합니다. 다음 페이지가 있으면 커서를 함께 반환합니다.
+        """
+        keys = self._candidates(phase, draft_type, match_format)
+
+        # 정렬된 키에서 [updated_since, updated_before) 범위와 커서 위치를 이분 탐색
+        end = len(keys)
+        if updated_before is not None:
+            end = bisect_left(keys, (updated_before, ""))
+        if cursor:
+            end = min(end, bisect_left(keys, decode_cursor(cursor)))
+        start = 0
+        if updated_since is not None:
+            start = bisect_left(keys, (updated_since, ""))
+
+        codes = []
+        last_key = None
+        pos = end - 1
+        while pos >= start:
+            key = keys[pos]
+            pos -= 1
+            entry = self.entries[key[1]]
+            if phase and entry["phase"] != phase:
+                continue
+            if draft_type and entry["draftType"] != draft_type:
+                continue
+            if match_format and entry["matchFormat"] != match_format:
+                continue
+            if limit is not None and len(codes) >= limit:
+                return codes, encode_cursor(last_key)
+            codes.append(key[1])
+            last_key = key
+        return codes, None
+
+    def count(self, phase: Optional[str] = None) -> int:
+        """구분별 게임 수"""
+        if phase:
+            return len(self.by_phase.get(phase, []))
+        return len(self.by_updated)
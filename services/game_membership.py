@@ -0,0 +1,61 @@
+from collections import OrderedDict
+from typing import Dict, List, Optional
+
+
+class GameMembership:
+    """게임별 참가 순서와 호스트 관리
+
+    플레이어와 관전자를 입장 순서대로 보관하므로 호스트가 나가면 가장 먼저 들어온
+    참가자를 O(1)로 찾아 다음 호스트로 지정할 수 있습니다. 포지션을 바꿔도 순서는 유지됩니다.
+    """
+
+    def __init__(self):
+        self.order: Dict[str, "OrderedDict[str, None]"] = {}
+        self.hosts: Dict[str, str] = {}
+
+    def join(self, game_code: str, sid: str, is_host: bool = False):
+        members = self.order.setdefault(game_code, OrderedDict())
+        members[sid] = None
+        if is_host:
+            self.hosts[game_code] = sid
+
+    def leave(self, game_code: str, sid: str) -> bool:
+        """참가자 제거. 호스트였으면 True 반환 (다음 호스트 지정은 promote로)"""
+        members = self.order.get(game_code)
+        if members is None or sid not in members:
+            return False
+        del members[sid]
+        if not members:
+            del self.order[game_code]
+        if self.hosts.get(game_code) == sid:
+            del self.hosts[game_code]
+            return True
+        return False
+
+    def promote(self, game_code: str) -> Optional[str]:
+        """호스트가 없으면 가장 먼저 들어온 참가자를 호스트로 지정하고 sid 반환"""
+        if game_code in self.hosts:
+            return None
+        members = self.order.get(game_code)
+        if not members:
+            return None
+        sid = next(iter(members))
+        self.hosts[game_code] = sid
+        return sid
+
+    def host(self, game_code: str) -> Optional[str]:
+        return self.hosts.get(game_code)
+
+    def contains(self, game_code: str, sid: str) -> bool:
+        return sid in self.order.get(game_code, ())
+
+    def count(self, game_code: str) -> int:
+        return len(self.order.get(game_code, ()))
+
+    def members(self, game_code: str) -> List[str]:
+        """입장 순서대로 sid 목록 반환"""
+        return list(self.order.get(game_code, ()))
+
+    def drop(self, game_code: str):
+        self.order.pop(game_code, None)
+        self.hosts.pop(game_code, None)
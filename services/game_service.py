@@ -1,7 +1,12 @@
-import time
 import secrets
-from models import Game, GameSetting, GameStatus
+from models import Game, GameResult, GameSetting, GameStatus
 from fastapi import Request
+from services.draft_history import DraftHistory
+from services.game_directory import GameDirectory
+from services.game_timeline import GameTimeline, RESTORE, SIDE_CHOICE
+from services.match_archive import ArchiveFull
+from services.server_clock import server_clock
+from services.tracing import tracer
 
 class GameService:
     def __init__(self):
@@ -10,7 +15,15 @@ class GameService:
         self.game_status = {}
         self.game_results = {}  # GameResult 저장용
         self.socket_service = None  # SocketService 참조를 저장할 변수
+        self.directory = GameDirectory()  # 관리자 목록 조회용 보조 인덱스
+        self.timeline = GameTimeline()  # 게임별 선택/확정/결과/진영 선택 기록
+        self.history = DraftHistory()  # 되돌리기/다시 실행용 페이즈별 상태 버전
+        self.asset_store = None  # 배너 이미지 저장소
+        self.archive = None  # 종료된 매치 보관소
+        self.archived_games = set()  # 보관소에 기록했지만 아직 메모리에 남아 있는 게임
+        self.accepting_games = True  # 종료 준비 중에는 새 게임을 만들지 않음
     
+    @tracer.traced('GameService.create_game')
     async def create_game(self, setting: GameSetting, request: Request = None) -> Game:
         """새로운 게임을 생성합니다."""
         try:
@@ -20,7 +33,7 @@ class GameService:
                 if game_code not in self.games:
                     break
         
-            current_time = int(time.time() * 1000000)
+            current_time = server_clock.now_us()
         
             # Extract additional data from request body
             game_name = "New Game"
@@ -45,6 +58,15 @@ class GameService:
                 except Exception as e:
                     print(f"Error extracting additional game data: {e}")
         
+            # data URL 배너 이미지는 자산 저장소에 저장하고 짧은 참조만 보관
+            # (프런트엔드가 다른 도메인에서 실행되므로 절대 주소로 저장)
+            if self.asset_store and setting.bannerImage:
+                base_url = str(request.base_url) if request is not None else None
+                if setting.bannerImage.startswith("data:"):
+                    setting.bannerImage = self.asset_store.put_data_url(setting.bannerImage, base_url)["url"]
+                else:
+                    setting.bannerImage = self.asset_store.absolute_url(setting.bannerImage, base_url)
+
             # Initialize game with game name
             game = Game(
                 gameCode=game_code,
@@ -67,7 +89,7 @@ class GameService:
             # Store in memory
             self.games[game_code] = game
             self.game_settings[game_code] = setting
-            self.game_status[game_code] = status
+            self.update_game_status(game_code, status)
         
             print(f"Game created: {game_code}")
             return game
@@ -75,7 +97,176 @@ class GameService:
             print(f"Error in create_game: {e}")
             raise
 
-    async def handle_side_choice(self, game_code: str, choice: str):
+    @tracer.traced('GameService.update_game_status')
+    def update_game_status(self, game_code: str, game_status: GameStatus, record_history: bool = True):
+        """게임 상태를 저장하고 보조 인덱스를 갱신합니다."""
+        game_status.stateVersion += 1
+        self.game_status[game_code] = game_status
+        game_settings = self.game_settings.get(game_code)
+        if game_settings:
+            self.directory.update(game_code, game_status, game_settings)
+        if record_history:
+            self.history.record(game_code, game_status, self.game_results.get(game_code))
+
+    @tracer.traced('GameService.list_games')
+    def list_games(self, phase=None, draft_type=None, match_format=None,
+                   updated_since=None, updated_before=None, cursor=None, limit=50) -> dict:
+        """필터에 맞는 게임 목록을 최근 활동 순으로 반환합니다."""
+        codes, next_cursor = self.directory.query(
+            phase=phase,
+            draft_type=draft_type,
+            match_format=match_format,
+            updated_since=updated_since,
+            updated_before=updated_before,
+            cursor=cursor,
+            limit=limit,
+        )
+        games = []
+        for game_code in codes:
+            game_settings = self.game_settings[game_code]
+            game_status = self.game_status[game_code]
+            game_result = self.game_results.get(game_code)
+            games.append({
+                'code': game_code,
+                'gameName': self.games[game_code].gameName,
+                'createdAt': self.games[game_code].createdAt,
+                'phase': game_status.phase,
+                'state': self.directory.entries[game_code]['phase'],
+                'setNumber': game_status.setNumber,
+                'draftType': game_settings.draftType,
+                'matchFormat': game_settings.matchFormat,
+                'playerType': game_settings.playerType,
+                'team1Name': game_status.team1Name,
+                'team2Name': game_status.team2Name,
+                'team1Score': game_result.team1Score if game_result else 0,
+                'team2Score': game_result.team2Score if game_result else 0,
+                'lastUpdatedAt': game_status.lastUpdatedAt,
+            })
+        return {'games': games, 'nextCursor': next_cursor}
+
+    @tracer.traced('GameService.close_game')
+    async def close_game(self, game_code: str, reason: str = "closed"):
+        """게임을 강제 종료하고 메모리에서 제거합니다."""
+        if game_code not in self.games:
+            raise ValueError("게임을 찾을 수 없습니다.")
+        if self.socket_service:
+            # 소켓 명령과 순서가 섞이지 않도록 게임 메일박스에서 종료
+            await self.socket_service.actors.submit(game_code, self._close_game, game_code, reason)
+        else:
+            await self._close_game(game_code, reason)
+
+    async def _close_game(self, game_code: str, reason: str):
+        if game_code not in self.games:
+            raise ValueError("게임을 찾을 수 없습니다.")
+
+        if self.socket_service:
+            await self.socket_service.close_game(game_code, reason)
+
+        self.directory.remove(game_code)
+        self.games.pop(game_code, None)
+        self.game_settings.pop(game_code, None)
+        self.game_status.pop(game_code, None)
+        self.game_results.pop(game_code, None)
+        self.timeline.drop(game_code)
+        self.history.drop(game_code)
+        self.archived_games.discard(game_code)
+        print(f"Game closed: {game_code} ({reason})")
+
+    async def close_games(self, phase=None, draft_type=None, match_format=None,
+                          updated_since=None, updated_before=None, reason: str = "closed") -> list:
+        """필터에 맞는 모든 게임을 강제 종료합니다."""
+        codes, _ = self.directory.query(
+            phase=phase,
+            draft_type=draft_type,
+            match_format=match_format,
+            updated_since=updated_since,
+            updated_before=updated_before,
+            limit=None,
+        )
+        closed = []
+        for game_code in codes:
+            try:
+                await self.close_game(game_code, reason)
+            except ValueError:
+                continue  # 그 사이 다른 요청이 먼저 종료한 게임
+            closed.append(game_code)
+        return closed
+
+    def archive_match(self, game_code: str) -> bool:
+        """종료된 매치의 세트 결과를 보관소에 기록합니다. 이미 기록했으면 False"""
+        if not self.archive or not self.archive.enabled or self.archive.full or game_code in self.archived_games \
+                or game_code not in self.games:
+            return False
+        try:
+            self.archive.append_match(
+                game_code,
+                self.games[game_code],
+                self.game_settings[game_code],
+                self.game_status[game_code],
+                self.game_results.get(game_code),
+                self.timeline.entries.get(game_code, ()),
+            )
+        except ArchiveFull:
+            return False  # 보관소에 기록하지 못한 게임은 메모리에 남김
+        self.archived_games.add(game_code)
+        return True
+
+    async def evict_finished_games(self, finished_before: int) -> list:
+        """finished_before 이전에 끝난 매치를 보관소에 기록한 뒤 메모리에서 제거합니다.
+
+        보관 기간 동안은 되돌리기로 최종 결과를 고칠 수 있도록 제거할 때 기록하며,
+        기록한 행이 파일에 쓰인 뒤에 제거합니다 (쓰지 못하면 다음 주기에 다시 시도).
+        """
+        codes, _ = self.directory.query(phase="finished", updated_before=finished_before, limit=None)
+        archived = [game_code for game_code in codes
+                    if self.archive_match(game_code) or game_code in self.archived_games]
+        if not archived:
+            return []
+        await self.archive.flush_async()
+        evicted = []
+        for game_code in archived:
+            try:
+                await self.close_game(game_code, "archived")
+            except ValueError:
+                continue  # 그 사이 관리자가 먼저 종료한 게임
+            evicted.append(game_code)
+        return evicted
+
+    @tracer.traced('GameService.restore_draft')
+    def restore_draft(self, game_code: str, steps: int = 0, set_number: int = None, phase: int = None,
+                      restored_by: str = None) -> dict:
+        """기록된 페이즈 버전으로 게임 상태를 되돌리거나(steps < 0) 다시 실행합니다(steps > 0).
+
+        세트 결과가 바뀌면 통계 반영을 맞추기 위해 사라진 세트(removed)와 다시 생긴 세트(added)를 함께 반환합니다.
+        """
+        game_status = self.game_status.get(game_code)
+        if not game_status:
+            raise ValueError("게임을 찾을 수 없습니다.")
+        if game_code in self.archived_games:
+            raise ValueError("보관소에 기록된 매치는 되돌릴 수 없습니다.")
+
+        index = self.history.target(game_code, steps, set_number, phase)
+        action = "undo" if index <= self.history.position(game_code) else "redo"
+        version = self.history.move(game_code, index)
+        game_result = self.game_results.get(game_code)
+        before = list(game_result.results) if game_result else []
+        if game_result is None and version.results:
+            game_result = self.game_results[game_code] = GameResult()
+
+        version.apply(game_status, game_result)
+        game_status.lastUpdatedAt = server_clock.now_us()
+        self.update_game_status(game_code, game_status, record_history=False)
+        self.timeline.append(game_code, RESTORE, game_status.lastUpdatedAt, game_status.setNumber,
+                             game_status.phase, restored_by, action)
+
+        # 같은 세트 결과 객체는 버전끼리 공유하므로 위치별로 객체가 다른 세트만 통계에서 빼고 다시 반영
+        after = game_result.results if game_result else []
+        removed = [r for i, r in enumerate(before) if r and (i >= len(after) or after[i] is not r)]
+        added = [r for i, r in enumerate(after) if r and (i >= len(before) or before[i] is not r)]
+        return {"action": action, "version": version, "removed": removed, "added": added}
+
+    @tracer.traced('GameService.handle_side_choice')
+    async def handle_side_choice(self, game_code: str, choice: str, chosen_by: str = None):
         """진영 선택 처리"""
         if game_code not in self.game_status:
             raise ValueError("게임을 찾을 수 없습니다.")
@@ -85,13 +276,33 @@ class GameService:
         if choice == "swap":
             # 팀 진영 교체
             game_status.team1Side, game_status.team2Side = game_status.team2Side, game_status.team1Side
+            self.update_game_status(game_code, game_status)
         
         # 선택 기록 저장
         if game_code in self.game_results:
             self.game_results[game_code].sideChoices.append(choice)
+        self.timeline.append(game_code, SIDE_CHOICE, server_clock.now_us(),
+                             game_status.setNumber, game_status.phase, chosen_by, choice)
         
         return {"status": "success", "choice": choice}
 
+    def get_unavailable_champions(self, game_code: str) -> set:
+        """현재 세트에서 선택할 수 없는 챔피언 (글로벌 밴, 하드피어리스 이전 세트 픽, 이번 세트에 확정된 챔피언)"""
+        game_settings = self.game_settings.get(game_code)
+        game_status = self.game_status.get(game_code)
+        if not game_settings or not game_status:
+            raise ValueError("게임을 찾을 수 없습니다.")
+
+        unavailable = set(game_settings.globalBans or [])
+        if game_settings.draftType == "hardFearless":
+            for picks in (game_status.previousSetPicks or {}).values():
+                unavailable.update(picks)
+        # 현재 페이즈에서 고르는 중인 챔피언은 아직 확정 전이므로 제외하지 않음
+        for champion in game_status.phaseData[1:min(game_status.phase, 21)]:
+            if champion:
+                unavailable.add(champion)
+        return unavailable
+
     def get_current_blue_team_info(self, game_code: str):
         """현재 블루 진영에 있는 팀 정보 반환"""
         game_status = self.game_status.get(game_code)
@@ -124,6 +335,37 @@ class GameService:
             "status": self.game_status[game_code]
         }
 
+    @tracer.traced('GameService.get_snapshot')
+    def get_snapshot(self, game_code: str) -> dict:
+        """오버레이용 간단한 게임 상태 (클라이언트 목록과 세트 상세 제외)"""
+        game_settings = self.game_settings.get(game_code)
+        game_status = self.game_status.get(game_code)
+        if not game_settings or not game_status:
+            raise ValueError("게임을 찾을 수 없습니다.")
+
+        game_result = self.game_results.get(game_code)
+        return {
+            'gameCode': game_code,
+            'phase': game_status.phase,
+            'phaseData': game_status.phaseData,
+            'setNumber': game_status.setNumber,
+            'matchFormat': game_settings.matchFormat,
+            'draftType': game_settings.draftType,
+            'team1': {
+                'name': game_status.team1Name,
+                'side': game_status.team1Side,
+                'score': game_result.team1Score if game_result else 0,
+            },
+            'team2': {
+                'name': game_status.team2Name,
+                'side': game_status.team2Side,
+                'score': game_result.team2Score if game_result else 0,
+            },
+            'timestamp': game_status.lastUpdatedAt,
+            'stateVersion': game_status.stateVersion,
+        }
+
+    @tracer.traced('GameService.get_game')
     def get_game(self, game_code: str) -> dict:
         """게임 정보를 반환합니다."""
         try:
@@ -135,20 +377,25 @@ class GameService:
                 raise ValueError("게임을 찾을 수 없습니다.")
             
             # 게임에 참가한 클라이언트 정보를 가져옵니다
+            # 관전자 채널의 관전자는 목록에 포함하지 않고 수만 반환
             clients = []
-            if self.socket_service and hasattr(self.socket_service, 'clients'):
-                for client in self.socket_service.clients.values():
-                    if client.get('gameCode') == game_code:
-                        # 클라이언트 정보를 그대로 가져와서 필요한 정보만 추출
-                        clients.append({
-                            'nickname': client.get('nickname'),
-                            'position': client.get('position'),
-                            'isHost': client.get('isHost', False),  # 저장된 방장 정보 사용
-                            'isReady': client.get('isReady', False),
-                            'champion': client.get('champion'),
-                            'isConfirmed': client.get('isConfirmed', False),
-                            'clientId': client.get('sid')
-                        })
+            spectator_count = 0
+            if self.socket_service and hasattr(self.socket_service, 'game_clients'):
+                spectator_count = self.socket_service.spectators.count(game_code)
+                room = self.socket_service.game_clients.get(game_code, {})
+                for client in self.socket_service.get_members(game_code):
+                    if client.get('sid') not in room:
+                        continue
+                    # 클라이언트 정보를 그대로 가져와서 필요한 정보만 추출
+                    clients.append({
+                        'nickname': client.get('nickname'),
+                        'position': client.get('position'),
+                        'isHost': client.get('isHost', False),  # 저장된 방장 정보 사용
+                        'isReady': client.get('isReady', False),
+                        'champion': client.get('champion'),
+                        'isConfirmed': client.get('isConfirmed', False),
+                        'clientId': client.get('sid')
+                    })
             
             # 게임 결과 가져오기
             game_result = self.game_results.get(game_code)
@@ -196,11 +443,13 @@ class GameService:
                     'team1Side': game_status.team1Side,
                     'team2Side': game_status.team2Side,
                     'previousSetPicks': game_status.previousSetPicks or {},  # 하드피어리스를 위한 이전 세트 픽 정보
+                    'stateVersion': game_status.stateVersion,
                     # 하위 호환성을 위한 블루/레드팀 이름 (현재 진영 기준)
                     'blueTeamName': game_status.team1Name if game_status.team1Side == "blue" else game_status.team2Name,
                     'redTeamName': game_status.team1Name if game_status.team1Side == "red" else game_status.team2Name,
                 },
                 'clients': clients,
+                'spectatorCount': spectator_count,
                 'team1Score': team1_score,
                 'team2Score': team2_score,
                 'results': results,  # 각 세트별 결과 데이터 추가
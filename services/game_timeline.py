@@ -0,0 +1,65 @@
+import json
+from typing import AsyncIterator, Dict, List, Optional, Tuple
+
+# 타임라인 항목 종류
+SELECT = "select"          # 챔피언 선택(변경 포함)
+CONFIRM = "confirm"        # 선택 확정(페이즈 진행)
+RESULT = "result"          # 세트 결과 확정
+SIDE_CHOICE = "side_choice"  # 다음 세트 진영 선택
+RESTORE = "restore"        # 되돌리기/다시 실행 (set/phase는 되돌린 페이즈)
+KINDS = (SELECT, CONFIRM, RESULT, SIDE_CHOICE, RESTORE)
+
+# (timestamp, setNumber, phase, kind 인덱스, 행동한 클라이언트 닉네임, 값)
+Entry = Tuple[int, int, int, int, Optional[str], Optional[str]]
+
+# 값 필드 이름 (kind 인덱스 순서)
+VALUE_FIELDS = ("champion", "champion", "winner", "choice", "action")
+
+
+def encode_entry(entry: Entry) -> bytes:
+    timestamp, set_number, phase, kind, by, value = entry
+    line = {"t": timestamp, "set": set_number, "phase": phase, "type": KINDS[kind]}
+    if by is not None:
+        line["by"] = by
+    line[VALUE_FIELDS[kind]] = value
+    return json.dumps(line, ensure_ascii=False, separators=(',', ':')).encode() + b"\n"
+
+
+class GameTimeline:
+    """게임별 드래프트 행동 기록 (추가만 가능)
+
+    항목은 튜플로 보관하고 조회할 때 NDJSON 한 줄씩 인코딩하므로,
+    bo5 전체를 내보내도 응답 전체를 메모리에 만들지 않습니다.
+    """
+
+    def __init__(self):
+        self.entries: Dict[str, List[Entry]] = {}
+
+    def append(self, game_code: str, kind: str, timestamp: int, set_number: int, phase: int,
+               by: Optional[str] = None, value: Optional[str] = None):
+        self.entries.setdefault(game_code, []).append(
+            (timestamp, set_number, phase, KINDS.index(kind), by, value)
+        )
+
+    def count(self, game_code: str) -> int:
+        return len(self.entries.get(game_code, ()))
+
+    def drop(self, game_code: str):
+        self.entries.pop(game_code, None)
+
+    def export(self, game_code: str) -> List[list]:
+        """인계 파일 저장용 목록"""
+        return [list(entry) for entry in self.entries.get(game_code, ())]
+
+    def restore(self, game_code: str, entries: List[list]):
+        self.entries[game_code] = [tuple(entry) for entry in entries]
+
+    async def stream(self, game_code: str, header: dict, since: int = 0,
+                     chunk_size: int = 64) -> AsyncIterator[bytes]:
+        """헤더 한 줄 뒤에 since번째 이후 항목을 chunk_size개씩 NDJSON으로 전송"""
+        yield json.dumps(header, ensure_ascii=False, separators=(',', ':')).encode() + b"\n"
+
+        entries = self.entries.get(game_code, [])
+        end = len(entries)  # 요청 시점까지의 항목만 전송
+        for start in range(since, end, chunk_size):
+            yield b"".join(encode_entry(entry) for entry in entries[start:min(start + chunk_size, end)])
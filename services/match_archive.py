@@ -0,0 +1,600 @@
+import asyncio
+import csv
+import io
+import json
+import os
+import tempfile
+import threading
+import time
+from typing import Awaitable, Callable, Dict, Iterable, Iterator, List, Optional, Sequence
+
+import numpy as np
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
+from services.draft_phases import (
+    BLUE_BAN_PHASES,
+    BLUE_PICK_PHASES,
+    DRAFT_PHASES,
+    RED_BAN_PHASES,
+    RED_PICK_PHASES,
+)
+from services.game_timeline import KINDS, RESULT
+from services.report_jobs import CSV_COLUMNS, SLOT_COUNT as SNAPSHOT_SLOTS
+from services.server_clock import server_clock
+
+ARCHIVE_FORMAT = 1
+
+# 열 이름 → (자료형, 행 하나의 모양). 세트 하나가 한 행이며 열마다 파일 하나에 추가만 합니다.
+COLUMNS = {
+    "gameCode": (np.uint32, ()),         # 8자리 16진수 게임 코드
+    "setNumber": (np.uint8, ()),
+    "createdAt": (np.int64, ()),         # 게임 생성 시각 (마이크로초)
+    "finishedAt": (np.int64, ()),        # 세트 결과 확정 시각 (마이크로초)
+    "version": (np.uint16, ()),          # 이하 사전 번호
+    "draftType": (np.uint8, ()),
+    "matchFormat": (np.uint8, ()),
+    "team1Name": (np.uint32, ()),
+    "team2Name": (np.uint32, ()),
+    "team1Side": (np.uint8, ()),         # 0 blue, 1 red
+    "winner": (np.uint8, ()),            # 1 team1, 2 team2
+    "slots": (np.uint16, (len(DRAFT_PHASES),)),  # 페이즈 1~20의 챔피언 사전 번호 (0은 빈 슬롯)
+}
+
+# 사전 인코딩 열 → 사전 이름
+DICTIONARY_COLUMNS = {
+    "version": "version",
+    "draftType": "draftType",
+    "matchFormat": "matchFormat",
+    "team1Name": "team",
+    "team2Name": "team",
+    "slots": "champion",
+}
+DICTIONARIES = ("champion", "version", "draftType", "matchFormat", "team")
+# 사전 크기 한도 (사전 번호를 저장하는 열 자료형의 범위)
+DICTIONARY_LIMITS = {
+    name: min(int(np.iinfo(COLUMNS[column][0]).max) + 1 for column, d in DICTIONARY_COLUMNS.items() if d == name)
+    for name in DICTIONARIES
+}
+
+EXPORT_COLUMNS = CSV_COLUMNS + ["createdAt", "finishedAt"]
+
+
+class ArchiveLocked(Exception):
+    """다른 프로세스(다른 워커)가 같은 보관소 디렉터리를 사용 중"""
+
+
+class ArchiveFull(Exception):
+    """사전이 열 자료형으로 표현할 수 있는 값 수에 도달해 더 기록할 수 없음"""
+
+
+def _phase_columns(phases) -> List[int]:
+    return [phase - 1 for phase in phases]
+
+
+class Dictionary:
+    """값 ↔ 번호 사전. 파일에는 새 값만 한 줄에 하나씩 JSON 문자열로 추가합니다."""
+
+    def __init__(self, values: Sequence[str] = (), max_size: Optional[int] = None):
+        self.values: List[str] = list(values)
+        self.ids = {value: i for i, value in enumerate(self.values)}
+        self.saved = len(self.values)  # 파일에 기록된 값 수
+        self.max_size = max_size
+
+    def encode(self, value: str) -> int:
+        value_id = self.ids.get(value)
+        if value_id is None:
+            if self.max_size is not None and len(self.values) >= self.max_size:
+                raise ArchiveFull(f"보관소 사전이 가득 찼습니다 ({self.max_size}개)")
+            value_id = self.ids[value] = len(self.values)
+            self.values.append(value)
+        return value_id
+
+    def new_values(self) -> List[str]:
+        """아직 파일에 기록하지 않은 값 (기록에 성공하면 saved를 옮김)"""
+        return self.values[self.saved:]
+
+
+class MatchArchive:
+    """종료된 매치(페이즈 23)의 세트 결과를 디스크에 열 단위로 보관하는 저장소
+
+    문자열은 사전 번호로, 나머지는 필요한 만큼의 정수 자료형으로 저장하므로 세트 하나가 약 80바이트입니다.
+    행은 메모리에 모았다가 묶음으로 파일 끝에 추가하고, 조회는 필요한 열 파일만 메모리 매핑해 numpy로 계산합니다.
+    기록이 끝난 게임은 보관 기간이 지나면 GameService 메모리에서 제거됩니다.
+    """
+
+    def __init__(self, path: Optional[str] = None):
+        self.path = path or os.getenv("ARCHIVE_DIR", os.path.join("data", "archive"))
+        self.enabled = os.getenv("MATCH_ARCHIVE", "1") != "0"
+        self.batch_rows = int(os.getenv("ARCHIVE_BATCH_ROWS", "256"))
+        self.flush_seconds = float(os.getenv("ARCHIVE_FLUSH_SECONDS", "5"))
+        self.retention_seconds = float(os.getenv("ARCHIVE_RETENTION_SECONDS", "600"))
+        self.rows = 0  # 파일에 기록된 행 수 (조회는 이 행까지만 읽음)
+        self.dictionaries: Dict[str, Dictionary] = {}
+        self.pending: Dict[str, list] = {name: [] for name in COLUMNS}
+        self.pending_rows = 0
+        self.flushes = 0
+        self.last_flush_ms: Optional[float] = None
+        self.evicted = 0
+        self.full: Optional[str] = None  # 사전이 가득 차 새 매치를 기록하지 않는 이유
+        self.write_errors = 0
+        self.opened = False
+        self.lock_file = None  # 보관소 디렉터리 독점 잠금 (열려 있는 동안 유지)
+        self.write_lock = threading.Lock()
+        self.flush_lock: Optional[asyncio.Lock] = None
+        self.wake: Optional[asyncio.Event] = None
+        self.task: Optional[asyncio.Task] = None
+
+    def _file(self, name: str) -> str:
+        return os.path.join(self.path, name)
+
+    def open(self):
+        """보관소 디렉터리를 잠그고 사전과 행 수를 불러옴 (다른 프로세스가 사용 중이면 ArchiveLocked)"""
+        if self.opened:
+            return
+        os.makedirs(self.path, exist_ok=True)
+        self._lock()
+        try:
+            self._load()
+        except Exception:
+            self._unlock()
+            raise
+        self.opened = True
+
+    def _lock(self):
+        """보관소 디렉터리 독점 잠금
+
+        프로세스마다 자기 행 수로 meta.json을 덮어쓰므로 여러 워커(run.py --workers)가
+        같은 디렉터리에 기록하면 보관소가 손상됨. 잠금을 얻지 못한 프로세스는 보관소 없이 동작합니다.
+        """
+        if fcntl is None:
+            return
+        lock_file = open(self._file("lock"), "a+")
+        try:
+            fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except OSError:
+            lock_file.close()
+            raise ArchiveLocked(f"다른 프로세스가 보관소를 사용 중입니다: {self.path}")
+        self.lock_file = lock_file
+
+    def _unlock(self):
+        if self.lock_file is not None:
+            self.lock_file.close()  # 파일을 닫으면 잠금도 풀림
+            self.lock_file = None
+
+    def _load(self):
+        """메타 파일의 행 수까지만 유효한 것으로 보고, 기록 도중 중단되어 남은 뒷부분은 잘라냄"""
+        meta = {}
+        if os.path.exists(self._file("meta.json")):
+            with open(self._file("meta.json"), encoding="utf-8") as f:
+                meta = json.load(f)
+            if meta.get("format") != ARCHIVE_FORMAT:
+                raise ValueError(f"지원하지 않는 보관소 형식입니다: {meta.get('format')}")
+        self.rows = meta.get("rows", 0)
+        counts = meta.get("dictionaries", {})
+
+        for name in DICTIONARIES:
+            values = []
+            path = self._file(f"{name}.dict")
+            if os.path.exists(path):
+                with open(path, "rb") as f:
+                    lines = f.read().split(b"\n")[:counts.get(name, 0)]
+                values = [json.loads(line) for line in lines]
+                with open(path, "r+b") as f:
+                    f.truncate(sum(len(line) + 1 for line in lines))
+            dictionary = Dictionary(values, DICTIONARY_LIMITS[name])
+            if name == "champion" and not values:
+                dictionary.encode("")  # 0번은 빈 슬롯
+            self.dictionaries[name] = dictionary
+
+        for name, (dtype, shape) in COLUMNS.items():
+            path = self._file(f"{name}.bin")
+            size = self.rows * np.dtype(dtype).itemsize * int(np.prod(shape))
+            if not os.path.exists(path):
+                open(path, "wb").close()
+            elif os.path.getsize(path) > size:
+                with open(path, "r+b") as f:
+                    f.truncate(size)
+            elif os.path.getsize(path) < size:
+                raise ValueError(f"보관소 열 파일이 손상되었습니다: {path}")
+
+    def append_match(self, game_code: str, game, settings, status, result, timeline=()) -> int:
+        """종료된 매치의 세트 결과를 대기 행에 추가하고 추가한 행 수를 반환합니다.
+
+        사전이 가득 차면 ArchiveFull을 발생시키고 이후 매치는 기록하지 않습니다 (metrics의 full).
+        """
+        if not self.enabled or not result:
+            return 0
+        if self.full:
+            raise ArchiveFull(self.full)
+        self.open()
+        # 세트별 결과 확정 시각
+        finished_at = {}
+        result_kind = KINDS.index(RESULT)
+        for timestamp, set_number, _, kind, _, _ in timeline:
+            if kind == result_kind:
+                finished_at[set_number] = timestamp
+
+        # 모든 값을 인코딩한 뒤에 대기 행에 넣어 사전이 가득 차도 매치 일부만 남지 않도록 함
+        pending = {name: [] for name in COLUMNS}
+        try:
+            self._encode_sets(pending, game_code, game, settings, status, result, finished_at)
+        except ArchiveFull as e:
+            self.full = str(e)
+            print(f"Match archive is full, no longer archiving matches: {e}")
+            raise
+        for name, values in pending.items():
+            self.pending[name].extend(values)
+        added = len(pending["gameCode"])
+
+        self.pending_rows += added
+        if self.pending_rows >= self.batch_rows and self.wake is not None:
+            self.wake.set()
+        return added
+
+    def _encode_sets(self, pending: Dict[str, list], game_code: str, game, settings, status, result, finished_at):
+        d = self.dictionaries
+        for set_number, set_result in enumerate(result.results, 1):
+            if not set_result:
+                continue
+            phase_data = set_result.phaseData
+            pending["gameCode"].append(int(game_code, 16))
+            pending["setNumber"].append(set_number)
+            pending["createdAt"].append(game.createdAt)
+            pending["finishedAt"].append(finished_at.get(set_number, status.lastUpdatedAt))
+            pending["version"].append(d["version"].encode(settings.version))
+            pending["draftType"].append(d["draftType"].encode(settings.draftType))
+            pending["matchFormat"].append(d["matchFormat"].encode(settings.matchFormat))
+            pending["team1Name"].append(d["team"].encode(status.team1Name))
+            pending["team2Name"].append(d["team"].encode(status.team2Name))
+            pending["team1Side"].append(0 if set_result.team1Side == "blue" else 1)
+            pending["winner"].append(1 if set_result.winner == "team1" else 2)
+            pending["slots"].append([
+                d["champion"].encode((phase_data[phase] or "").strip() if phase < len(phase_data) else "")
+                for phase in DRAFT_PHASES
+            ])
+
+    def _take_batch(self):
+        """대기 행과 새 사전 값을 꺼냄 (이벤트 루프에서 호출, 기록에 실패하면 _requeue로 되돌림)"""
+        if not self.pending_rows:
+            return None
+        columns = {name: np.asarray(values, dtype=COLUMNS[name][0]) for name, values in self.pending.items()}
+        new_values = {name: dictionary.new_values() for name, dictionary in self.dictionaries.items()}
+        counts = {name: len(dictionary.values) for name, dictionary in self.dictionaries.items()}
+        rows = self.pending_rows
+        self.pending = {name: [] for name in COLUMNS}
+        self.pending_rows = 0
+        return rows, columns, new_values, counts
+
+    def _requeue(self, batch):
+        """기록하지 못한 묶음을 그 사이 추가된 대기 행 앞에 되돌림"""
+        rows, columns, _, _ = batch
+        for name, array in columns.items():
+            self.pending[name][:0] = array.tolist()
+        self.pending_rows += rows
+
+    def _write_batch(self, batch):
+        """사전과 열 파일 끝에 추가한 뒤 메타 파일의 행 수를 갱신 (메타 파일이 바뀌어야 조회에 포함됨)
+
+        도중에 실패하면(디스크 부족 등) 모든 파일을 기록 전 크기로 잘라 열끼리 어긋나지 않게 하고 예외를 다시 발생시킴
+        """
+        rows, columns, new_values, counts = batch
+        started = time.perf_counter()
+        with self.write_lock:
+            files = [f"{name}.dict" for name, values in new_values.items() if values] + \
+                    [f"{name}.bin" for name in columns]
+            sizes = {name: os.path.getsize(self._file(name)) if os.path.exists(self._file(name)) else 0
+                     for name in files}
+            try:
+                for name, values in new_values.items():
+                    if values:
+                        with open(self._file(f"{name}.dict"), "ab") as f:
+                            f.write(b"".join(json.dumps(value, ensure_ascii=False).encode() + b"\n" for value in values))
+                            f.flush()
+                            os.fsync(f.fileno())
+                for name, array in columns.items():
+                    with open(self._file(f"{name}.bin"), "ab") as f:
+                        f.write(array.tobytes())
+                        f.flush()
+                        os.fsync(f.fileno())
+
+                fd, tmp_path = tempfile.mkstemp(dir=self.path, suffix=".tmp")
+                try:
+                    with os.fdopen(fd, "w", encoding="utf-8") as f:
+                        json.dump({"format": ARCHIVE_FORMAT, "rows": self.rows + rows, "dictionaries": counts}, f)
+                    os.replace(tmp_path, self._file("meta.json"))
+                except BaseException:
+                    if os.path.exists(tmp_path):
+                        os.remove(tmp_path)
+                    raise
+            except BaseException:
+                self.write_errors += 1
+                for name, size in sizes.items():
+                    try:
+                        with open(self._file(name), "r+b") as f:
+                            f.truncate(size)
+                    except OSError as e:
+                        print(f"Error truncating match archive file {name}: {e}")
+                raise
+            for name, count in counts.items():
+                self.dictionaries[name].saved = count
+            self.rows += rows
+            self.flushes += 1
+            self.last_flush_ms = round((time.perf_counter() - started) * 1000, 2)
+
+    def flush(self):
+        """대기 행을 바로 기록 (종료할 때와 벤치마크에서 사용)"""
+        batch = self._take_batch()
+        if batch:
+            try:
+                self._write_batch(batch)
+            except Exception:
+                self._requeue(batch)
+                raise
+
+    async def flush_async(self):
+        """대기 행을 작업 스레드에서 기록 (묶음 순서가 바뀌지 않도록 한 번에 하나씩)"""
+        if self.flush_lock is None:
+            self.flush_lock = asyncio.Lock()
+        async with self.flush_lock:
+            batch = self._take_batch()
+            if batch:
+                try:
+                    await asyncio.to_thread(self._write_batch, batch)
+                except Exception:
+                    self._requeue(batch)  # 다음 주기에 다시 기록
+                    raise
+
+    def start(self, evict: Callable[[int], Awaitable[list]]):
+        """주기적으로 대기 행을 기록하고, 보관 기간이 지난 종료 게임을 evict(기준 시각)로 메모리에서 제거"""
+        if not self.enabled or self.task is not None:
+            return
+        self.open()
+        self.wake = asyncio.Event()
+        self.task = asyncio.create_task(self._run(evict))
+
+    async def _run(self, evict):
+        while True:
+            try:
+                await asyncio.wait_for(self.wake.wait(), self.flush_seconds)
+            except asyncio.TimeoutError:
+                pass
+            self.wake.clear()
+            try:
+                await self.flush_async()
+                evicted = await evict(server_clock.now_us() - int(self.retention_seconds * 1_000_000))
+                self.evicted += len(evicted)
+            except Exception as e:
+                print(f"Error in match archive: {e}")
+
+    async def close(self):
+        if self.task:
+            self.task.cancel()
+            try:
+                await self.task
+            except asyncio.CancelledError:
+                pass
+            self.task = None
+        if self.opened:
+            await self.flush_async()
+            self._unlock()
+            self.opened = False
+
+    def _column(self, name: str, rows: int) -> np.ndarray:
+        dtype, shape = COLUMNS[name]
+        if not rows:
+            return np.zeros((0,) + shape, dtype=dtype)
+        return np.memmap(self._file(f"{name}.bin"), dtype=dtype, mode="r", shape=(rows,) + shape)
+
+    def scan(self, columns: Sequence[str], version: Optional[str] = None, draft_type: Optional[str] = None,
+             match_format: Optional[str] = None, game_code: Optional[str] = None,
+             finished_since: Optional[int] = None, finished_before: Optional[int] = None) -> Dict[str, np.ndarray]:
+        """기록된 세트 중 필터에 맞는 행의 열을 반환합니다. 필터와 요청한 열의 파일만 읽습니다."""
+        self.open()
+        rows = self.rows
+        mask = np.ones(rows, dtype=bool)
+        for name, value in (("version", version), ("draftType", draft_type), ("matchFormat", match_format)):
+            if value is not None:
+                value_id = self.dictionaries[DICTIONARY_COLUMNS[name]].ids.get(value)
+                if value_id is None:
+                    mask[:] = False
+                else:
+                    mask &= self._column(name, rows) == value_id
+        if game_code is not None:
+            try:
+                mask &= self._column("gameCode", rows) == int(game_code, 16)
+            except ValueError:
+                mask[:] = False
+        if finished_since is not None:
+            mask &= self._column("finishedAt", rows) >= finished_since
+        if finished_before is not None:
+            mask &= self._column("finishedAt", rows) < finished_before
+        selected = None if mask.all() else np.flatnonzero(mask)
+        return {
+            name: np.asarray(self._column(name, rows)) if selected is None else self._column(name, rows)[selected]
+            for name in columns
+        }
+
+    def summary(self, top: int = 10, **filters) -> dict:
+        """리포트 요약(report_jobs.summary)과 같은 형식을 열 배열 연산으로 계산합니다."""
+        data = self.scan(("gameCode", "version", "draftType", "matchFormat", "team1Side", "winner", "slots"), **filters)
+        champions = self.dictionaries["champion"].values
+        size = len(champions)
+        slots = data["slots"]
+        sets = len(slots)
+        codes = np.sort(data["gameCode"])
+        games = int(np.count_nonzero(codes[1:] != codes[:-1])) + 1 if sets else 0
+        blue_won = (data["team1Side"] == 0) == (data["winner"] == 1)
+
+        # 슬롯(열)마다 챔피언별 등장 수와 블루 진영 승리 수를 센 뒤 밴/픽 페이즈끼리 합산
+        appearances = np.zeros((len(DRAFT_PHASES), size), dtype=np.int64)
+        blue_wins = np.zeros((len(DRAFT_PHASES), size), dtype=np.int64)
+        weights = blue_won.astype(np.float64)
+        for column in range(len(DRAFT_PHASES)):
+            ids = slots[:, column]
+            appearances[column] = np.bincount(ids, minlength=size)
+            blue_wins[column] = np.bincount(ids, weights=weights, minlength=size)
+        appearances[:, 0] = 0  # 빈 슬롯
+        blue_wins[:, 0] = 0
+
+        bans = appearances[_phase_columns(BLUE_BAN_PHASES + RED_BAN_PHASES)].sum(axis=0)
+        blue_pick_columns = _phase_columns(BLUE_PICK_PHASES)
+        red_pick_columns = _phase_columns(RED_PICK_PHASES)
+        picks = appearances[blue_pick_columns + red_pick_columns].sum(axis=0)
+        wins = blue_wins[blue_pick_columns].sum(axis=0) + \
+            (appearances[red_pick_columns] - blue_wins[red_pick_columns]).sum(axis=0)
+        presence = picks + bans
+
+        def distribution(column: str) -> dict:
+            values = self.dictionaries[DICTIONARY_COLUMNS[column]].values
+            counts = np.bincount(data[column], minlength=len(values))
+            return {values[i]: int(counts[i]) for i in np.flatnonzero(counts)}
+
+        def ranked(counts: np.ndarray) -> np.ndarray:
+            order = np.flatnonzero(counts)
+            return order[np.argsort(-counts[order], kind="stable")][:top]
+
+        blue_side_wins = int(blue_won.sum())
+        return {
+            "games": games,
+            "sets": sets,
+            "averageSetsPerGame": round(sets / games, 2) if games else 0,
+            "blueSideWins": blue_side_wins,
+            "blueSideWinRate": round(blue_side_wins / sets, 4) if sets else 0,
+            "byVersion": distribution("version"),
+            "byDraftType": distribution("draftType"),
+            "byMatchFormat": distribution("matchFormat"),
+            "topPicks": [
+                {"champion": champions[c], "picks": int(picks[c]), "wins": int(wins[c]),
+                 "winRate": round(float(wins[c] / picks[c]), 4)}
+                for c in ranked(picks)
+            ],
+            "topBans": [{"champion": champions[c], "bans": int(bans[c])} for c in ranked(bans)],
+            "topPresence": [
+                {"champion": champions[c], "presence": int(presence[c]), "rate": round(float(presence[c] / sets), 4)}
+                for c in ranked(presence)
+            ],
+        }
+
+    def load_stats(self, stats_service) -> int:
+        """기록된 모든 세트를 StatsService에 반영하고 반영한 세트 수를 반환합니다 (서버 시작 시 한 번).
+
+        StatsService가 집계하지 않는 버전(카탈로그에 없거나 버전 수 제한 초과)의 세트는 건너뜁니다.
+        """
+        data = self.scan(("version", "draftType", "team1Side", "winner", "slots"))
+        sets = len(data["slots"])
+        if not sets:
+            return 0
+        blue_won = (data["team1Side"] == 0) == (data["winner"] == 1)
+        champions = list(self.dictionaries["champion"].values)
+        versions = self.dictionaries["version"].values
+        draft_types = self.dictionaries["draftType"].values
+        groups = data["version"].astype(np.int64) * len(draft_types) + data["draftType"]
+        loaded = 0
+        for group in np.unique(groups):
+            version, draft_type = divmod(int(group), len(draft_types))
+            # 보관소 챔피언 사전 번호 → 통계 챔피언 ID (빈 슬롯과 집계하지 않는 챔피언은 -1)
+            champion_ids = stats_service.champion_ids(versions[version], champions)
+            if champion_ids is None:
+                continue
+            rows = np.flatnonzero(groups == group)
+            # 페이즈 번호가 열 번호가 되도록 0번 열 추가
+            slots = np.full((len(rows), len(DRAFT_PHASES) + 1), -1, dtype=np.intp)
+            slots[:, 1:] = champion_ids[data["slots"][rows]]
+            stats_service.record_sets(versions[version], draft_types[draft_type], slots, blue_won[rows])
+            loaded += len(rows)
+        return loaded
+
+    def add_to_snapshot(self, builder, exclude: Iterable[str] = (), chunk_rows: int = 10000, **filters) -> int:
+        """필터에 맞는 보관된 세트를 리포트 스냅샷(SnapshotBuilder)에 추가하고 추가한 세트 수를 반환합니다.
+
+        exclude의 게임은 아직 메모리에 있어 메모리에서 스냅샷에 넣으므로 제외합니다.
+        """
+        data = self.scan(tuple(COLUMNS), **filters)
+        excluded = []
+        for game_code in exclude:
+            try:
+                excluded.append(int(game_code, 16))
+            except ValueError:
+                continue
+        if excluded:
+            keep = ~np.isin(data["gameCode"], np.asarray(excluded, dtype=np.uint32))
+            data = {name: values[keep] for name, values in data.items()}
+
+        d = self.dictionaries
+        # 보관소 챔피언 사전 번호 → 스냅샷 챔피언 번호, 페이즈 번호가 슬롯 번호가 되도록 0번 슬롯 추가
+        champion_ids = np.fromiter((builder.champion_id(name) for name in list(d["champion"].values)),
+                                   dtype=np.uint16)
+        versions, draft_types, match_formats, teams = (
+            list(d[name].values) for name in ("version", "draftType", "matchFormat", "team"))
+        sides = ("blue", "red")
+        added = len(data["gameCode"])
+        for start in range(0, added, chunk_rows):
+            end = start + chunk_rows
+            slots = np.zeros((min(end, added) - start, SNAPSHOT_SLOTS), dtype=np.uint16)
+            slots[:, 1:] = champion_ids[data["slots"][start:end]]
+            columns = [data[name][start:end].tolist() for name in COLUMNS if name != "slots"]
+            builder.rows.extend(
+                (f"{game_code:08x}", versions[version], draft_types[draft_type], match_formats[match_format],
+                 teams[team1_name], teams[team2_name], set_number, sides[team1_side],
+                 "team1" if winner == 1 else "team2", row_slots.tobytes())
+                for (game_code, set_number, _, _, version, draft_type, match_format,
+                     team1_name, team2_name, team1_side, winner), row_slots in zip(zip(*columns), slots)
+            )
+            builder.flush()
+        return added
+
+    def iter_csv(self, chunk_rows: int = 10000, **filters) -> Iterator[str]:
+        """세트마다 한 줄인 CSV를 chunk_rows줄씩 만들어 반환 (리포트 CSV 열 + 생성/확정 시각)"""
+        data = self.scan(tuple(COLUMNS), **filters)
+        champions = np.asarray(self.dictionaries["champion"].values, dtype=object)
+        teams = self.dictionaries["team"].values
+        versions = self.dictionaries["version"].values
+        draft_types = self.dictionaries["draftType"].values
+        match_formats = self.dictionaries["matchFormat"].values
+        slot_columns = _phase_columns(BLUE_BAN_PHASES + RED_BAN_PHASES + BLUE_PICK_PHASES + RED_PICK_PHASES)
+
+        output = io.StringIO()
+        writer = csv.writer(output, lineterminator="\n")
+        writer.writerow(EXPORT_COLUMNS)
+        yield output.getvalue()
+
+        sides = ("blue", "red")
+        for start in range(0, len(data["gameCode"]), chunk_rows):
+            end = start + chunk_rows
+            output.seek(0)
+            output.truncate()
+            names = champions[data["slots"][start:end][:, slot_columns]].tolist()
+            for i, row in enumerate(zip(*(data[name][start:end].tolist() for name in COLUMNS if name != "slots"))):
+                game_code, set_number, created_at, finished_at, version, draft_type, match_format, \
+                    team1_name, team2_name, team1_side, winner = row
+                winner_side = sides[team1_side] if winner == 1 else sides[1 - team1_side]
+                writer.writerow(
+                    [f"{game_code:08x}", set_number, versions[version], draft_types[draft_type],
+                     match_formats[match_format], teams[team1_name], teams[team2_name],
+                     sides[team1_side], "team1" if winner == 1 else "team2", winner_side]
+                    + names[i] + [created_at, finished_at]
+                )
+            yield output.getvalue()
+
+    def metrics(self) -> dict:
+        size = 0
+        if self.opened:
+            size = sum(os.path.getsize(self._file(f"{name}.bin")) for name in COLUMNS)
+        return {
+            "enabled": self.enabled,
+            "rows": self.rows,
+            "pendingRows": self.pending_rows,
+            "bytes": size,
+            "bytesPerSet": round(size / self.rows, 1) if self.rows else None,
+            "dictionaries": {name: len(d.values) for name, d in self.dictionaries.items()},
+            "flushes": self.flushes,
+            "lastFlushMs": self.last_flush_ms,
+            "evictedGames": self.evicted,
+            "full": self.full,
+            "writeErrors": self.write_errors,
+            "retentionSeconds": self.retention_seconds,
+        }
@@ -0,0 +1,214 @@
+import time
+from collections import OrderedDict
+from typing import Dict, List, Optional, Sequence, Tuple
+import numpy as np
+from services.draft_phases import BAN_PHASES, BLUE_PICK_PHASES, RED_PICK_PHASES, side_of_phase
+from services.tracing import tracer
+
+PRIOR_GAMES = 10    # 표본이 적은 챔피언(조합)의 승률을 50%로 당기는 가상 경기 수
+MIN_SETS = 30       # 게임 버전의 세트가 이보다 적으면 모든 버전의 통계 사용
+MAX_TOP = 50
+CACHE_SIZE = 1024
+POOL_RETRY_SECONDS = 60  # 챔피언 목록을 불러오지 못한 버전을 다시 시도하기까지의 시간
+
+# 점수 = 가중치 × (승률 - 50%, 시너지, 상대 전적, 등장률) 의 합
+WEIGHTS = {"winRate": 1.0, "synergy": 1.0, "counter": 1.0, "presence": 0.25}
+
+
+def smoothed_edge(wins: np.ndarray, games: np.ndarray) -> np.ndarray:
+    """가상 경기를 더한 승률 - 50%"""
+    return ((wins + PRIOR_GAMES * 0.5) / (games + PRIOR_GAMES) - 0.5).astype(np.float32)
+
+
+class DraftModel:
+    """통계 집계에서 미리 계산한 추천용 배열 (챔피언 수 n)
+
+    synergy[c, a]: c와 a가 같은 팀일 때의 승률 - 50%
+    counter[c, e]: c가 e를 상대할 때의 승률 - 50%
+    """
+
+    def __init__(self, agg: dict, version: Optional[str], draft_type: Optional[str]):
+        vectors = agg["vectors"]
+        matrices = agg["matrices"]
+        sets = max(agg["sets"], 1)
+        self.version = version
+        self.draft_type = draft_type
+        self.sets = int(agg["sets"])
+        self.picks = vectors["picks"]
+        self.bans = vectors["bans"]
+        self.pick_rate = (vectors["picks"] / sets).astype(np.float32)
+        self.ban_rate = (vectors["bans"] / sets).astype(np.float32)
+        self.presence = self.pick_rate + self.ban_rate
+        self.win_rate = ((vectors["wins"] + PRIOR_GAMES * 0.5) / (vectors["picks"] + PRIOR_GAMES)).astype(np.float32)
+        self.edge = self.win_rate - 0.5
+        self.synergy = smoothed_edge(matrices["synergyWins"], matrices["synergyGames"])
+        self.counter = smoothed_edge(matrices["matchupWins"], matrices["matchupGames"])
+        self.active = (self.picks + self.bans) > 0
+
+    @property
+    def size(self) -> int:
+        return len(self.picks)
+
+
+class RecommendationService:
+    """진행 중인 드래프트의 밴/픽 추천
+
+    게임 버전의 챔피언 목록(ChampionCatalog)에서 선택 가능한 모든 챔피언의 점수를 numpy 배열 연산 한 번으로 계산합니다.
+    통계에 없는 챔피언은 승률 50%(사전 분포)만으로 점수를 매기며, 챔피언 목록을 불러오지 못하면
+    통계에 등장한 챔피언만 후보로 사용합니다.
+    추천 배열은 통계가 바뀔 때까지, 추천 결과는 (게임, 페이즈, 상태 버전)이 바뀔 때까지 재사용하므로
+    여러 관전자가 같은 페이즈에서 요청해도 계산은 한 번만 합니다.
+    """
+
+    def __init__(self, game_service, stats_service, catalog=None):
+        self.game_service = game_service
+        self.stats_service = stats_service
+        self.catalog = catalog  # 패치 버전별 챔피언 목록 (ChampionCatalog)
+        self.pool_retry_at: Dict[str, float] = {}
+        self.models: Dict[Tuple[Optional[str], Optional[str]], Tuple[int, DraftModel]] = {}
+        self.cache: "OrderedDict[Tuple[str, int, int, Optional[str]], dict]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def _model(self, version: Optional[str], draft_type: Optional[str]) -> DraftModel:
+        revision = self.stats_service.revision
+        cached = self.models.get((version, draft_type))
+        if cached and cached[0] == revision:
+            return cached[1]
+        model = DraftModel(self.stats_service.aggregate(version, draft_type), version, draft_type)
+        self.models[(version, draft_type)] = (revision, model)
+        return model
+
+    def _select_model(self, version: str, draft_type: str) -> DraftModel:
+        """표본이 충분한 가장 좁은 범위의 통계 선택 (버전+드래프트 방식 → 드래프트 방식 → 전체)"""
+        model = None
+        for scope in ((version, draft_type), (None, draft_type), (None, None)):
+            model = self._model(*scope)
+            if model.sets >= MIN_SETS:
+                break
+        return model
+
+    async def champion_pool(self, version: str) -> Optional[Tuple[str, ...]]:
+        """게임 버전의 전체 챔피언 ID 목록 (불러오지 못하면 None)"""
+        if self.catalog is None:
+            return None
+        # 불러오지 못한 버전은 잠시 다시 시도하지 않음 (요청마다 Data Dragon 시간 초과를 기다리지 않도록)
+        if time.monotonic() < self.pool_retry_at.get(version, 0):
+            return None
+        try:
+            index = await self.catalog.get_index(version)
+        except Exception as e:
+            self.pool_retry_at[version] = time.monotonic() + POOL_RETRY_SECONDS
+            print(f"Error loading champion catalog {version} for recommendations: {e}")
+            return None
+        return tuple(index.positions)
+
+    def _ids(self, names, size: int) -> List[int]:
+        ids = []
+        for name in names:
+            champion_id = self.stats_service.champions.get((name or "").strip())
+            if champion_id is not None and champion_id < size:
+                ids.append(champion_id)
+        return ids
+
+    @tracer.traced('RecommendationService.recommend')
+    def recommend(self, game_code: str, top: int = 10, pool: Optional[Sequence[str]] = None) -> dict:
+        """현재 페이즈에서 행동할 진영의 밴/픽 추천 (점수 높은 순). pool은 후보 챔피언 전체 (champion_pool)"""
+        game_settings = self.game_service.game_settings.get(game_code)
+        game_status = self.game_service.game_status.get(game_code)
+        if not game_settings or not game_status:
+            raise ValueError("게임을 찾을 수 없습니다.")
+        phase = game_status.phase
+        if not 1 <= phase <= 20:
+            raise ValueError("드래프트가 진행 중일 때만 추천할 수 있습니다.")
+
+        key = (game_code, phase, game_status.stateVersion, game_settings.version if pool is not None else None)
+        cached = self.cache.get(key)
+        if cached is not None:
+            self.hits += 1
+            self.cache.move_to_end(key)
+        else:
+            self.misses += 1
+            cached = self._score(game_code, game_settings, game_status, pool)
+            self.cache[key] = cached
+            if len(self.cache) > CACHE_SIZE:
+                self.cache.popitem(last=False)
+        return {**cached, "recommendations": cached["recommendations"][:top]}
+
+    def _score(self, game_code: str, game_settings, game_status, pool: Optional[Sequence[str]]) -> dict:
+        phase = game_status.phase
+        side = side_of_phase(phase)
+        action = "ban" if phase in BAN_PHASES else "pick"
+        model = self._select_model(game_settings.version, game_settings.draftType)
+        size = model.size
+        names = self.stats_service.champions.names
+
+        # 이번 세트에서 확정된 양 팀 픽
+        phase_data = game_status.phaseData
+        blue_picks = [phase_data[p] for p in BLUE_PICK_PHASES if p < phase]
+        red_picks = [phase_data[p] for p in RED_PICK_PHASES if p < phase]
+        allies = self._ids(blue_picks if side == "blue" else red_picks, size)
+        enemies = self._ids(red_picks if side == "blue" else blue_picks, size)
+
+        # 후보 챔피언 → 통계 배열 위치 (통계에 없는 챔피언은 값이 사전 분포뿐인 마지막 위치 size)
+        catalog = pool is not None
+        if not catalog:
+            pool = [names[c] for c in np.flatnonzero(model.active)]
+        champion_ids = self.stats_service.champions.ids
+        slots = np.fromiter((champion_ids.get(name, size) for name in pool), dtype=np.intp, count=len(pool))
+        slots[slots > size] = size
+        unavailable = self.game_service.get_unavailable_champions(game_code)
+        legal = np.fromiter((name not in unavailable for name in pool), dtype=bool, count=len(pool))
+
+        def mean_columns(matrix: np.ndarray, columns: List[int]) -> np.ndarray:
+            if not columns:
+                return np.zeros(size, dtype=np.float32)
+            return matrix[:, columns].mean(axis=1)
+
+        if action == "pick":
+            # 우리 팀 픽과의 시너지, 상대 팀 픽에 대한 상대 전적
+            synergy = mean_columns(model.synergy, allies)
+            counter = mean_columns(model.counter, enemies)
+        else:
+            # 상대 팀이 가져갔을 때의 가치: 상대 팀 픽과의 시너지, 우리 팀 픽에 대한 상대 전적
+            synergy = mean_columns(model.synergy, enemies)
+            counter = mean_columns(model.counter, allies)
+
+        scores = (WEIGHTS["winRate"] * model.edge + WEIGHTS["synergy"] * synergy
+                  + WEIGHTS["counter"] * counter + WEIGHTS["presence"] * model.presence)
+
+        def padded(values: np.ndarray, prior: float = 0.0) -> np.ndarray:
+            """후보 순서로 값을 모음 (통계에 없는 챔피언은 prior)"""
+            return np.append(values, np.float32(prior))[slots]
+
+        scores = padded(scores)
+        candidates = np.flatnonzero(legal)
+        order = candidates[np.argsort(-scores[candidates], kind="stable")][:MAX_TOP]
+        win_rate = padded(model.win_rate, 0.5)
+        pick_rate = padded(model.pick_rate)
+        ban_rate = padded(model.ban_rate)
+        synergy = padded(synergy)
+        counter = padded(counter)
+        games = padded(model.picks)
+
+        team = "team1" if game_status.team1Side == side else "team2"
+        return {
+            "gameCode": game_code,
+            "phase": phase,
+            "stateVersion": game_status.stateVersion,
+            "action": action,
+            "side": side,
+            "team": team,
+            "basedOn": {"version": model.version, "draftType": model.draft_type, "sets": model.sets,
+                        "catalog": catalog},
+            "recommendations": [{
+                "champion": pool[c],
+                "score": round(float(scores[c]), 4),
+                "winRate": round(float(win_rate[c]), 4),
+                "pickRate": round(float(pick_rate[c]), 4),
+                "banRate": round(float(ban_rate[c]), 4),
+                "synergy": round(float(synergy[c]), 4),
+                "counter": round(float(counter[c]), 4),
+                "games": int(games[c]),
+            } for c in order],
+        }
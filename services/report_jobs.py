@@ -0,0 +1,168 @@
+# 리포트 작업 프로세스에서 실행되는 함수
+# 작업 프로세스가 가져오는 모듈이므로 FastAPI, numpy 등 무거운 모듈을 가져오지 않습니다.
+# 작업 함수는 세트 결과 스냅샷(bytes)만 받아 결과를 반환하는 순수 함수입니다.
+import csv
+import io
+import pickle
+from array import array
+from collections import Counter
+from typing import Iterator, List, Tuple
+
+from services.draft_phases import BLUE_BAN_PHASES, BLUE_PICK_PHASES, RED_BAN_PHASES, RED_PICK_PHASES
+
+SNAPSHOT_FORMAT = 1
+SLOT_COUNT = 21  # phaseData[0..20]
+MAX_CHAMPIONS = 1 << 16  # 슬롯은 2바이트 번호(array "H")로 저장
+
+# 세트 한 줄: (gameCode, version, draftType, matchFormat, team1Name, team2Name,
+#             setNumber, team1Side, winner, 슬롯별 챔피언 번호 배열(bytes))
+SetRow = Tuple[str, str, str, str, str, str, int, str, str, bytes]
+
+
+class SnapshotBuilder:
+    """세트 결과를 챔피언 이름 사전과 정수 배열로 압축한 불변 스냅샷으로 변환
+
+    챔피언 이름은 한 번만 저장하고 세트마다 21개 슬롯을 2바이트 번호로 보관하므로,
+    작업 프로세스로 보내는 크기가 게임 객체를 그대로 직렬화할 때보다 훨씬 작습니다.
+    행은 flush할 때마다 묶음 단위로 직렬화해 두므로 한 번에 오래 걸리는 직렬화가 없습니다.
+    """
+
+    def __init__(self):
+        self.champions: List[str] = [""]  # 0번은 빈 슬롯
+        self.ids = {"": 0}
+        self.rows: List[SetRow] = []
+        self.chunks: List[bytes] = []
+
+    def champion_id(self, champion: str) -> int:
+        champion_id = self.ids.get(champion)
+        if champion_id is None:
+            if len(self.champions) >= MAX_CHAMPIONS:
+                raise ValueError(f"리포트에 포함된 챔피언 종류가 너무 많습니다 (최대 {MAX_CHAMPIONS}개)")
+            champion_id = self.ids[champion] = len(self.champions)
+            self.champions.append(champion)
+        return champion_id
+
+    def _encode_slots(self, phase_data: List[str]) -> bytes:
+        ids = self.ids
+        codes = [ids.get(champion) for champion in phase_data[:SLOT_COUNT]]
+        if None in codes:
+            for slot, champion in enumerate(phase_data[:SLOT_COUNT]):
+                if codes[slot] is None:
+                    codes[slot] = self.champion_id(champion)
+        codes.extend([0] * (SLOT_COUNT - len(codes)))
+        return array("H", codes).tobytes()
+
+    def add(self, game_code: str, settings, status, set_number: int, set_result):
+        self.rows.append((
+            game_code, settings.version, settings.draftType, settings.matchFormat,
+            status.team1Name, status.team2Name, set_number,
+            set_result.team1Side, set_result.winner, self._encode_slots(set_result.phaseData),
+        ))
+
+    def flush(self):
+        if self.rows:
+            self.chunks.append(pickle.dumps(self.rows, protocol=pickle.HIGHEST_PROTOCOL))
+            self.rows = []
+
+    def build(self) -> bytes:
+        self.flush()
+        return pickle.dumps((SNAPSHOT_FORMAT, tuple(self.champions), tuple(self.chunks)),
+                            protocol=pickle.HIGHEST_PROTOCOL)
+
+
+def load_snapshot(snapshot: bytes) -> Tuple[Tuple[str, ...], Iterator[SetRow]]:
+    """챔피언 이름 목록과 세트 행 이터레이터 반환 (행은 묶음 단위로 복원)"""
+    snapshot_format, champions, chunks = pickle.loads(snapshot)
+    if snapshot_format != SNAPSHOT_FORMAT:
+        raise ValueError(f"지원하지 않는 스냅샷 형식입니다: {snapshot_format}")
+    return champions, (row for chunk in chunks for row in pickle.loads(chunk))
+
+
+def _slots(row: SetRow) -> array:
+    codes = array("H")
+    codes.frombytes(row[9])
+    return codes
+
+
+CSV_COLUMNS = (
+    ["gameCode", "setNumber", "version", "draftType", "matchFormat", "team1Name", "team2Name",
+     "team1Side", "winner", "winnerSide"]
+    + [f"blueBan{i + 1}" for i in range(len(BLUE_BAN_PHASES))]
+    + [f"redBan{i + 1}" for i in range(len(RED_BAN_PHASES))]
+    + [f"bluePick{i + 1}" for i in range(len(BLUE_PICK_PHASES))]
+    + [f"redPick{i + 1}" for i in range(len(RED_PICK_PHASES))]
+)
+
+
+def sets_csv(snapshot: bytes) -> str:
+    """세트마다 한 줄인 CSV (진영별 밴/픽 순서대로)"""
+    champions, rows = load_snapshot(snapshot)
+    output = io.StringIO()
+    writer = csv.writer(output, lineterminator="\n")
+    writer.writerow(CSV_COLUMNS)
+    for row in rows:
+        game_code, version, draft_type, match_format, team1_name, team2_name, set_number, team1_side, winner, _ = row
+        slots = _slots(row)
+        team2_side = "red" if team1_side == "blue" else "blue"
+        writer.writerow(
+            [game_code, set_number, version, draft_type, match_format, team1_name, team2_name,
+             team1_side, winner, team1_side if winner == "team1" else team2_side]
+            + [champions[slots[phase]] for phase in BLUE_BAN_PHASES]
+            + [champions[slots[phase]] for phase in RED_BAN_PHASES]
+            + [champions[slots[phase]] for phase in BLUE_PICK_PHASES]
+            + [champions[slots[phase]] for phase in RED_PICK_PHASES]
+        )
+    return output.getvalue()
+
+
+def summary(snapshot: bytes, top: int = 10) -> dict:
+    """세트 수, 진영 승률, 형식별 분포, 많이 픽/밴된 챔피언 요약"""
+    champions, rows = load_snapshot(snapshot)
+    games = set()
+    blue_side_wins = 0
+    by_draft_type: Counter = Counter()
+    by_match_format: Counter = Counter()
+    by_version: Counter = Counter()
+    picks: Counter = Counter()
+    bans: Counter = Counter()
+    wins: Counter = Counter()
+    for row in rows:
+        games.add(row[0])
+        by_version[row[1]] += 1
+        by_draft_type[row[2]] += 1
+        by_match_format[row[3]] += 1
+        team1_side, winner = row[7], row[8]
+        blue_won = (team1_side == "blue") == (winner == "team1")
+        blue_side_wins += blue_won
+        slots = _slots(row)
+        for phase in BLUE_BAN_PHASES + RED_BAN_PHASES:
+            if slots[phase]:
+                bans[slots[phase]] += 1
+        for phases, won in ((BLUE_PICK_PHASES, blue_won), (RED_PICK_PHASES, not blue_won)):
+            for phase in phases:
+                if slots[phase]:
+                    picks[slots[phase]] += 1
+                    if won:
+                        wins[slots[phase]] += 1
+
+    sets = sum(by_version.values())
+    presence = picks + bans
+    return {
+        "games": len(games),
+        "sets": sets,
+        "averageSetsPerGame": round(sets / len(games), 2) if games else 0,
+        "blueSideWins": blue_side_wins,
+        "blueSideWinRate": round(blue_side_wins / sets, 4) if sets else 0,
+        "byVersion": dict(by_version),
+        "byDraftType": dict(by_draft_type),
+        "byMatchFormat": dict(by_match_format),
+        "topPicks": [
+            {"champion": champions[c], "picks": n, "wins": wins[c], "winRate": round(wins[c] / n, 4)}
+            for c, n in picks.most_common(top)
+        ],
+        "topBans": [{"champion": champions[c], "bans": n} for c, n in bans.most_common(top)],
+        "topPresence": [
+            {"champion": champions[c], "presence": n, "rate": round(n / sets, 4)}
+            for c, n in presence.most_common(top)
+        ],
+    }
@@ -0,0 +1,201 @@
+import asyncio
+import contextlib
+import multiprocessing
+import os
+import signal
+import time
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Callable, Iterable, Optional
+
+from services.report_jobs import SnapshotBuilder
+
+
+class ReportQueueFull(Exception):
+    """대기 중인 리포트 작업이 한도를 넘음"""
+
+
+class ReportTimeout(Exception):
+    """작업 프로세스가 제한 시간 안에 작업을 끝내지 못해 스스로 중단함
+
+    asyncio.TimeoutError(3.11부터 TimeoutError와 같음)와 구분해야 풀 전체를 정리하지 않으므로 별도 예외로 둠
+    """
+
+
+class _Deadline(Exception):
+    pass
+
+
+def _raise_deadline(signum, frame):
+    raise _Deadline()
+
+
+def _run_with_deadline(func: Callable, timeout: float, *args):
+    """작업 프로세스 안에서 제한 시간이 지나면 작업을 중단 (SIGALRM을 지원하는 플랫폼)"""
+    if not hasattr(signal, "setitimer"):
+        return func(*args)
+    signal.signal(signal.SIGALRM, _raise_deadline)
+    signal.setitimer(signal.ITIMER_REAL, timeout)
+    try:
+        return func(*args)
+    except _Deadline:
+        raise ReportTimeout(f"리포트 작업이 {timeout:g}초 안에 끝나지 않았습니다.")
+    finally:
+        signal.setitimer(signal.ITIMER_REAL, 0)
+
+
+class ReportPool:
+    """리포트, 내보내기, 집계 작업을 별도 프로세스에서 실행하는 작업 풀
+
+    CPU를 많이 쓰는 작업을 이벤트 루프에서 실행하면 같은 프로세스의 모든 드래프트가 멈추므로,
+    게임 결과를 압축한 불변 스냅샷(bytes)만 작업 프로세스로 보내 계산합니다.
+    대기 중인 작업 수와 작업별 실행 시간을 제한합니다.
+    """
+
+    def __init__(self, workers: Optional[int] = None, max_pending: Optional[int] = None,
+                 timeout_seconds: Optional[float] = None):
+        self.workers = workers or int(os.getenv("REPORT_WORKERS", "2"))
+        self.max_pending = max_pending or int(os.getenv("REPORT_MAX_PENDING", str(self.workers * 4)))
+        self.timeout_seconds = timeout_seconds or float(os.getenv("REPORT_TIMEOUT_SECONDS", "30"))
+        self.executor: Optional[ProcessPoolExecutor] = None
+        self.start_lock = asyncio.Lock()
+        self.pending = 0
+        self.completed = 0
+        self.failed = 0
+        self.timed_out = 0
+        self.rejected = 0
+        self.last_duration_ms: Optional[float] = None
+
+    def _start(self) -> ProcessPoolExecutor:
+        # 스레드가 있는 서버 프로세스를 fork하지 않도록 forkserver(없으면 spawn) 사용
+        if "forkserver" in multiprocessing.get_all_start_methods():
+            context = multiprocessing.get_context("forkserver")
+            # 실행 스크립트(__main__) 대신 작업 모듈만 미리 불러옴
+            context.set_forkserver_preload(["services.report_jobs"])
+        else:
+            context = multiprocessing.get_context("spawn")
+        executor = ProcessPoolExecutor(max_workers=self.workers, mp_context=context)
+        # 작업 프로세스를 미리 모두 띄워 두어 이후 작업 제출이 프로세스 생성을 기다리지 않도록 함
+        for future in [executor.submit(int) for _ in range(self.workers)]:
+            future.result()
+        return executor
+
+    async def _get_executor(self) -> ProcessPoolExecutor:
+        async with self.start_lock:
+            if self.executor is None:
+                # 프로세스 생성은 이벤트 루프를 막으므로 별도 스레드에서 실행
+                self.executor = await asyncio.to_thread(self._start)
+        return self.executor
+
+    def _reset(self):
+        """응답하지 않는 작업 프로세스를 정리하고 다음 작업에서 풀을 새로 만듦"""
+        executor, self.executor = self.executor, None
+        if executor is None:
+            return
+        for process in list(getattr(executor, "_processes", {}).values()):
+            process.terminate()
+        executor.shutdown(wait=False, cancel_futures=True)
+
+    @contextlib.contextmanager
+    def reserve(self):
+        """작업 자리를 확보 (스냅샷처럼 비용이 큰 준비 작업 전에 한도를 먼저 확인하도록)
+
+        대기 중인 작업이 max_pending개 이상이면 ReportQueueFull을 발생시키며, 블록이 끝나면 자리를 반환합니다.
+        """
+        if self.pending >= self.max_pending:
+            self.rejected += 1
+            raise ReportQueueFull("처리 중인 리포트 작업이 너무 많습니다. 잠시 후 다시 시도해주세요.")
+        self.pending += 1
+        try:
+            yield
+        finally:
+            self.pending -= 1
+
+    async def run(self, func: Callable, *args):
+        """작업 자리를 확보하고 작업 프로세스에서 func(*args)를 실행한 결과를 반환 (reserve + execute)"""
+        with self.reserve():
+            return await self.execute(func, *args)
+
+    async def execute(self, func: Callable, *args):
+        """reserve()로 확보한 자리에서 func(*args)를 작업 프로세스로 실행하고 결과를 반환
+
+        timeout_seconds 안에 끝나지 않으면 asyncio.TimeoutError를 발생시킵니다.
+        """
+        started = time.perf_counter()
+        loop = asyncio.get_running_loop()
+        try:
+            executor = await self._get_executor()
+            future = loop.run_in_executor(executor, _run_with_deadline,
+                                          func, self.timeout_seconds, *args)
+            # 대기열에서 기다린 시간까지 포함하며, 작업 프로세스가 스스로 멈추지 못하면 풀을 정리
+            result = await asyncio.wait_for(future, self.timeout_seconds + 5)
+            self.completed += 1
+            return result
+        except ReportTimeout as e:
+            # 작업 프로세스가 스스로 중단했으므로 다른 작업이 실행 중인 풀은 그대로 둠
+            self.timed_out += 1
+            raise asyncio.TimeoutError(str(e))
+        except asyncio.TimeoutError:
+            # wait_for가 만료됨: 작업 프로세스가 멈추지 못했으므로 풀을 정리
+            self.timed_out += 1
+            self._reset()
+            raise
+        except BrokenProcessPool:
+            self.failed += 1
+            self._reset()
+            raise
+        except Exception:
+            self.failed += 1
+            raise
+        finally:
+            self.last_duration_ms = round((time.perf_counter() - started) * 1000, 2)
+
+    def metrics(self) -> dict:
+        return {
+            "workers": self.workers,
+            "running": self.executor is not None,
+            "pending": self.pending,
+            "maxPending": self.max_pending,
+            "timeoutSeconds": self.timeout_seconds,
+            "completed": self.completed,
+            "failed": self.failed,
+            "timedOut": self.timed_out,
+            "rejected": self.rejected,
+            "lastDurationMs": self.last_duration_ms,
+        }
+
+    def shutdown(self):
+        if self.executor is not None:
+            self.executor.shutdown(wait=False, cancel_futures=True)
+            self.executor = None
+
+
+async def snapshot_results(game_service, codes: Iterable[str], version: Optional[str] = None,
+                           chunk_size: int = 64, archive_filters: Optional[dict] = None) -> bytes:
+    """게임들의 세트 결과를 리포트 작업용 스냅샷으로 변환
+
+    게임 상태는 이벤트 루프에서만 읽을 수 있으므로 여기서 복사하되,
+    chunk_size개 게임마다 그동안 모은 행을 직렬화하고 다른 작업에 실행을 양보합니다.
+    archive_filters를 주면 메모리에서 제거된 게임의 세트도 보관소에서 읽어 별도 스레드에서 추가합니다.
+    """
+    builder = SnapshotBuilder()
+    included = set()
+    for count, game_code in enumerate(codes, 1):
+        game_result = game_service.game_results.get(game_code)
+        settings = game_service.game_settings.get(game_code)
+        if game_result and settings and (version is None or settings.version == version):
+            status = game_service.game_status[game_code]
+            for set_number, set_result in enumerate(game_result.results, 1):
+                builder.add(game_code, settings, status, set_number, set_result)
+            included.add(game_code)
+        if count % chunk_size == 0:
+            builder.flush()
+            await asyncio.sleep(0)
+
+    archive = game_service.archive
+    if archive_filters is not None and archive is not None and archive.enabled:
+        builder.flush()
+        # 아직 메모리에 있는 게임은 위에서 넣었거나 필터에 맞지 않으므로 보관소에서는 제외
+        exclude = included | set(game_service.games)
+        await asyncio.to_thread(archive.add_to_snapshot, builder, exclude, version=version, **archive_filters)
+    return builder.build()
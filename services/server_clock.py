@@ -0,0 +1,70 @@
+import os
+import time
+from typing import Dict, Optional
+
+
+class ServerClock:
+    """시작할 때 한 번 벽시계에 맞춘 단조 시계 (마이크로초)
+
+    time.time()은 NTP 보정이나 수동 변경으로 앞뒤로 건너뛸 수 있으므로,
+    이벤트 타임스탬프는 시작 시점의 벽시계 + 단조 시계 경과 시간으로 만듭니다.
+    """
+
+    def __init__(self):
+        self.wall_anchor_us = time.time_ns() // 1000
+        self.monotonic_anchor_ns = time.monotonic_ns()
+
+    def now_us(self) -> int:
+        return self.wall_anchor_us + (time.monotonic_ns() - self.monotonic_anchor_ns) // 1000
+
+    def wall_drift_us(self) -> int:
+        """현재 벽시계와 서버 시계의 차이 (양수면 벽시계가 앞섬)"""
+        return time.time_ns() // 1000 - self.now_us()
+
+
+class RttTracker:
+    """연결별 왕복 시간(RTT) 추정치
+
+    클라이언트가 clock_sync로 측정해 보고한 RTT를 지수 이동 평균으로 보관합니다.
+    비정상적으로 큰 값은 max_rtt_ms로 잘라내므로 유예 시간을 과하게 늘릴 수 없습니다.
+    """
+
+    def __init__(self, alpha: float = 0.2):
+        self.alpha = alpha
+        self.max_rtt_ms = float(os.getenv("CLOCK_MAX_RTT_MS", "2000"))
+        self.grace_base_ms = float(os.getenv("DEADLINE_GRACE_BASE_MS", "50"))
+        self.grace_max_ms = float(os.getenv("DEADLINE_GRACE_MAX_MS", "500"))
+        self.estimates: Dict[str, float] = {}
+
+    def record(self, sid: str, rtt_ms: float) -> float:
+        rtt_ms = min(max(float(rtt_ms), 0.0), self.max_rtt_ms)
+        previous = self.estimates.get(sid)
+        estimate = rtt_ms if previous is None else previous + self.alpha * (rtt_ms - previous)
+        self.estimates[sid] = estimate
+        return estimate
+
+    def get(self, sid: str) -> Optional[float]:
+        return self.estimates.get(sid)
+
+    def drop(self, sid: str):
+        self.estimates.pop(sid, None)
+
+    def grace_ms(self, sid: str) -> float:
+        """마감 시간 판정에 더할 유예 시간 (편도 지연 추정치 + 기본 여유, 최대 grace_max_ms)"""
+        rtt_ms = self.estimates.get(sid)
+        one_way_ms = rtt_ms / 2 if rtt_ms is not None else self.max_rtt_ms / 4
+        return min(self.grace_base_ms + one_way_ms, self.grace_max_ms)
+
+    def metrics(self) -> dict:
+        values = sorted(self.estimates.values())
+        if not values:
+            return {"connections": 0, "p50Ms": None, "p95Ms": None, "maxMs": None}
+        return {
+            "connections": len(values),
+            "p50Ms": round(values[len(values) // 2], 2),
+            "p95Ms": round(values[min(len(values) - 1, int(len(values) * 0.95))], 2),
+            "maxMs": round(values[-1], 2),
+        }
+
+
+server_clock = ServerClock()
@@ -1,9 +1,22 @@
+import os
 import socketio
-import time
 import logging
 import asyncio
+import time
 from typing import Dict, List
 from models import Client
+from socketio.exceptions import ConnectionRefusedError
+from services.admission import AdmissionController, AdmissionError
+from services.command_window import CommandWindow
+from services.draft_phases import PICK_PHASES
+from services.event_stream import EventStreamHub
+from services.game_actor import GameActorRegistry
+from services.game_membership import GameMembership
+from services.game_timeline import CONFIRM, RESULT, SELECT
+from services.spectator_service import SpectatorChannel
+from services.server_clock import RttTracker, server_clock
+from services.tracing import tracer
+from services.transport_profiles import get_transport_profile
 
 # Configure logging
 logging.basicConfig(level=logging.DEBUG)  # Change to DEBUG for more detailed logs
@@ -11,20 +24,37 @@ logger = logging.getLogger(__name__)
 
 class SocketService:
     def __init__(self):
-        # Simplified Socket.IO server configuration
+        # 전송 방식, 하트비트, 메시지 크기, 압축은 SOCKET_TRANSPORT_PROFILE로 선택
+        # (배너 이미지는 /assets로 업로드하므로 큰 메시지가 필요 없음)
+        self.transport_profile = get_transport_profile()
         self.sio = socketio.AsyncServer(
             async_mode='asgi',
             cors_allowed_origins='*',
             logger=True,
             engineio_logger=True,
-            ping_interval=25,
-            ping_timeout=60,
-            max_http_buffer_size=1e8
+            **self.transport_profile.server_options()
         )
         self.clients: Dict[str, Client] = {}
+        self.game_clients: Dict[str, Dict[str, Client]] = {}  # 게임 방에 들어간 플레이어(및 호스트)
+        self.membership = GameMembership()  # 게임별 입장 순서와 호스트
+        spectator_delay = float(os.getenv("SPECTATOR_DELAY_SECONDS", "0"))
+        self.spectators = SpectatorChannel(self.sio, delay_seconds=spectator_delay)
+        self.event_stream = EventStreamHub(delay_seconds=spectator_delay)  # SSE 구독자용 이벤트 스트림 (관전자와 같은 지연)
+        self.command_window = CommandWindow()  # 게임별 최근 명령 ID와 응답
+        self.actors = GameActorRegistry()  # 게임별 명령 처리 메일박스
         self.socket_id_map = {}  # 이전 소켓 ID와 새로운 소켓 ID 매핑
+        self.handoff_seats: Dict[str, Dict[str, dict]] = {}  # 재시작 전 자리 정보 (게임 코드 → 닉네임 → 자리)
+        # 재시작 전 자리를 보관하는 시간. 지나면 남은 자리를 버리고 호스트가 없는 게임은 다음 참가자가 호스트가 됨
+        self.handoff_seat_grace = float(os.getenv("HANDOFF_SEAT_GRACE_SECONDS", "60"))
+        self.handoff_expires_at = 0.0
+        self._handoff_expiry_task = None
+        self.draining = False  # 종료 준비 중에는 게임 상태 변경 명령을 받지 않음
+        self.admission = AdmissionController()  # 연결/참가 수 한도와 과부하 시 부하 차단
+        self.rtt = RttTracker()  # clock_sync로 측정한 연결별 왕복 시간
         # Need to have access to game_service
         self.game_service = None
+        self.stats_service = None  # 세트 결과 통계 집계
+        self.webhooks = None  # 게임 결과 웹훅 디스패처
 
     def _validate_position(self, position: str, game_code: str) -> bool:
         """Validate position against game settings"""
@@ -51,8 +81,8 @@ class SocketService:
             return True
             
         return not any(
-            client.get('position') == position and client.get('gameCode') == game_code
-            for client in self.clients.values()
+            client.get('position') == position
+            for client in self.game_clients.get(game_code, {}).values()
         )
 
     def _is_clients_turn(self, client: dict, phase: int, player_type: str) -> bool:
@@ -115,8 +145,8 @@ class SocketService:
     def _are_all_players_ready(self, game_code: str, player_type: str) -> bool:
         """Check if all required positions are filled and ready"""
         game_clients = [
-            client for client in self.clients.values()
-            if client.get('gameCode') == game_code and client.get('position') != 'spectator'
+            client for client in self.game_clients.get(game_code, {}).values()
+            if client.get('position') != 'spectator'
         ]
 
         if player_type == "1v1":
@@ -132,14 +162,124 @@ class SocketService:
         # Re-use existing turn validation logic
         return self._is_clients_turn(client, phase, player_type)
 
-    def _get_timestamp(self) -> int:
-        """Generate a reliable timestamp in microseconds"""
+    def _is_spectator_viewer(self, sid: str, game_code: str) -> bool:
+        """관전자 채널에 등록된 클라이언트인지 확인"""
+        return sid in self.spectators.viewers.get(game_code, {})
+
+    async def _enter_game_room(self, sid: str, game_code: str):
+        """플레이어(또는 호스트)를 게임 방에 등록"""
+        self.spectators.remove(game_code, sid)
+        self.game_clients.setdefault(game_code, {})[sid] = self.clients[sid]
+        await self.sio.enter_room(sid, game_code)
+
+    async def _enter_spectator_channel(self, sid: str, game_code: str):
+        """관전자를 게임 방 대신 관전자 채널에 등록"""
+        members = self.game_clients.get(game_code)
+        if members and members.pop(sid, None) is not None:
+            await self.sio.leave_room(sid, game_code)
+            if not members:
+                del self.game_clients[game_code]
+        self.spectators.add(game_code, sid)
+
+    async def _leave_game(self, sid: str, game_code: str) -> bool:
+        """게임에서 클라이언트 제거. 게임 방 멤버였으면 True 반환"""
+        self.membership.leave(game_code, sid)
+        if self.spectators.remove(game_code, sid):
+            return False
+        members = self.game_clients.get(game_code)
+        if members and members.pop(sid, None) is not None:
+            if not members:
+                del self.game_clients[game_code]
+            await self.sio.leave_room(sid, game_code)
+            return True
+        return False
+
+    async def _leave_previous_game(self, sid: str, game_code: str):
+        """다른 게임으로 옮겨 가는 클라이언트를 이전 게임에서 내보내고 필요하면 호스트 이전"""
         try:
-            return int(time.time() * 1000000)
-        except (ValueError, TypeError) as e:
-            logger.error(f"Error generating timestamp: {e}")
-            # Fallback to a simpler timestamp format (milliseconds)
-            return int(time.time() * 1000)
+            await self._leave_game(sid, game_code)
+            await self._migrate_host(game_code)
+        except Exception as e:
+            print(f"Error leaving previous game {game_code}: {e}")
+
+    async def _migrate_host(self, game_code: str):
+        """호스트가 나간 게임에서 가장 먼저 들어온 참가자를 호스트로 지정하고 알림"""
+        new_host = self.membership.promote(game_code)
+        if not new_host or new_host not in self.clients:
+            return
+        client = self.clients[new_host]
+        client['isHost'] = True
+        # 관전자 채널에 있던 참가자도 호스트는 게임 방 이벤트를 받아야 함
+        if self._is_spectator_viewer(new_host, game_code):
+            await self._enter_game_room(new_host, game_code)
+
+        await self.sio.emit('host_changed', {
+            'gameCode': game_code,
+            'nickname': client.get('nickname'),
+            'position': client.get('position'),
+            'clientId': new_host,
+            'timestamp': self._get_timestamp()
+        }, room=game_code)
+        print(f"{client.get('nickname')} is now the host of game {game_code}")
+
+    def get_members(self, game_code: str) -> List[Client]:
+        """관전자를 포함한 게임 참가자를 입장 순서대로 반환"""
+        return [self.clients[sid] for sid in self.membership.members(game_code) if sid in self.clients]
+
+    async def _broadcast(self, event: str, data: dict, game_code: str):
+        """게임 방, 관전자 채널, SSE 구독자에게 이벤트 전송"""
+        with tracer.span('emit', **{'emit.event': event, 'game.code': game_code}):
+            await self.sio.emit(event, data, room=game_code)
+            await self.spectators.broadcast(game_code, event, data)
+            self.event_stream.publish(game_code, event, data)
+
+    def _publish_webhook(self, game_code: str, event: str, data: dict, game_status, set_result):
+        """웹훅 구독자에게 세트 결과를 전달 (큐에 넣기만 하고 전송은 백그라운드에서)"""
+        if not self.webhooks:
+            return
+        self.webhooks.publish(game_code, event, {
+            **data,
+            'setNumber': game_status.setNumber,
+            'team1Name': game_status.team1Name,
+            'team2Name': game_status.team2Name,
+            'setResult': set_result.model_dump()
+        })
+
+    @tracer.traced('validate.command')
+    def _check_command(self, game_code: str, game_status, data: dict):
+        """명령 ID 중복 및 기대 상태(expectedPhase/expectedVersion) 확인"""
+        data = data or {}
+        cached = self.command_window.get(game_code, data.get('commandId'))
+        if cached:
+            return cached
+
+        expected_phase = data.get('expectedPhase')
+        expected_version = data.get('expectedVersion')
+        if (expected_phase is not None and expected_phase != game_status.phase) or \
+                (expected_version is not None and expected_version != game_status.stateVersion):
+            return {
+                "status": "error",
+                "code": "STALE_STATE",
+                "message": "게임 상태가 이미 변경되었습니다.",
+                "phase": game_status.phase,
+                "stateVersion": game_status.stateVersion
+            }
+        return None
+
+    def _command_ack(self, game_code: str, game_status, data: dict, message: str) -> dict:
+        """성공 응답을 만들고 명령 ID와 함께 저장"""
+        ack = {
+            "status": "success",
+            "message": message,
+            "phase": game_status.phase,
+            "stateVersion": game_status.stateVersion
+        }
+        self.command_window.remember(game_code, (data or {}).get('commandId'), ack)
+        return ack
+
+    def _get_timestamp(self) -> int:
+        """서버 시계 기준 타임스탬프 (마이크로초, 벽시계가 바뀌어도 뒤로 가지 않음)"""
+        return server_clock.now_us()
 
     def _is_final_set(self, game_result, match_format: str) -> bool:
         """마지막 세트인지 확인"""
@@ -151,21 +291,50 @@ class SocketService:
             return game_result.team1Score >= 3 or game_result.team2Score >= 3
         return False
 
+    def _extract_set_picks(self, phase_data: List[str]) -> List[str]:
+        """하드피어리스: phaseData에서 픽 페이즈(7-12, 17-20)의 챔피언만 추출"""
+        current_set_picks = []
+        for phase_idx in PICK_PHASES:  # phaseData의 인덱스 = 페이즈 번호
+            if phase_idx < len(phase_data) and phase_data[phase_idx]:
+                champion = phase_data[phase_idx]
+                if champion and champion.strip():  # 빈 문자열이 아닌 경우만
+                    current_set_picks.append(champion.strip())
+        return current_set_picks
+
+    def _pending_seats(self, game_code) -> Dict[str, dict]:
+        """재시작 전 자리 중 아직 돌아오지 않은 자리 (보관 시간이 지났으면 빈 딕셔너리)"""
+        if self.handoff_seats and time.monotonic() >= self.handoff_expires_at:
+            self.handoff_seats.clear()
+        return self.handoff_seats.get(game_code, {})
+
+    def _is_seated(self, game_code, nickname, position) -> bool:
+        """요청한 플레이어 포지션에 그 닉네임이 앉아 있거나 재시작 전 자리가 남아 있는지 확인
+
+        연결이 끊긴 뒤 새 sid로 다시 들어오는 플레이어는 이전 연결이 아직 정리되지 않았으면 게임 방에 남아 있음.
+        닉네임은 인증되지 않으므로 관전자 자리나 다른 포지션으로 들어오는 요청은 한도에서 제외하지 않음
+        """
+        if not game_code or not nickname or not position or position == 'spectator':
+            return False
+        seat = self._pending_seats(game_code).get(nickname)
+        if seat:
+            return seat.get('position') == position
+        return any(c.get('nickname') == nickname and c.get('position') == position
+                   for c in self.game_clients.get(game_code, {}).values())
+
     async def handle_connect(self, sid, environ, auth):
         """클라이언트 연결 시 호출되는 핸들러"""
+        # 연결 수 한도 확인 (게임에 앉아 있거나 재시작 전 자리가 있는 플레이어는 auth에 gameCode, nickname, position을 보내면 항상 허용)
+        try:
+            seated = isinstance(auth, dict) and self._is_seated(auth.get('gameCode'), auth.get('nickname'),
+                                                                auth.get('position'))
+            self.admission.check_connection(len(self.clients), seated)
+        except AdmissionError as e:
+            raise ConnectionRefusedError(str(e), e.as_detail())
+
         try:
             # 클라이언트 정보 저장
-            self.clients[sid] = {
-                'sid': sid,
-                'socketId': auth.get('socketId') if auth else None,
-                'gameCode': None,
-                'nickname': None,
-                'position': None,
-                'isHost': False,
-                'isReady': False,
-                'champion': None,
-                'isConfirmed': False
-            }
+            # 게임 정보는 참가할 때 할당되므로 게임에 들어가지 않은 연결은 sid와 socketId만 가짐
+            self.clients[sid] = Client(sid, auth.get('socketId') if auth else None)
             print(f"Client connected: {sid}")
             
             # 연결 성공 이벤트 전송
@@ -176,21 +345,46 @@ class SocketService:
             print(f"Error in handle_connect: {e}")
             return False
 
+    async def handle_clock_sync(self, sid: str, data: dict = None):
+        """NTP 방식의 시계 동기화 요청 처리
+
+        클라이언트는 보낸 시각 t0와 응답을 받은 시각 t3로 다음을 계산합니다.
+        RTT = (t3 - t0) - (serverSendTime - serverReceiveTime)
+        오프셋 = ((serverReceiveTime - t0) + (serverSendTime - t3)) / 2
+        직전 교환에서 측정한 rttMs를 함께 보내면 연결별 RTT 추정치에 반영합니다.
+        """
+        received_at = server_clock.now_us()
+        data = data if isinstance(data, dict) else {}
+        rtt_ms = data.get('rttMs')
+        estimate = self.rtt.get(sid)
+        if isinstance(rtt_ms, (int, float)) and sid in self.clients:
+            estimate = self.rtt.record(sid, rtt_ms)
+        return {
+            "status": "success",
+            "clientTime": data.get('clientTime'),
+            "serverReceiveTime": received_at,
+            "rttMs": round(estimate, 2) if estimate is not None else None,
+            "serverSendTime": server_clock.now_us(),
+        }
+
     async def handle_disconnect(self, sid: str, namespace: str = None):
         """클라이언트 연결 해제 시 호출되는 핸들러"""
         try:
             if sid in self.clients:
                 client = self.clients[sid]
-                # 게임 방에서 나가기
+                # 게임 방에서 나가기 (관전자는 퇴장 알림을 보내지 않음)
                 if client.get('gameCode'):
-                    await self.sio.leave_room(sid, client['gameCode'])
-                    # 다른 클라이언트들에게 알림
-                    await self.sio.emit('client_left', {
-                        'nickname': client.get('nickname', 'Unknown'),
-                        'position': client.get('position', 'spectator')
-                    }, room=client['gameCode'])
+                    if await self._leave_game(sid, client['gameCode']):
+                        # 다른 클라이언트들에게 알림
+                        await self.sio.emit('client_left', {
+                            'nickname': client.get('nickname', 'Unknown'),
+                            'position': client.get('position', 'spectator')
+                        }, room=client['gameCode'])
+                    # 호스트가 나갔으면 다음 참가자에게 호스트 이전
+                    await self._migrate_host(client['gameCode'])
                 # 클라이언트 정보 삭제
                 del self.clients[sid]
+                self.rtt.drop(sid)
                 print(f"Client disconnected: {sid}")
         except Exception as e:
             print(f"Error in handle_disconnect: {e}")
@@ -206,14 +400,40 @@ class SocketService:
             if not game_code or not nickname:
                 return {"status": "error", "message": "게임 코드와 닉네임은 필수입니다."}
 
-            # 게임에 참가한 플레이어가 있는지 확인
-            existing_clients = [
-                c for c in self.clients.values()
-                if c.get('gameCode') == game_code
-            ]
-
-            # 첫 번째 플레이어는 자동으로 호스트가 됨
-            is_host = len(existing_clients) == 0
+            # 참가 인원 한도와 과부하 확인 (앉아 있던 자리나 재시작 전 자리, 이미 참가한 게임으로 다시 들어오는 경우는 항상 허용)
+            try:
+                self.admission.check_join(
+                    members=self.membership.count(game_code),
+                    spectators=self.spectators.count(game_code),
+                    # 호스트가 없는 게임에 들어오는 관전자는 호스트가 되므로 차단하지 않음
+                    spectator=position == 'spectator' and self.membership.host(game_code) is not None,
+                    seated=self.membership.contains(game_code, sid) or self._is_seated(game_code, nickname, position),
+                )
+            except AdmissionError as e:
+                return e.as_ack()
+
+            # 이미 게임에 참가 중이었다면 먼저 나가기
+            previous_game = self.clients[sid].get('gameCode')
+            if previous_game == game_code:
+                await self._leave_previous_game(sid, previous_game)
+            elif previous_game:
+                # 이전 게임의 상태는 그 게임의 메일박스에서 바꿈 (서로의 게임으로 옮겨 가는 요청끼리 멈추지 않도록 기다리지 않음)
+                self.actors.post(previous_game, self._leave_previous_game, sid, previous_game)
+
+            # 호스트가 없는 게임(첫 번째 참가자)이면 자동으로 호스트가 됨
+            is_host = self.membership.host(game_code) is None
+
+            # 서버 재시작 전에 앉아 있던 자리가 있으면 그대로 복원
+            # (보관 시간 동안만 이전 호스트의 자리를 남겨 두고, 지나면 _expire_handoff_seats가 호스트를 지정)
+            seats = self._pending_seats(game_code)
+            seat = seats.pop(nickname, None)
+            if seat:
+                position = seat['position'] or position
+                is_host = seat['isHost'] and self.membership.host(game_code) is None
+            elif any(s['isHost'] for s in seats.values()):
+                is_host = False  # 이전 호스트가 돌아올 자리를 남겨 둠
+            if not seats:
+                self.handoff_seats.pop(game_code, None)
 
             # 클라이언트 정보 업데이트
             self.clients[sid].update({
@@ -223,17 +443,24 @@ class SocketService:
                 'isHost': is_host,
                 'joinedAt': self._get_timestamp()
             })
+            if seat:
+                self.clients[sid]['isReady'] = seat['isReady']
+            self.membership.join(game_code, sid, is_host)
 
-            # 게임 방에 참가
-            await self.sio.enter_room(sid, game_code)
-
-            # 다른 클라이언트들에게 알림
-            await self.sio.emit('client_joined', {
-                'nickname': nickname,
-                'position': position,
-                'isHost': is_host,
-                'clientId': sid
-            }, room=game_code)
+            if position == 'spectator' and not is_host:
+                # 관전자는 게임 방 대신 관전자 채널로 이벤트를 받음
+                await self._enter_spectator_channel(sid, game_code)
+            else:
+                # 게임 방에 참가
+                await self._enter_game_room(sid, game_code)
+
+                # 다른 클라이언트들에게 알림
+                await self.sio.emit('client_joined', {
+                    'nickname': nickname,
+                    'position': position,
+                    'isHost': is_host,
+                    'clientId': sid
+                }, room=game_code)
 
             print(f"{nickname} joined game {game_code} at position {position}")
             return {
@@ -270,8 +497,8 @@ class SocketService:
             # 포지션이 사용 가능한지 확인 (본인 제외)
             if new_position != "spectator":
                 position_taken = any(
-                    c.get('position') == new_position and c.get('gameCode') == game_code and c.get('sid') != sid
-                    for c in self.clients.values()
+                    c.get('position') == new_position and c.get('sid') != sid
+                    for c in self.game_clients.get(game_code, {}).values()
                 )
                 if position_taken:
                     return {"status": "error", "message": "이미 사용 중인 포지션입니다."}
@@ -281,6 +508,12 @@ class SocketService:
             # 클라이언트 포지션 업데이트
             self.clients[sid]['position'] = new_position
 
+            # 관전자 ↔ 플레이어 전환 시 게임 방/관전자 채널 이동
+            if new_position == 'spectator' and not self._is_host(client):
+                await self._enter_spectator_channel(sid, game_code)
+            elif self._is_spectator_viewer(sid, game_code):
+                await self._enter_game_room(sid, game_code)
+
             # 다른 클라이언트들에게 알림
             await self.sio.emit('position_changed', {
                 'nickname': client.get('nickname'),
@@ -348,6 +581,11 @@ class SocketService:
             if not game_settings or not game_status:
                 return {"status": "error", "message": "게임을 찾을 수 없습니다."}
 
+            # 중복 명령이면 저장된 응답을, 기대한 상태와 다르면 브로드캐스트 없이 거절
+            rejected = self._check_command(game_code, game_status, data)
+            if rejected:
+                return rejected
+
             current_phase = game_status.phase
 
             # Check if it's client's turn
@@ -360,19 +598,23 @@ class SocketService:
                 game_status.lastUpdatedAt = self._get_timestamp()
                 
                 # Save updated status
-                self.game_service.game_status[game_code] = game_status
+                self.game_service.update_game_status(game_code, game_status)
+                self.game_service.timeline.append(game_code, SELECT, game_status.lastUpdatedAt,
+                                                  game_status.setNumber, current_phase,
+                                                  client.get('nickname'), champion)
 
                 # Broadcast champion selection to all clients in the game
-                await self.sio.emit('champion_selected', {
+                await self._broadcast('champion_selected', {
                     'gameCode': game_code,
                     'selectedBy': client.get('nickname'),
                     'champion': champion,
                     'phase': current_phase,
-                    'timestamp': game_status.lastUpdatedAt
-                }, room=game_code)
+                    'timestamp': game_status.lastUpdatedAt,
+                    'stateVersion': game_status.stateVersion
+                }, game_code)
 
                 print(f"Champion {champion} selected by {client.get('nickname')} in phase {current_phase}")
-                return {"status": "success", "message": "챔피언이 성공적으로 선택되었습니다."}
+                return self._command_ack(game_code, game_status, data, "챔피언이 성공적으로 선택되었습니다.")
             else:
                 return {"status": "error", "message": "유효하지 않은 페이즈입니다."}
 
@@ -399,6 +641,11 @@ class SocketService:
             if not game_settings or not game_status:
                 return {"status": "error", "message": "게임을 찾을 수 없습니다."}
 
+            # 중복 명령이면 저장된 응답을, 기대한 상태와 다르면 브로드캐스트 없이 거절
+            rejected = self._check_command(game_code, game_status, data)
+            if rejected:
+                return rejected
+
             current_phase = game_status.phase
 
             # Check if current phase is valid for progression
@@ -421,20 +668,24 @@ class SocketService:
             game_status.lastUpdatedAt = self._get_timestamp()
 
             # Save updated status
-            self.game_service.game_status[game_code] = game_status
+            self.game_service.update_game_status(game_code, game_status)
+            self.game_service.timeline.append(game_code, CONFIRM, game_status.lastUpdatedAt,
+                                              game_status.setNumber, current_phase,
+                                              client.get('nickname'), game_status.phaseData[current_phase])
 
             # Broadcast phase progression to all clients in the game
-            await self.sio.emit('phase_progressed', {
+            await self._broadcast('phase_progressed', {
                 'gameCode': game_code,
                 'confirmedBy': client.get('nickname'),
                 'fromPhase': current_phase,
                 'toPhase': game_status.phase,
                 'confirmedChampion': game_status.phaseData[current_phase],
-                'timestamp': game_status.lastUpdatedAt
-            }, room=game_code)
+                'timestamp': game_status.lastUpdatedAt,
+                'stateVersion': game_status.stateVersion
+            }, game_code)
 
             print(f"Phase progressed from {current_phase} to {game_status.phase} by {client.get('nickname')}")
-            return {"status": "success", "message": "페이즈가 성공적으로 진행되었습니다."}
+            return self._command_ack(game_code, game_status, data, "페이즈가 성공적으로 진행되었습니다.")
 
         except Exception as e:
             print(f"Error during phase progression: {e}")
@@ -463,6 +714,11 @@ class SocketService:
             if not game_settings or not game_status:
                 return {"status": "error", "message": "게임을 찾을 수 없습니다."}
 
+            # 중복 명령이면 저장된 응답을, 기대한 상태와 다르면 브로드캐스트 없이 거절
+            rejected = self._check_command(game_code, game_status, data)
+            if rejected:
+                return rejected
+
             # Check if game is in initial phase
             if game_status.phase != 0:
                 return {"status": "error", "message": "이미 게임이 시작되었습니다."}
@@ -475,17 +731,18 @@ class SocketService:
             # Update game status to start draft
             game_status.phase = 1
             game_status.lastUpdatedAt = self._get_timestamp()
-            self.game_service.game_status[game_code] = game_status
+            self.game_service.update_game_status(game_code, game_status)
 
             # Broadcast draft start to all clients in the game
-            await self.sio.emit('draft_started', {
+            await self._broadcast('draft_started', {
                 'gameCode': game_code,
                 'startedBy': client.get('nickname'),
-                'timestamp': game_status.lastUpdatedAt
-            }, room=game_code)
+                'timestamp': game_status.lastUpdatedAt,
+                'stateVersion': game_status.stateVersion
+            }, game_code)
 
             print(f"Draft started in game {game_code} by {client.get('nickname')}")
-            return {"status": "success", "message": "게임이 성공적으로 시작되었습니다."}
+            return self._command_ack(game_code, game_status, data, "게임이 성공적으로 시작되었습니다.")
 
         except Exception as e:
             print(f"Error during draft start: {e}")
@@ -514,6 +771,11 @@ class SocketService:
             if not game_settings or not game_status:
                 return {"status": "error", "message": "게임을 찾을 수 없습니다."}
 
+            # 중복 명령이면 저장된 응답을, 기대한 상태와 다르면 브로드캐스트 없이 거절
+            rejected = self._check_command(game_code, game_status, data)
+            if rejected:
+                return rejected
+
             # Check if game phase is 21 (game end)
             if game_status.phase != 21:
                 return {"status": "error", "message": "게임이 완료 단계가 아닙니다."}
@@ -561,17 +823,18 @@ class SocketService:
             
             # Store the SetResult object
             game_result.results[game_status.setNumber - 1] = set_result
+
+            self.game_service.timeline.append(game_code, RESULT, self._get_timestamp(),
+                                              game_status.setNumber, game_status.phase,
+                                              client.get('nickname'), actual_winner)
+
+            # 챔피언 통계에 세트 결과 반영
+            if self.stats_service:
+                self.stats_service.record_set(game_settings.version, game_settings.draftType, set_result)
             
             # 하드피어리스 모드인 경우, 현재 세트의 픽된 챔피언들을 저장
             if game_settings.draftType == "hardFearless":
-                current_set_picks = []
-                # phaseData에서 픽 페이즈(7-12, 17-20)의 데이터만 추출
-                pick_phases = [7, 8, 9, 10, 11, 12, 17, 18, 19, 20]  # 픽 페이즈들
-                for phase_idx in pick_phases:
-                    if phase_idx <= len(game_status.phaseData) and game_status.phaseData[phase_idx - 1]:
-                        champion = game_status.phaseData[phase_idx - 1]
-                        if champion and champion.strip():  # 빈 문자열이 아닌 경우만
-                            current_set_picks.append(champion.strip())
+                current_set_picks = self._extract_set_picks(game_status.phaseData)
                 
                 # previousSetPicks 초기화 (없는 경우)
                 if not hasattr(game_status, 'previousSetPicks') or game_status.previousSetPicks is None:
@@ -593,10 +856,10 @@ class SocketService:
                 
                 # Save updated status
                 game_status.lastUpdatedAt = self._get_timestamp()
-                self.game_service.game_status[game_code] = game_status
+                self.game_service.update_game_status(game_code, game_status)
                 self.game_service.game_results[game_code] = game_result
                 
-                await self.sio.emit('side_choice_phase', {
+                event_data = {
                     'gameCode': game_code,
                     'losingSide': losing_side,
                     'winner': winner,
@@ -604,21 +867,25 @@ class SocketService:
                         'team1': game_result.team1Score,
                         'team2': game_result.team2Score
                     },
-                    'timestamp': game_status.lastUpdatedAt
-                }, room=game_code)
+                    'timestamp': game_status.lastUpdatedAt,
+                    'stateVersion': game_status.stateVersion
+                }
+                await self._broadcast('side_choice_phase', event_data, game_code)
+                self._publish_webhook(game_code, 'side_choice_phase', event_data, game_status, set_result)
             else:
                 # Final set - match finished
                 game_status.phase = 23  # 매치 완료 페이즈
                 game_status.lastUpdatedAt = self._get_timestamp()
                 
                 # 게임 상태와 결과를 먼저 저장
-                self.game_service.game_status[game_code] = game_status
+                self.game_service.update_game_status(game_code, game_status)
                 self.game_service.game_results[game_code] = game_result
+                # 보관소 기록은 보관 기간이 지나 메모리에서 제거할 때 (그 전까지는 되돌리기로 최종 결과를 고칠 수 있음)
                 
                 # 저장 완료 후 이벤트 전송
                 print(f"Final game result saved: {game_code}, Results count: {len(game_result.results)}")
                 
-                await self.sio.emit('match_finished', {
+                event_data = {
                     'gameCode': game_code,
                     'finalWinner': winner,
                     'finalScores': {
@@ -626,11 +893,14 @@ class SocketService:
                         'team2': game_result.team2Score
                     },
                     'resultsCount': len(game_result.results),  # 디버깅을 위한 결과 개수 추가
-                    'timestamp': game_status.lastUpdatedAt
-                }, room=game_code)
+                    'timestamp': game_status.lastUpdatedAt,
+                    'stateVersion': game_status.stateVersion
+                }
+                await self._broadcast('match_finished', event_data, game_code)
+                self._publish_webhook(game_code, 'match_finished', event_data, game_status, set_result)
 
             print(f"Game result confirmed in {game_code}: {winner} wins. Scores: Team1={game_result.team1Score}, Team2={game_result.team2Score}")
-            return {"status": "success", "message": "게임 결과가 성공적으로 확정되었습니다."}
+            return self._command_ack(game_code, game_status, data, "게임 결과가 성공적으로 확정되었습니다.")
 
         except Exception as e:
             print(f"Error during game result confirmation: {e}")
@@ -659,6 +929,11 @@ class SocketService:
             if not game_settings or not game_status:
                 return {"status": "error", "message": "게임을 찾을 수 없습니다."}
 
+            # 중복 명령이면 저장된 응답을, 기대한 상태와 다르면 브로드캐스트 없이 거절
+            rejected = self._check_command(game_code, game_status, data)
+            if rejected:
+                return rejected
+
             # Check if game is in side choice phase
             if game_status.phase != 22:
                 return {"status": "error", "message": "진영 선택 단계가 아닙니다."}
@@ -668,7 +943,7 @@ class SocketService:
                 return {"status": "error", "message": "유효하지 않은 선택입니다."}
             
             # Handle side choice
-            await self.game_service.handle_side_choice(game_code, choice)
+            await self.game_service.handle_side_choice(game_code, choice, client.get('nickname'))
             
             # Move to next set
             game_status.setNumber += 1
@@ -677,15 +952,14 @@ class SocketService:
             game_status.lastUpdatedAt = self._get_timestamp()
             
             # Reset ready state for all players in this game
-            for client_sid, client_obj in self.clients.items():
-                if client_obj.get('gameCode') == game_code and client_obj.get('position') != 'spectator':
+            for client_obj in self.game_clients.get(game_code, {}).values():
+                if client_obj.get('position') != 'spectator':
                     client_obj['isReady'] = False
-                    self.clients[client_sid] = client_obj
 
             # Save updated status
-            self.game_service.game_status[game_code] = game_status
+            self.game_service.update_game_status(game_code, game_status)
             
-            await self.sio.emit('next_set_started', {
+            await self._broadcast('next_set_started', {
                 'gameCode': game_code,
                 'setNumber': game_status.setNumber,
                 'sideChoice': choice,
@@ -693,27 +967,220 @@ class SocketService:
                     'team1': game_status.team1Side,
                     'team2': game_status.team2Side
                 },
-                'timestamp': game_status.lastUpdatedAt
-            }, room=game_code)
+                'timestamp': game_status.lastUpdatedAt,
+                'stateVersion': game_status.stateVersion
+            }, game_code)
             
             print(f"Next set started in {game_code}: Set {game_status.setNumber}, Side choice: {choice}")
-            return {"status": "success", "message": "다음 세트가 성공적으로 시작되었습니다."}
+            return self._command_ack(game_code, game_status, data, "다음 세트가 성공적으로 시작되었습니다.")
             
         except Exception as e:
             print(f"Error during side choice: {e}")
             return {"status": "error", "message": str(e)}
 
+    async def restore_draft(self, game_code: str, steps: int = 0, set_number: int = None, phase: int = None,
+                            restored_by: str = None) -> dict:
+        """기록된 페이즈로 되돌리거나 다시 실행하고 복원된 상태를 한 번에 브로드캐스트 (호스트/관리자 공용)"""
+        game_settings = self.game_service.game_settings.get(game_code)
+        restored = self.game_service.restore_draft(game_code, steps, set_number, phase, restored_by)
+
+        # 사라지거나 다시 생긴 세트 결과를 챔피언 통계에 맞춤
+        if self.stats_service and game_settings:
+            for set_result in restored["removed"]:
+                self.stats_service.record_set(game_settings.version, game_settings.draftType, set_result, sign=-1)
+            for set_result in restored["added"]:
+                self.stats_service.record_set(game_settings.version, game_settings.draftType, set_result)
+
+        game_status = self.game_service.game_status[game_code]
+        event_data = {
+            **self.game_service.get_snapshot(game_code),
+            'previousSetPicks': game_status.previousSetPicks,
+            'action': restored["action"],
+            'restoredBy': restored_by,
+        }
+        await self._broadcast('draft_state_restored', event_data, game_code)
+        print(f"Draft {restored['action']} in {game_code}: set {game_status.setNumber} phase {game_status.phase} by {restored_by}")
+        return event_data
+
+    async def _handle_restore(self, sid: str, data: dict, direction: int):
+        """되돌리기(direction=-1)/다시 실행(direction=1) 요청 처리"""
+        try:
+            if sid not in self.clients:
+                return {"status": "error", "message": "클라이언트를 찾을 수 없습니다."}
+
+            client = self.clients[sid]
+            game_code = client.get('gameCode')
+
+            if not game_code:
+                return {"status": "error", "message": "게임 코드가 없습니다."}
+
+            if not self._is_host(client):
+                return {"status": "error", "message": "호스트만 되돌리기/다시 실행을 할 수 있습니다."}
+
+            game_status = self.game_service.game_status.get(game_code)
+            if not game_status:
+                return {"status": "error", "message": "게임을 찾을 수 없습니다."}
+
+            # 중복 명령이면 저장된 응답을, 기대한 상태와 다르면 브로드캐스트 없이 거절
+            data = data or {}
+            rejected = self._check_command(game_code, game_status, data)
+            if rejected:
+                return rejected
+
+            steps = data.get('steps', 1)
+            if not isinstance(steps, int) or isinstance(steps, bool) or steps < 1:
+                return {"status": "error", "message": "steps는 1 이상의 정수여야 합니다."}
+
+            try:
+                await self.restore_draft(game_code, steps * direction, data.get('setNumber'), data.get('phase'),
+                                         client.get('nickname'))
+            except ValueError as e:
+                return {"status": "error", "message": str(e)}
+
+            message = "이전 페이즈로 되돌렸습니다." if direction < 0 else "되돌린 페이즈를 다시 실행했습니다."
+            return self._command_ack(game_code, game_status, data, message)
+
+        except Exception as e:
+            print(f"Error during draft restore: {e}")
+            return {"status": "error", "message": str(e)}
+
+    async def handle_undo_draft(self, sid: str, data: dict = None):
+        """호스트의 되돌리기 요청 (steps 페이즈 전, 또는 setNumber/phase로 지정한 페이즈로)"""
+        return await self._handle_restore(sid, data, -1)
+
+    async def handle_redo_draft(self, sid: str, data: dict = None):
+        """호스트의 다시 실행 요청"""
+        return await self._handle_restore(sid, data, 1)
+
+    async def close_game(self, game_code: str, reason: str):
+        """강제 종료된 게임의 클라이언트들에게 알리고 방에서 내보냅니다."""
+        await self._broadcast('game_closed', {
+            'gameCode': game_code,
+            'reason': reason,
+            'timestamp': self._get_timestamp()
+        }, game_code)
+
+        self.event_stream.close(game_code)
+        self.command_window.drop(game_code)
+        self.handoff_seats.pop(game_code, None)
+        self.membership.drop(game_code)
+        if self.webhooks:
+            self.webhooks.drop_game(game_code)
+        self.actors.drop(game_code)
+
+        members = list(self.game_clients.pop(game_code, {}))
+        for sid in members:
+            await self.sio.leave_room(sid, game_code)
+        for sid in members + self.spectators.close(game_code):
+            client = self.clients.get(sid)
+            if client:
+                client.update({
+                    'gameCode': None,
+                    'position': None,
+                    'isHost': False,
+                    'isReady': False,
+                    'champion': None,
+                    'isConfirmed': False
+                })
+
+    def export_seats(self) -> Dict[str, List[dict]]:
+        """재시작 인계용으로 게임별 참가자 자리 정보를 반환합니다."""
+        seats: Dict[str, List[dict]] = {}
+        for client in self.clients.values():
+            game_code = client.get('gameCode')
+            if not game_code or not client.get('nickname'):
+                continue
+            seats.setdefault(game_code, []).append({
+                'nickname': client['nickname'],
+                'position': client.get('position'),
+                'isHost': bool(client.get('isHost')),
+                'isReady': bool(client.get('isReady')),
+            })
+        return seats
+
+    def restore_seats(self, seats: Dict[str, List[dict]]):
+        """인계받은 자리 정보를 재접속한 클라이언트가 같은 닉네임으로 참가할 때 복원하도록 보관합니다.
+
+        자리는 handoff_seat_grace초 동안만 보관하고, 그때까지 호스트가 돌아오지 않은 게임은
+        먼저 들어온 참가자를 호스트로 지정합니다.
+        """
+        for game_code, game_seats in seats.items():
+            self.handoff_seats[game_code] = {seat['nickname']: seat for seat in game_seats}
+        self.handoff_expires_at = time.monotonic() + self.handoff_seat_grace
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return  # 이벤트 루프 밖에서는 _pending_seats가 보관 시간이 지난 자리를 버림
+        if self._handoff_expiry_task:
+            self._handoff_expiry_task.cancel()
+        self._handoff_expiry_task = loop.create_task(self._expire_handoff_seats(list(seats)))
+
+    async def _expire_handoff_seats(self, game_codes: List[str]):
+        """보관 시간이 지나면 남은 자리를 버리고, 호스트가 없는 게임에 새 호스트 지정"""
+        await asyncio.sleep(max(0.0, self.handoff_expires_at - time.monotonic()))
+        self.handoff_seats.clear()
+        for game_code in game_codes:
+            if self.membership.host(game_code) is None:
+                try:
+                    await self.actors.submit(game_code, self._migrate_host, game_code)
+                except Exception as e:
+                    print(f"Error assigning host after handoff for game {game_code}: {e}")
+
+    async def notify_restart(self, reconnect_after_ms: int):
+        """새 상태 변경 명령을 막고 모든 클라이언트에게 재접속을 안내합니다."""
+        self.draining = True
+        await self.sio.emit('server_restarting', {
+            'reconnectAfterMs': reconnect_after_ms,
+            'timestamp': self._get_timestamp()
+        })
+
+    def _in_game_actor(self, handler, event: str):
+        """게임 상태를 바꾸는 핸들러를 해당 게임의 메일박스에서 순서대로 실행하도록 감쌈"""
+        async def dispatch(sid, *args):
+            if self.draining and handler != self.handle_disconnect:
+                return {
+                    "status": "error",
+                    "code": "SERVER_RESTARTING",
+                    "message": "서버가 재시작 중입니다. 잠시 후 다시 접속해주세요."
+                }
+            game_code = None
+            if handler == self.handle_join_game and args and isinstance(args[0], dict):
+                game_code = args[0].get('gameCode')
+            if not game_code and sid in self.clients:
+                game_code = self.clients[sid].get('gameCode')
+
+            with tracer.start_trace(f"socket {event}", **{
+                'socket.event': event,
+                'socket.sid': sid,
+                'game.code': game_code or '',
+            }) as span:
+                if not game_code:
+                    result = await handler(sid, *args)
+                else:
+                    # 메일박스 대기 시간과 핸들러 실행 시간을 나눠 기록
+                    result = await self.actors.submit(game_code, tracer.bind(handler, handler.__name__), sid, *args)
+                if isinstance(result, dict):
+                    span.set_attribute('ack.status', result.get('status', ''))
+                    if result.get('code'):
+                        span.set_attribute('ack.code', result['code'])
+                return result
+        return dispatch
+
     def setup(self):
         # Register event handlers
         self.sio.on('connect', self.handle_connect)
-        self.sio.on('disconnect', self.handle_disconnect)
-        self.sio.on('join_game', self.handle_join_game)
-        self.sio.on('change_position', self.handle_position_change)
-        self.sio.on('change_ready_state', self.handle_ready_state)
-        self.sio.on('select_champion', self.handle_champion_select)
-        self.sio.on('confirm_selection', self.handle_confirm_selection)
-        self.sio.on('start_draft', self.handle_start_draft)
-        self.sio.on('confirm_result', self.handle_confirm_result)
-        self.sio.on('choose_side', self.handle_side_choice)  # Add new handler
+        self.sio.on('disconnect', self._in_game_actor(self.handle_disconnect, 'disconnect'))
+        # 시계 동기화는 게임 상태를 바꾸지 않으며, 메일박스 대기 시간이 RTT에 섞이지 않도록 바로 처리
+        self.sio.on('clock_sync', self.handle_clock_sync)
+        self.sio.on('join_game', self._in_game_actor(self.handle_join_game, 'join_game'))
+        self.sio.on('change_position', self._in_game_actor(self.handle_position_change, 'change_position'))
+        self.sio.on('change_ready_state', self._in_game_actor(self.handle_ready_state, 'change_ready_state'))
+        self.sio.on('select_champion', self._in_game_actor(self.handle_champion_select, 'select_champion'))
+        self.sio.on('confirm_selection', self._in_game_actor(self.handle_confirm_selection, 'confirm_selection'))
+        self.sio.on('start_draft', self._in_game_actor(self.handle_start_draft, 'start_draft'))
+        self.sio.on('confirm_result', self._in_game_actor(self.handle_confirm_result, 'confirm_result'))
+        self.sio.on('choose_side', self._in_game_actor(self.handle_side_choice, 'choose_side'))
+        self.sio.on('undo_draft', self._in_game_actor(self.handle_undo_draft, 'undo_draft'))
+        self.sio.on('redo_draft', self._in_game_actor(self.handle_redo_draft, 'redo_draft'))
         
         return socketio.ASGIApp(self.sio)
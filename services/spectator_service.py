@@ -0,0 +1,104 @@
+import asyncio
+import logging
+import time
+from collections import deque
+from typing import Deque, Dict, List, Tuple
+from engineio import packet as eio_packet
+from socketio import packet as sio_packet
+
+logger = logging.getLogger(__name__)
+
+
+class SpectatorChannel:
+    """관전자 전용 브로드캐스트 채널
+
+    관전자는 게임 방(room)에 들어가지 않고 이 채널에 등록됩니다. 브로드캐스트마다
+    Socket.IO 패킷을 한 번만 인코딩하고, 같은 Engine.IO 패킷 객체(인코딩 캐시 포함)를
+    모든 관전자에게 그대로 전송합니다. delay_seconds가 설정되면 관전자에게 가는 이벤트를
+    지연 버퍼에 모았다가 보내 고스팅을 방지합니다.
+    """
+
+    def __init__(self, sio, delay_seconds: float = 0.0, namespace: str = '/'):
+        self.sio = sio
+        self.namespace = namespace
+        self.delay_seconds = max(0.0, delay_seconds)
+        self.viewers: Dict[str, Dict[str, str]] = {}  # gameCode -> {sid: eio_sid}
+        self.pending: Dict[str, Deque[Tuple[float, List[eio_packet.Packet]]]] = {}
+        self.flush_tasks: Dict[str, asyncio.Task] = {}
+
+    def add(self, game_code: str, sid: str):
+        """관전자 등록"""
+        eio_sid = self.sio.manager.eio_sid_from_sid(sid, self.namespace)
+        if eio_sid is None:
+            return
+        self.viewers.setdefault(game_code, {})[sid] = eio_sid
+
+    def remove(self, game_code: str, sid: str) -> bool:
+        """관전자 해제"""
+        viewers = self.viewers.get(game_code)
+        if not viewers or sid not in viewers:
+            return False
+        del viewers[sid]
+        if not viewers:
+            del self.viewers[game_code]
+        return True
+
+    def count(self, game_code: str) -> int:
+        return len(self.viewers.get(game_code, ()))
+
+    def close(self, game_code: str) -> List[str]:
+        """게임 종료 시 채널 정리 후 등록돼 있던 관전자 목록 반환"""
+        task = self.flush_tasks.pop(game_code, None)
+        if task:
+            task.cancel()
+        self.pending.pop(game_code, None)
+        return list(self.viewers.pop(game_code, {}))
+
+    def encode(self, event: str, data) -> List[eio_packet.Packet]:
+        """이벤트를 Engine.IO 메시지 패킷으로 한 번만 인코딩"""
+        pkt = self.sio.packet_class(sio_packet.EVENT, namespace=self.namespace, data=[event, data])
+        encoded = pkt.encode()
+        if not isinstance(encoded, list):
+            encoded = [encoded]
+        packets = [eio_packet.Packet(eio_packet.MESSAGE, p) for p in encoded]
+        for p in packets:
+            p.encode()  # 전송 시 재사용되도록 인코딩 결과를 미리 캐시
+        return packets
+
+    async def broadcast(self, game_code: str, event: str, data):
+        """게임의 모든 관전자에게 이벤트 전송 (지연 설정 시 버퍼에 적재)"""
+        if game_code not in self.viewers:
+            return
+        packets = self.encode(event, data)
+        if not self.delay_seconds:
+            await self._send(game_code, packets)
+            return
+
+        self.pending.setdefault(game_code, deque()).append((time.monotonic() + self.delay_seconds, packets))
+        if game_code not in self.flush_tasks:
+            self.flush_tasks[game_code] = asyncio.create_task(self._flush(game_code))
+
+    async def _send(self, game_code: str, packets: List[eio_packet.Packet]):
+        for eio_sid in list(self.viewers.get(game_code, {}).values()):
+            for p in packets:
+                await self.sio.eio.send_packet(eio_sid, p)
+
+    async def _flush(self, game_code: str):
+        """지연 시간이 지난 이벤트를 순서대로 전송"""
+        try:
+            queue = self.pending.get(game_code)
+            while queue:
+                due, packets = queue[0]
+                wait = due - time.monotonic()
+                if wait > 0:
+                    await asyncio.sleep(wait)
+                queue.popleft()
+                await self._send(game_code, packets)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.error(f"Error flushing spectator buffer for {game_code}: {e}")
+        finally:
+            self.flush_tasks.pop(game_code, None)
+            if not self.pending.get(game_code):
+                self.pending.pop(game_code, None)
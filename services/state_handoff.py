@@ -0,0 +1,130 @@
+import json
+import os
+import tempfile
+import time
+from models import Game, GameResult, GameSetting, GameStatus
+
+HANDOFF_FORMAT = 1
+
+
+def dump_state(game_service, path: str) -> int:
+    """진행 중인 게임 상태를 인계 파일로 저장하고 저장한 게임 수를 반환합니다."""
+    games = {}
+    for game_code, game in game_service.games.items():
+        game_status = game_service.game_status.get(game_code)
+        game_settings = game_service.game_settings.get(game_code)
+        if not game_status or not game_settings:
+            continue
+        game_result = game_service.game_results.get(game_code)
+        games[game_code] = {
+            "game": game.model_dump(),
+            "settings": game_settings.model_dump(),
+            "status": game_status.model_dump(),
+            "result": game_result.model_dump() if game_result else None,
+            "timeline": game_service.timeline.export(game_code),
+            "archived": game_code in game_service.archived_games,
+        }
+
+    socket_service = game_service.socket_service
+    seats = socket_service.export_seats() if socket_service else {}
+
+    directory = os.path.dirname(path) or "."
+    os.makedirs(directory, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump({"format": HANDOFF_FORMAT, "savedAt": time.time(), "games": games, "seats": seats}, f,
+                      ensure_ascii=False, separators=(",", ":"))
+        os.replace(tmp_path, path)
+    except Exception:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+    return len(games)
+
+
+def load_state(game_service, path: str, max_age_seconds: float = 300) -> list:
+    """인계 파일이 있으면 게임 상태를 복원하고 파일을 삭제합니다. 복원한 게임 코드 목록을 반환합니다.
+
+    게임마다 따로 복원하므로 한 게임의 데이터가 잘못되어도 나머지 게임은 복원됩니다.
+    파일을 읽을 수 없으면 삭제하지 않고 `.invalid`를 붙여 옮겨 둡니다.
+    """
+    if not os.path.exists(path):
+        return []
+    try:
+        with open(path, encoding="utf-8") as f:
+            state = json.load(f)
+        if not isinstance(state, dict):
+            raise ValueError("handoff file is not a JSON object")
+    except (OSError, ValueError) as e:
+        os.replace(path, path + ".invalid")
+        print(f"Ignoring unreadable handoff file (moved to {path}.invalid): {e}")
+        return []
+
+    if state.get("format") != HANDOFF_FORMAT:
+        print(f"Ignoring handoff file with unknown format: {state.get('format')}")
+        os.remove(path)
+        return []
+    if time.time() - state.get("savedAt", 0) > max_age_seconds:
+        print(f"Ignoring stale handoff file saved at {state.get('savedAt')}")
+        os.remove(path)
+        return []
+
+    socket_service = game_service.socket_service
+    restored = []
+    for game_code, data in state.get("games", {}).items():
+        try:
+            _restore_game(game_service, game_code, data)
+        except Exception as e:
+            _discard_game(game_service, game_code)
+            print(f"Error restoring game {game_code} from handoff file: {e}")
+            continue
+        restored.append(game_code)
+
+    if socket_service:
+        try:
+            socket_service.restore_seats({code: seats for code, seats in state.get("seats", {}).items()
+                                          if code in restored})
+        except Exception as e:
+            print(f"Error restoring seats from handoff file: {e}")
+    os.remove(path)
+    return restored
+
+
+def _restore_game(game_service, game_code: str, data: dict):
+    """인계 파일의 게임 하나를 복원"""
+    game_settings = GameSetting(**data["settings"])
+    game = Game(**data["game"])
+    game_status = GameStatus(**data["status"])
+    game_result = GameResult(**data["result"]) if data.get("result") else None
+
+    # 모델 검증이 끝난 뒤에 서비스 상태에 넣어 잘못된 게임이 일부만 남지 않도록 함
+    game_service.games[game_code] = game
+    game_service.game_settings[game_code] = game_settings
+    if game_result:
+        game_service.game_results[game_code] = game_result
+    game_service.update_game_status(game_code, game_status)
+    if data.get("timeline"):
+        game_service.timeline.restore(game_code, data["timeline"])
+    if data.get("archived"):
+        game_service.archived_games.add(game_code)  # 이전 프로세스가 이미 보관소에 기록함
+
+    # 이전 프로세스의 통계는 메모리에만 있었으므로 남아 있는 세트 결과를 다시 반영
+    # (보관소에 기록된 게임은 시작할 때 보관소에서 통계를 채우므로 제외)
+    socket_service = game_service.socket_service
+    stats_service = socket_service.stats_service if socket_service else None
+    from_archive = data.get("archived") and game_service.archive is not None and game_service.archive.enabled
+    if stats_service and game_result and not from_archive:
+        for set_result in game_result.results:
+            stats_service.record_set(game_settings.version, game_settings.draftType, set_result)
+
+
+def _discard_game(game_service, game_code: str):
+    """복원 도중 실패한 게임의 일부 상태를 제거"""
+    game_service.directory.remove(game_code)
+    for store in (game_service.games, game_service.game_settings, game_service.game_results,
+                  game_service.game_status):
+        store.pop(game_code, None)
+    game_service.timeline.drop(game_code)
+    game_service.history.drop(game_code)
+    game_service.archived_games.discard(game_code)
@@ -0,0 +1,367 @@
+import asyncio
+import os
+from typing import Container, Dict, List, Optional, Sequence, Set, Tuple
+import numpy as np
+from services.tracing import tracer
+from services.draft_phases import (
+    BLUE_BAN_PHASES,
+    BLUE_PICK_PHASES,
+    DRAFT_PHASES,
+    RED_BAN_PHASES,
+    RED_PICK_PHASES,
+    winner_side,
+)
+
+SLOT_COUNT = 21  # phaseData[0..20], 0은 사용하지 않음
+
+# 버킷마다 챔피언 수² 크기의 행렬 4개를 두므로 집계할 챔피언과 버전 수를 제한
+MAX_CHAMPIONS = int(os.getenv("STATS_MAX_CHAMPIONS", "512"))
+MAX_VERSIONS = int(os.getenv("STATS_MAX_VERSIONS", "16"))
+
+
+class ChampionRegistry:
+    """챔피언 이름을 배열 인덱스로 사용하는 정수 ID로 변환"""
+
+    def __init__(self, max_size: int = MAX_CHAMPIONS):
+        self.ids: Dict[str, int] = {}
+        self.names: List[str] = []
+        self.max_size = max_size
+
+    def __len__(self):
+        return len(self.names)
+
+    def intern(self, name: str) -> Optional[int]:
+        """이름의 ID (처음 보는 이름이면 새로 발급하고, 최대 개수에 도달했으면 None)"""
+        champion_id = self.ids.get(name)
+        if champion_id is None:
+            if len(self.names) >= self.max_size:
+                return None
+            champion_id = len(self.names)
+            self.ids[name] = champion_id
+            self.names.append(name)
+        return champion_id
+
+    def get(self, name: str) -> Optional[int]:
+        return self.ids.get(name)
+
+
+class StatBucket:
+    """(version, draftType) 단위로 누적되는 챔피언 통계 배열"""
+
+    VECTORS = ("picks", "bans", "wins", "bluePicks", "redPicks", "blueWins", "redWins")
+    MATRICES = ("synergyGames", "synergyWins", "matchupGames", "matchupWins")
+
+    def __init__(self, capacity: int):
+        self.capacity = 0
+        self.sets = 0
+        self.blue_side_wins = 0
+        self.vectors: Dict[str, np.ndarray] = {}
+        self.matrices: Dict[str, np.ndarray] = {}
+        self.slots = np.zeros((0, SLOT_COUNT), dtype=np.int32)
+        self.grow(capacity)
+
+    def grow(self, size: int):
+        """챔피언 수가 늘어나면 배열 크기를 두 배씩 확장"""
+        if size <= self.capacity:
+            return
+        capacity = max(size, self.capacity * 2, 64)
+        for name in self.VECTORS:
+            vector = np.zeros(capacity, dtype=np.int32)
+            if name in self.vectors:
+                vector[:self.capacity] = self.vectors[name]
+            self.vectors[name] = vector
+        for name in self.MATRICES:
+            matrix = np.zeros((capacity, capacity), dtype=np.int32)
+            if name in self.matrices:
+                matrix[:self.capacity, :self.capacity] = self.matrices[name]
+            self.matrices[name] = matrix
+        slots = np.zeros((capacity, SLOT_COUNT), dtype=np.int32)
+        slots[:self.capacity] = self.slots
+        self.slots = slots
+        self.capacity = capacity
+
+
+class StatsService:
+    """확정된 세트 결과로부터 챔피언 픽/밴/승률 통계를 점진적으로 집계합니다.
+
+    세트가 확정될 때마다 record_set()으로 카운터와 챔피언 × 챔피언 행렬을 갱신하므로,
+    조회 시에는 저장된 게임을 다시 훑지 않고 미리 계산된 배열만 합산합니다.
+    """
+
+    def __init__(self, max_versions: int = MAX_VERSIONS):
+        self.champions = ChampionRegistry()
+        self.buckets: Dict[Tuple[str, str], StatBucket] = {}
+        self.versions: Set[str] = set()
+        self.max_versions = max_versions
+        self.catalog = None  # 챔피언 카탈로그 (설정되면 그 버전 카탈로그에 있는 챔피언만 집계)
+        self.revision = 0
+        self._aggregate_cache: Dict[Tuple[Optional[str], Optional[str]], Tuple[int, dict]] = {}
+        self._prefetching: Dict[str, asyncio.Task] = {}
+
+    def prefetch(self, version: str):
+        """버전의 챔피언 카탈로그를 미리 불러옴 (게임 생성 시, 세트 결과가 확정되기 전에 준비)"""
+        if self.catalog is None or version in self._prefetching or self.catalog.cached_index(version):
+            return
+        task = self._prefetching[version] = asyncio.create_task(self.catalog.get_index(version))
+
+        def done(task: asyncio.Task):
+            self._prefetching.pop(version, None)
+            if not task.cancelled() and task.exception():
+                print(f"Error loading champion catalog {version} for stats: {task.exception()}")
+        task.add_done_callback(done)
+
+    def _known_champions(self, version: str) -> Tuple[bool, Optional[Container[str]]]:
+        """(집계할 수 있는 버전인지, 집계할 챔피언 이름 (None이면 제한 없음))
+
+        클라이언트가 보낸 임의의 챔피언/버전 문자열로 통계 배열이 커지지 않도록
+        카탈로그에 있는 버전과 챔피언만, 버전은 최대 max_versions개까지 집계합니다.
+        """
+        if version not in self.versions and len(self.versions) >= self.max_versions:
+            return False, None
+        if self.catalog is None:
+            return True, None
+        index = self.catalog.cached_index(version)
+        if index is None:
+            return False, None
+        return True, index.positions
+
+    def _bucket(self, version: str, draft_type: str) -> StatBucket:
+        bucket = self.buckets.get((version, draft_type))
+        if bucket is None:
+            bucket = self.buckets[(version, draft_type)] = StatBucket(len(self.champions))
+            self.versions.add(version)
+        bucket.grow(len(self.champions))
+        return bucket
+
+    def champion_ids(self, version: str, names: Sequence[str]) -> Optional[np.ndarray]:
+        """이름 목록을 챔피언 ID 배열로 변환 (집계하지 않는 이름은 -1, 집계할 수 없는 버전이면 None)"""
+        accepted, known = self._known_champions(version)
+        if not accepted:
+            return None
+        ids = np.full(len(names), -1, dtype=np.intp)
+        for i, name in enumerate(names):
+            if name and (known is None or name in known):
+                champion_id = self.champions.intern(name)
+                if champion_id is not None:
+                    ids[i] = champion_id
+        return ids
+
+    def _ids(self, phase_data: List[str], phases, known: Optional[Container[str]]) -> Tuple[np.ndarray, np.ndarray]:
+        """phases 중 집계할 챔피언이 선택된 페이즈와 그 챔피언 ID"""
+        selected, ids = [], []
+        for p in phases:
+            name = phase_data[p].strip() if p < len(phase_data) and phase_data[p] else ""
+            if not name or (known is not None and name not in known):
+                continue
+            champion_id = self.champions.intern(name)
+            if champion_id is not None:
+                selected.append(p)
+                ids.append(champion_id)
+        return np.asarray(selected, dtype=np.intp), np.asarray(ids, dtype=np.intp)
+
+    @tracer.traced('StatsService.record_set')
+    def record_set(self, version: str, draft_type: str, set_result, sign: int = 1) -> bool:
+        """세트 결과 하나를 통계에 반영합니다. sign=-1이면 반영을 취소합니다. 집계하지 않는 버전이면 False"""
+        accepted, known = self._known_champions(version)
+        if not accepted:
+            return False
+        phase_data = set_result.phaseData
+        _, blue_picks = self._ids(phase_data, BLUE_PICK_PHASES, known)
+        _, red_picks = self._ids(phase_data, RED_PICK_PHASES, known)
+        _, bans = self._ids(phase_data, BLUE_BAN_PHASES + RED_BAN_PHASES, known)
+        slot_phases, slot_ids = self._ids(phase_data, DRAFT_PHASES, known)
+
+        bucket = self._bucket(version, draft_type)
+
+        blue_won = winner_side(set_result) == "blue"
+        winners, losers = (blue_picks, red_picks) if blue_won else (red_picks, blue_picks)
+        vectors = bucket.vectors
+        matrices = bucket.matrices
+
+        bucket.sets += sign
+        bucket.blue_side_wins += sign if blue_won else 0
+        np.add.at(vectors["picks"], blue_picks, sign)
+        np.add.at(vectors["picks"], red_picks, sign)
+        np.add.at(vectors["bans"], bans, sign)
+        np.add.at(vectors["wins"], winners, sign)
+        np.add.at(vectors["bluePicks"], blue_picks, sign)
+        np.add.at(vectors["redPicks"], red_picks, sign)
+        np.add.at(vectors["blueWins" if blue_won else "redWins"], winners, sign)
+        np.add.at(bucket.slots, (slot_ids, slot_phases), sign)
+
+        # 같은 팀 조합(시너지)과 상대 조합(카운터). 한 팀에 같은 ID가 여러 번 있어도 모두 세도록 np.add.at 사용
+        def add_pairs(name: str, rows: np.ndarray, columns: np.ndarray):
+            np.add.at(matrices[name], (rows[:, None], columns[None, :]), sign)
+
+        for team in (blue_picks, red_picks):
+            add_pairs("synergyGames", team, team)
+        add_pairs("synergyWins", winners, winners)
+        add_pairs("matchupGames", blue_picks, red_picks)
+        add_pairs("matchupGames", red_picks, blue_picks)
+        add_pairs("matchupWins", winners, losers)
+
+        self.revision += 1
+        return True
+
+    @tracer.traced('StatsService.record_sets')
+    def record_sets(self, version: str, draft_type: str, slots: np.ndarray, blue_won: np.ndarray):
+        """여러 세트를 한 번에 반영합니다 (보관소에 기록된 세트로 통계를 채울 때).
+
+        slots[i, p]는 세트 i의 페이즈 p(1~20)에서 선택된 챔피언 ID(빈 슬롯은 -1), blue_won[i]는 블루 진영 승리 여부.
+        ID는 champion_ids()로 변환한 것이어야 합니다.
+        """
+        sets = len(slots)
+        if not sets:
+            return
+        bucket = self._bucket(version, draft_type)
+        capacity = bucket.capacity
+        vectors = bucket.vectors
+        matrices = bucket.matrices
+
+        def count(ids: np.ndarray) -> np.ndarray:
+            ids = ids[ids >= 0]
+            return np.bincount(ids, minlength=capacity).astype(np.int32)
+
+        def count_pairs(rows: np.ndarray, columns: np.ndarray) -> np.ndarray:
+            """세트마다 rows의 챔피언 × columns의 챔피언 쌍을 셈"""
+            a = np.broadcast_to(rows[:, :, None], (sets, rows.shape[1], columns.shape[1]))
+            b = np.broadcast_to(columns[:, None, :], a.shape)
+            valid = (a >= 0) & (b >= 0)
+            flat = a[valid].astype(np.int64) * capacity + b[valid]
+            return np.bincount(flat, minlength=capacity * capacity).reshape(capacity, capacity).astype(np.int32)
+
+        blue_won = np.asarray(blue_won, dtype=bool)
+        blue_picks = slots[:, BLUE_PICK_PHASES]
+        red_picks = slots[:, RED_PICK_PHASES]
+        winners = np.where(blue_won[:, None], blue_picks, red_picks)
+        losers = np.where(blue_won[:, None], red_picks, blue_picks)
+
+        bucket.sets += sets
+        bucket.blue_side_wins += int(blue_won.sum())
+        vectors["picks"] += count(blue_picks) + count(red_picks)
+        vectors["bans"] += count(slots[:, BLUE_BAN_PHASES + RED_BAN_PHASES])
+        vectors["wins"] += count(winners)
+        vectors["bluePicks"] += count(blue_picks)
+        vectors["redPicks"] += count(red_picks)
+        vectors["blueWins"] += count(blue_picks[blue_won])
+        vectors["redWins"] += count(red_picks[~blue_won])
+        for phase in DRAFT_PHASES:
+            bucket.slots[:, phase] += count(slots[:, phase])
+
+        matrices["synergyGames"] += count_pairs(blue_picks, blue_picks) + count_pairs(red_picks, red_picks)
+        matrices["synergyWins"] += count_pairs(winners, winners)
+        matrices["matchupGames"] += count_pairs(blue_picks, red_picks) + count_pairs(red_picks, blue_picks)
+        matrices["matchupWins"] += count_pairs(winners, losers)
+
+        self.revision += 1
+
+    def aggregate(self, version: Optional[str] = None, draft_type: Optional[str] = None) -> dict:
+        """필터에 맞는 버킷의 배열을 합산 (통계가 바뀌기 전까지 캐시)"""
+        cache_key = (version, draft_type)
+        cached = self._aggregate_cache.get(cache_key)
+        if cached and cached[0] == self.revision:
+            return cached[1]
+
+        size = len(self.champions)
+        result = {
+            "sets": 0,
+            "blueSideWins": 0,
+            "vectors": {name: np.zeros(size, dtype=np.int64) for name in StatBucket.VECTORS},
+            "matrices": {name: np.zeros((size, size), dtype=np.int64) for name in StatBucket.MATRICES},
+            "slots": np.zeros((size, SLOT_COUNT), dtype=np.int64),
+        }
+        for (bucket_version, bucket_draft_type), bucket in self.buckets.items():
+            if version and bucket_version != version:
+                continue
+            if draft_type and bucket_draft_type != draft_type:
+                continue
+            n = min(size, bucket.capacity)
+            result["sets"] += bucket.sets
+            result["blueSideWins"] += bucket.blue_side_wins
+            for name in StatBucket.VECTORS:
+                result["vectors"][name][:n] += bucket.vectors[name][:n]
+            for name in StatBucket.MATRICES:
+                result["matrices"][name][:n, :n] += bucket.matrices[name][:n, :n]
+            result["slots"][:n] += bucket.slots[:n]
+
+        self._aggregate_cache[cache_key] = (self.revision, result)
+        return result
+
+    def champion_table(self, version: Optional[str] = None, draft_type: Optional[str] = None,
+                       sort: str = "presence", limit: Optional[int] = None) -> dict:
+        """챔피언별 픽/밴/승률 요약"""
+        agg = self.aggregate(version, draft_type)
+        sets = agg["sets"]
+        v = agg["vectors"]
+        denominator = max(sets, 1)
+        picks = v["picks"]
+        rates = {
+            "pickRate": picks / denominator,
+            "banRate": v["bans"] / denominator,
+            "presence": (picks + v["bans"]) / denominator,
+            "winRate": np.divide(v["wins"], picks, out=np.zeros(len(picks)), where=picks > 0),
+        }
+        order_key = rates.get(sort, v.get(sort))
+        if order_key is None:
+            raise ValueError(f"정렬 기준이 잘못되었습니다: {sort}")
+
+        active = np.flatnonzero(picks + v["bans"])
+        active = active[np.argsort(-order_key[active], kind="stable")]
+        if limit:
+            active = active[:limit]
+
+        champions = []
+        for idx in active:
+            champions.append({
+                "champion": self.champions.names[idx],
+                "picks": int(picks[idx]),
+                "bans": int(v["bans"][idx]),
+                "wins": int(v["wins"][idx]),
+                "bluePicks": int(v["bluePicks"][idx]),
+                "redPicks": int(v["redPicks"][idx]),
+                "blueWins": int(v["blueWins"][idx]),
+                "redWins": int(v["redWins"][idx]),
+                "pickRate": round(float(rates["pickRate"][idx]), 4),
+                "banRate": round(float(rates["banRate"][idx]), 4),
+                "presence": round(float(rates["presence"][idx]), 4),
+                "winRate": round(float(rates["winRate"][idx]), 4),
+            })
+        return {
+            "sets": int(sets),
+            "blueSideWins": int(agg["blueSideWins"]),
+            "champions": champions,
+        }
+
+    def champion_detail(self, champion: str, version: Optional[str] = None,
+                        draft_type: Optional[str] = None, top: int = 10) -> dict:
+        """단일 챔피언의 슬롯 분포, 시너지, 상대 전적"""
+        idx = self.champions.get(champion)
+        if idx is None:
+            raise ValueError(f"통계가 없는 챔피언입니다: {champion}")
+
+        agg = self.aggregate(version, draft_type)
+        m = agg["matrices"]
+
+        def ranked(games: np.ndarray, wins: np.ndarray) -> list:
+            games = games.copy()
+            games[idx] = 0
+            candidates = np.flatnonzero(games)
+            candidates = candidates[np.argsort(-games[candidates], kind="stable")][:top]
+            return [{
+                "champion": self.champions.names[other],
+                "games": int(games[other]),
+                "wins": int(wins[other]),
+                "winRate": round(float(wins[other] / games[other]), 4),
+            } for other in candidates]
+
+        slots = agg["slots"][idx]
+        return {
+            "champion": champion,
+            "sets": int(agg["sets"]),
+            "picks": int(agg["vectors"]["picks"][idx]),
+            "bans": int(agg["vectors"]["bans"][idx]),
+            "wins": int(agg["vectors"]["wins"][idx]),
+            "slots": {str(phase): int(slots[phase]) for phase in np.flatnonzero(slots)},
+            "synergies": ranked(m["synergyGames"][idx], m["synergyWins"][idx]),
+            "matchups": ranked(m["matchupGames"][idx], m["matchupWins"][idx]),
+        }
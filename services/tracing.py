@@ -0,0 +1,290 @@
+import functools
+import inspect
+import json
+import logging
+import os
+import queue
+import random
+import secrets
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+from typing import Optional
+
+SERVICE_NAME = "lol-draft-server"
+
+# OTLP span kind / status code
+KIND_INTERNAL = 1
+KIND_SERVER = 2
+STATUS_OK = 1
+STATUS_ERROR = 2
+
+
+class Span:
+    __slots__ = ("trace_id", "span_id", "parent_id", "name", "kind", "start_ns", "end_ns",
+                 "attributes", "status")
+
+    def __init__(self, trace_id: str, parent_id: Optional[str], name: str, kind: int, attributes: dict):
+        self.trace_id = trace_id
+        self.span_id = secrets.token_hex(8)
+        self.parent_id = parent_id
+        self.name = name
+        self.kind = kind
+        self.start_ns = time.time_ns()
+        self.end_ns = 0
+        self.attributes = attributes
+        self.status = STATUS_OK
+
+    def set_attribute(self, key: str, value):
+        self.attributes[key] = value
+
+    def set_error(self, message: str):
+        self.status = STATUS_ERROR
+        self.attributes["error.message"] = message
+
+
+class _NoopSpan:
+    """샘플링되지 않은 요청에서 사용하는 빈 span"""
+
+    __slots__ = ()
+
+    def set_attribute(self, key, value):
+        pass
+
+    def set_error(self, message):
+        pass
+
+
+NOOP_SPAN = _NoopSpan()
+
+# 현재 span. 요청이 샘플링되지 않았으면 NOOP_SPAN, 추적 중인 요청 밖이면 None
+_current: ContextVar = ContextVar("trace_span", default=None)
+
+
+def _attribute_value(value) -> dict:
+    if isinstance(value, bool):
+        return {"boolValue": value}
+    if isinstance(value, int):
+        return {"intValue": str(value)}
+    if isinstance(value, float):
+        return {"doubleValue": value}
+    return {"stringValue": str(value)}
+
+
+def encode_span(span: Span) -> str:
+    """OTLP/JSON(ExportTraceServiceRequest) 한 줄로 인코딩 (OpenTelemetry Collector의 otlpjsonfile 형식)"""
+    otlp_span = {
+        "traceId": span.trace_id,
+        "spanId": span.span_id,
+        "name": span.name,
+        "kind": span.kind,
+        "startTimeUnixNano": str(span.start_ns),
+        "endTimeUnixNano": str(span.end_ns),
+        "attributes": [{"key": k, "value": _attribute_value(v)} for k, v in span.attributes.items()],
+        "status": {"code": span.status},
+    }
+    if span.parent_id:
+        otlp_span["parentSpanId"] = span.parent_id
+    return json.dumps({
+        "resourceSpans": [{
+            "resource": {"attributes": [{"key": "service.name", "value": {"stringValue": SERVICE_NAME}}]},
+            "scopeSpans": [{"scope": {"name": SERVICE_NAME}, "spans": [otlp_span]}],
+        }]
+    }, ensure_ascii=False, separators=(',', ':'))
+
+
+class _SpanQueueHandler(QueueHandler):
+    """span을 그대로 큐에 넣고 인코딩은 파일을 쓰는 스레드에서 처리"""
+
+    def __init__(self, span_queue, tracer):
+        super().__init__(span_queue)
+        self.tracer = tracer
+
+    def prepare(self, record):
+        return record
+
+    def enqueue(self, record):
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.tracer.dropped += 1
+
+
+class _SpanFormatter(logging.Formatter):
+    def format(self, record):
+        # RotatingFileHandler는 파일 크기 확인과 기록에서 두 번 format을 호출하므로 한 번만 인코딩
+        encoded = getattr(record, "encoded", None)
+        if encoded is None:
+            encoded = record.encoded = encode_span(record.msg)
+        return encoded
+
+
+class Tracer:
+    """헤드 샘플링 기반의 가벼운 추적기
+
+    요청(소켓 이벤트, REST 호출)이 시작될 때 한 번만 샘플링 여부를 정하고,
+    샘플링되지 않은 요청의 하위 span은 아무 작업도 하지 않습니다.
+    끝난 span은 큐에 넣기만 하며, 별도 스레드가 회전 JSON-lines 파일로 기록합니다.
+    """
+
+    def __init__(self, sample_rate: float = 0.0, path: str = "data/traces.jsonl",
+                 max_bytes: int = 10 * 1024 * 1024, backups: int = 3, queue_size: int = 10000):
+        self.sample_rate = sample_rate
+        self.path = path
+        self.max_bytes = max_bytes
+        self.backups = backups
+        self.queue_size = queue_size
+        self.dropped = 0
+        self.handler: Optional[QueueHandler] = None
+        self.listener: Optional[QueueListener] = None
+
+    @classmethod
+    def from_env(cls) -> "Tracer":
+        return cls(
+            sample_rate=float(os.getenv("TRACE_SAMPLE_RATE", "0")),
+            path=os.getenv("TRACE_FILE", "data/traces.jsonl"),
+            max_bytes=int(os.getenv("TRACE_MAX_BYTES", str(10 * 1024 * 1024))),
+            backups=int(os.getenv("TRACE_BACKUPS", "3")),
+        )
+
+    @property
+    def enabled(self) -> bool:
+        return self.sample_rate > 0
+
+    def _start_exporter(self):
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        file_handler = RotatingFileHandler(self.path, maxBytes=self.max_bytes,
+                                           backupCount=self.backups, encoding="utf-8")
+        file_handler.setFormatter(_SpanFormatter())
+        span_queue = queue.Queue(self.queue_size)
+        self.listener = QueueListener(span_queue, file_handler)
+        self.listener.start()
+        self.handler = _SpanQueueHandler(span_queue, self)
+
+    def _finish(self, span: Span):
+        span.end_ns = time.time_ns()
+        if self.handler is None:
+            self._start_exporter()
+        # 로거를 거치지 않으므로 logging 설정(레벨, disable)과 무관하게 기록됨
+        self.handler.handle(logging.makeLogRecord({"msg": span}))
+
+    @contextmanager
+    def start_trace(self, name: str, kind: int = KIND_SERVER, **attributes):
+        """요청 단위의 루트 span. 이미 추적 중인 요청 안이면 하위 span으로 동작"""
+        if not self.enabled:
+            yield NOOP_SPAN
+            return
+        parent = _current.get()
+        if parent is not None:
+            with self.span(name, **attributes) as span:
+                yield span
+            return
+
+        if random.random() >= self.sample_rate:
+            token = _current.set(NOOP_SPAN)
+            try:
+                yield NOOP_SPAN
+            finally:
+                _current.reset(token)
+            return
+
+        span = Span(secrets.token_hex(16), None, name, kind, attributes)
+        token = _current.set(span)
+        try:
+            yield span
+        except BaseException as e:
+            span.set_error(str(e) or type(e).__name__)
+            raise
+        finally:
+            _current.reset(token)
+            self._finish(span)
+
+    @contextmanager
+    def span(self, name: str, **attributes):
+        """현재 요청의 하위 단계 span (샘플링되지 않은 요청이나 요청 밖에서는 아무것도 하지 않음)"""
+        parent = _current.get()
+        if parent is None or parent is NOOP_SPAN:
+            yield NOOP_SPAN
+            return
+
+        span = Span(parent.trace_id, parent.span_id, name, KIND_INTERNAL, attributes)
+        token = _current.set(span)
+        try:
+            yield span
+        except BaseException as e:
+            span.set_error(str(e) or type(e).__name__)
+            raise
+        finally:
+            _current.reset(token)
+            self._finish(span)
+
+    def bind(self, handler, name: str):
+        """다른 태스크(게임 액터)에서 실행될 핸들러를 현재 span의 하위 span으로 실행하도록 감쌈"""
+        parent = _current.get()
+        if parent is None or parent is NOOP_SPAN:
+            return handler
+
+        async def run_in_parent(*args, **kwargs):
+            token = _current.set(parent)
+            try:
+                with self.span(name):
+                    return await handler(*args, **kwargs)
+            finally:
+                _current.reset(token)
+        return run_in_parent
+
+    def traced(self, name: str):
+        """함수 전체를 하위 span으로 기록하는 데코레이터"""
+        def decorator(func):
+            if inspect.iscoroutinefunction(func):
+                @functools.wraps(func)
+                async def async_wrapper(*args, **kwargs):
+                    parent = _current.get()
+                    if parent is None or parent is NOOP_SPAN:
+                        return await func(*args, **kwargs)
+                    with self.span(name):
+                        return await func(*args, **kwargs)
+                return async_wrapper
+
+            @functools.wraps(func)
+            def wrapper(*args, **kwargs):
+                parent = _current.get()
+                if parent is None or parent is NOOP_SPAN:
+                    return func(*args, **kwargs)
+                with self.span(name):
+                    return func(*args, **kwargs)
+            return wrapper
+        return decorator
+
+    def shutdown(self):
+        if self.listener:
+            self.listener.stop()
+            self.listener = None
+
+
+class TracingMiddleware:
+    """REST 요청마다 루트 span을 만드는 ASGI 미들웨어 (Socket.IO 경로는 제외)"""
+
+    def __init__(self, app, tracer: Tracer):
+        self.app = app
+        self.tracer = tracer
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or not self.tracer.enabled or scope["path"].startswith("/socket.io"):
+            return await self.app(scope, receive, send)
+
+        with self.tracer.start_trace(f"HTTP {scope['method']}", **{
+            "http.method": scope["method"],
+            "http.target": scope["path"],
+        }) as span:
+            async def send_with_status(message):
+                if message["type"] == "http.response.start":
+                    span.set_attribute("http.status_code", message["status"])
+                    if message["status"] >= 500:
+                        span.set_error(f"HTTP {message['status']}")
+                await send(message)
+            await self.app(scope, receive, send_with_status)
+
+
+tracer = Tracer.from_env()
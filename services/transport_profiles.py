@@ -0,0 +1,103 @@
+import os
+from typing import Dict, List, NamedTuple, Optional
+
+
+class TransportProfile(NamedTuple):
+    """Engine.IO 전송 방식, 하트비트, 메시지 크기, 압축 설정 묶음"""
+    name: str
+    transports: List[str]
+    ping_interval: float          # 하트비트 간격 (초)
+    ping_timeout: float           # 하트비트 응답 대기 시간 (초)
+    max_message_size: int         # 클라이언트 메시지 최대 크기 (바이트)
+    compression_threshold: Optional[int]  # long-polling 응답 중 이 크기 이상만 압축 (None이면 압축하지 않음)
+    websocket_deflate: bool       # 웹소켓 permessage-deflate (메시지마다 크기 기준을 둘 수 없어 켜고 끄기만 가능)
+    description: str
+
+    def server_options(self) -> dict:
+        """socketio.AsyncServer 옵션"""
+        return {
+            "transports": self.transports,
+            "ping_interval": self.ping_interval,
+            "ping_timeout": self.ping_timeout,
+            "max_http_buffer_size": self.max_message_size,
+            "http_compression": self.compression_threshold is not None,
+            "compression_threshold": self.compression_threshold or 0,
+        }
+
+    def uvicorn_options(self) -> dict:
+        """uvicorn 웹소켓 옵션 (run.py에서 사용)"""
+        return {
+            "ws_max_size": self.max_message_size,
+            "ws_per_message_deflate": self.websocket_deflate,
+        }
+
+    def describe(self) -> dict:
+        return {
+            "name": self.name,
+            "transports": self.transports,
+            "pingInterval": self.ping_interval,
+            "pingTimeout": self.ping_timeout,
+            "maxMessageSize": self.max_message_size,
+            "compressionThreshold": self.compression_threshold,
+            "websocketDeflate": self.websocket_deflate,
+        }
+
+
+PROFILES: Dict[str, TransportProfile] = {
+    profile.name: profile for profile in (
+        # 기존 서버 설정. 압축 값은 python-engineio(1KB 이상 압축)와 uvicorn(deflate 사용)의 기본값을 그대로 적음.
+        # 메시지 크기는 배너 이미지를 /assets 업로드로 옮기면서 1e8에서 1MB로 줄인 값이며,
+        # 웹소켓 프레임 한도(uvicorn 기본 16MB)도 같은 1MB로 맞춤
+        TransportProfile(
+            name="default",
+            transports=["polling", "websocket"],
+            ping_interval=25,
+            ping_timeout=60,
+            max_message_size=1_000_000,
+            compression_threshold=1024,
+            websocket_deflate=True,
+            description="long-polling으로 연결한 뒤 웹소켓으로 업그레이드 (기존 설정, 메시지 최대 1MB)",
+        ),
+        TransportProfile(
+            name="websocket",
+            transports=["websocket"],
+            ping_interval=25,
+            ping_timeout=20,
+            max_message_size=64 * 1024,
+            compression_threshold=None,
+            websocket_deflate=False,
+            description="웹소켓만 허용. long-polling 요청이 없어 클라이언트당 비용이 가장 낮음",
+        ),
+        TransportProfile(
+            name="lan",
+            transports=["websocket"],
+            ping_interval=5,
+            ping_timeout=5,
+            max_message_size=64 * 1024,
+            compression_threshold=None,
+            websocket_deflate=False,
+            description="대회장 LAN용. 웹소켓만 허용하고 끊긴 연결을 10초 안에 감지",
+        ),
+        TransportProfile(
+            name="mobile",
+            transports=["polling", "websocket"],
+            ping_interval=25,
+            ping_timeout=90,
+            max_message_size=1_000_000,
+            compression_threshold=256,
+            websocket_deflate=True,
+            description="모바일 네트워크용. 앱 전환이나 망 전환으로 응답이 늦어도 연결을 유지하고 작은 메시지도 압축",
+        ),
+    )
+}
+
+DEFAULT_PROFILE = "default"
+
+
+def get_transport_profile(name: Optional[str] = None) -> TransportProfile:
+    """이름(없으면 SOCKET_TRANSPORT_PROFILE 환경 변수)으로 전송 프로필 반환"""
+    name = name or os.getenv("SOCKET_TRANSPORT_PROFILE", DEFAULT_PROFILE)
+    profile = PROFILES.get(name)
+    if profile is None:
+        raise ValueError(f"알 수 없는 전송 프로필입니다: {name} (사용 가능: {', '.join(PROFILES)})")
+    return profile
@@ -0,0 +1,249 @@
+import asyncio
+import hashlib
+import hmac
+import json
+import os
+import random
+import secrets
+import time
+from collections import deque
+from typing import Deque, Dict, List, Optional, Set, Tuple
+from urllib.parse import urlparse
+
+import aiohttp
+
+WEBHOOK_EVENTS = ("side_choice_phase", "match_finished")
+
+
+class WebhookDestination:
+    """전송 대상(URL, 서명 키)별 큐와 keep-alive 세션
+
+    이벤트는 제한된 크기의 큐에 쌓이고(가득 차면 가장 오래된 이벤트를 버림),
+    전용 작업 태스크가 여러 이벤트를 한 번의 요청으로 묶어 전송합니다.
+    """
+
+    def __init__(self, url: str, secret: Optional[str], queue_size: int):
+        self.url = url
+        self.secret = secret
+        self.queue: Deque[dict] = deque(maxlen=queue_size)
+        self.wake = asyncio.Event()
+        self.session: Optional[aiohttp.ClientSession] = None
+        self.task: Optional[asyncio.Task] = None
+        self.subscriptions: Set[str] = set()
+        self.delivered = 0
+        self.failed = 0
+        self.dropped = 0
+        self.retries = 0
+        self.last_status: Optional[int] = None
+        self.last_error: Optional[str] = None
+
+    def enqueue(self, payload: dict):
+        if len(self.queue) == self.queue.maxlen:
+            self.dropped += 1
+        self.queue.append(payload)
+        self.wake.set()
+
+
+class WebhookDispatcher:
+    """게임 결과 이벤트를 구독한 외부 시스템(브래킷 등)으로 전송하는 백그라운드 디스패처
+
+    publish는 큐에 넣기만 하고 바로 반환하므로 이벤트 핸들러에서는 네트워크 작업을 하지 않습니다.
+    """
+
+    def __init__(self):
+        self.queue_size = int(os.getenv("WEBHOOK_QUEUE_SIZE", "1000"))
+        self.batch_size = int(os.getenv("WEBHOOK_BATCH_SIZE", "50"))
+        self.batch_seconds = float(os.getenv("WEBHOOK_BATCH_MS", "200")) / 1000
+        self.max_attempts = int(os.getenv("WEBHOOK_MAX_ATTEMPTS", "6"))
+        self.backoff_base = float(os.getenv("WEBHOOK_BACKOFF_BASE_SECONDS", "0.5"))
+        self.backoff_max = float(os.getenv("WEBHOOK_BACKOFF_MAX_SECONDS", "30"))
+        self.timeout_seconds = float(os.getenv("WEBHOOK_TIMEOUT_SECONDS", "10"))
+        self.subscriptions: Dict[str, dict] = {}
+        self.by_game: Dict[Optional[str], Set[str]] = {}  # None은 전체 게임 구독
+        self.destinations: Dict[Tuple[str, Optional[str]], WebhookDestination] = {}
+
+    def subscribe(self, url: str, game_code: Optional[str] = None,
+                  events: Optional[List[str]] = None, secret: Optional[str] = None) -> dict:
+        parsed = urlparse(url)
+        if parsed.scheme not in ("http", "https") or not parsed.netloc:
+            raise ValueError("웹훅 URL은 http 또는 https 주소여야 합니다.")
+        events = list(events or WEBHOOK_EVENTS)
+        unknown = [event for event in events if event not in WEBHOOK_EVENTS]
+        if unknown:
+            raise ValueError(f"지원하지 않는 이벤트입니다: {', '.join(unknown)}")
+
+        subscription_id = secrets.token_hex(8)
+        subscription = {
+            "id": subscription_id,
+            "url": url,
+            "gameCode": game_code,
+            "events": events,
+            "secret": secret,
+            "createdAt": int(time.time() * 1000000),
+        }
+        self.subscriptions[subscription_id] = subscription
+        self.by_game.setdefault(game_code, set()).add(subscription_id)
+        key = (url, secret)
+        destination = self.destinations.get(key)
+        if destination is None:
+            destination = self.destinations[key] = WebhookDestination(url, secret, self.queue_size)
+        destination.subscriptions.add(subscription_id)
+        return self.describe(subscription)
+
+    def unsubscribe(self, subscription_id: str):
+        subscription = self.subscriptions.pop(subscription_id, None)
+        if subscription is None:
+            raise ValueError("웹훅 구독을 찾을 수 없습니다.")
+        ids = self.by_game.get(subscription["gameCode"])
+        if ids is not None:
+            ids.discard(subscription_id)
+            if not ids:
+                del self.by_game[subscription["gameCode"]]
+        key = (subscription["url"], subscription["secret"])
+        destination = self.destinations.get(key)
+        if destination:
+            destination.subscriptions.discard(subscription_id)
+            if destination.task is None:
+                if not destination.subscriptions:
+                    del self.destinations[key]
+            else:
+                # 남은 이벤트를 보낸 뒤 작업 태스크가 세션을 정리하도록 깨움
+                destination.wake.set()
+
+    def drop_game(self, game_code: str):
+        """종료된 게임의 게임별 구독 제거"""
+        for subscription_id in list(self.by_game.get(game_code, ())):
+            self.unsubscribe(subscription_id)
+
+    def list_subscriptions(self, game_code: Optional[str] = None) -> List[dict]:
+        return [
+            self.describe(subscription) for subscription in self.subscriptions.values()
+            if game_code is None or subscription["gameCode"] == game_code
+        ]
+
+    @staticmethod
+    def describe(subscription: dict) -> dict:
+        """응답용 구독 정보 (서명 키는 노출하지 않음)"""
+        return {
+            "id": subscription["id"],
+            "url": subscription["url"],
+            "gameCode": subscription["gameCode"],
+            "events": subscription["events"],
+            "signed": bool(subscription["secret"]),
+            "createdAt": subscription["createdAt"],
+        }
+
+    def publish(self, game_code: str, event: str, data: dict):
+        """구독한 전송 대상의 큐에 이벤트를 넣고 바로 반환"""
+        payload = None
+        targets = set()
+        for key in (game_code, None):
+            for subscription_id in self.by_game.get(key, ()):
+                subscription = self.subscriptions[subscription_id]
+                if event not in subscription["events"]:
+                    continue
+                target = (subscription["url"], subscription["secret"])
+                if target in targets:
+                    continue  # 같은 대상에 전체/게임별 구독이 겹치면 한 번만 전송
+                targets.add(target)
+                if payload is None:
+                    payload = {
+                        "id": secrets.token_hex(8),
+                        "event": event,
+                        "gameCode": game_code,
+                        "data": data,
+                        "timestamp": int(time.time() * 1000000),
+                    }
+                destination = self.destinations[target]
+                destination.enqueue(payload)
+                if destination.task is None:
+                    destination.task = asyncio.create_task(self._run(target, destination))
+
+    def _backoff(self, attempt: int) -> float:
+        """지수 백오프에 지터를 더한 대기 시간 (여러 서버가 동시에 재시도하지 않도록)"""
+        delay = min(self.backoff_max, self.backoff_base * (2 ** attempt))
+        return delay / 2 + random.uniform(0, delay / 2)
+
+    async def _run(self, key, destination: WebhookDestination):
+        try:
+            while destination.subscriptions or destination.queue:
+                if not destination.queue:
+                    destination.wake.clear()
+                    await destination.wake.wait()
+                    continue
+
+                # 짧은 시간 동안 이벤트를 모아 한 번에 전송
+                if len(destination.queue) < self.batch_size:
+                    await asyncio.sleep(self.batch_seconds)
+                batch = [destination.queue.popleft()
+                         for _ in range(min(self.batch_size, len(destination.queue)))]
+                await self._deliver(destination, batch)
+        finally:
+            if destination.session:
+                await destination.session.close()
+                destination.session = None
+            destination.task = None
+            if not destination.subscriptions and self.destinations.get(key) is destination:
+                del self.destinations[key]
+
+    async def _deliver(self, destination: WebhookDestination, batch: List[dict]):
+        if destination.session is None:
+            destination.session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=4, keepalive_timeout=60),
+                timeout=aiohttp.ClientTimeout(total=self.timeout_seconds),
+            )
+        body = json.dumps({"events": batch}, ensure_ascii=False, separators=(',', ':')).encode()
+        headers = {"Content-Type": "application/json"}
+        if destination.secret:
+            signature = hmac.new(destination.secret.encode(), body, hashlib.sha256).hexdigest()
+            headers["X-Webhook-Signature"] = f"sha256={signature}"
+
+        for attempt in range(self.max_attempts):
+            try:
+                async with destination.session.post(destination.url, data=body, headers=headers) as response:
+                    destination.last_status = response.status
+                    if response.status < 300:
+                        destination.delivered += len(batch)
+                        destination.last_error = None
+                        return
+                    destination.last_error = f"HTTP {response.status}"
+                    # 429와 5xx만 재시도, 그 외 4xx는 받는 쪽 설정 문제이므로 버림
+                    if response.status != 429 and response.status < 500:
+                        break
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                destination.last_error = str(e) or type(e).__name__
+            if attempt + 1 < self.max_attempts:
+                destination.retries += 1
+                await asyncio.sleep(self._backoff(attempt))
+
+        destination.failed += len(batch)
+        print(f"Webhook delivery to {destination.url} failed: {destination.last_error}")
+
+    def metrics(self) -> dict:
+        return {
+            "subscriptions": len(self.subscriptions),
+            "destinations": [
+                {
+                    "url": destination.url,
+                    "subscriptions": len(destination.subscriptions),
+                    "queued": len(destination.queue),
+                    "delivered": destination.delivered,
+                    "failed": destination.failed,
+                    "dropped": destination.dropped,
+                    "retries": destination.retries,
+                    "lastStatus": destination.last_status,
+                    "lastError": destination.last_error,
+                }
+                for destination in self.destinations.values()
+            ],
+        }
+
+    async def close(self):
+        """종료 시 작업 태스크와 세션 정리"""
+        for destination in list(self.destinations.values()):
+            if destination.task:
+                destination.task.cancel()
+                try:
+                    await destination.task
+                except asyncio.CancelledError:
+                    pass
@@ -0,0 +1,66 @@
+import asyncio
+import os
+
+import pytest
+
+from models import Game, GameResult, GameSetting, GameStatus, SetResult
+from services import match_archive as archive_module
+from services.match_archive import ArchiveFull, MatchArchive
+
+
+def append(archive, game_code, champions):
+    result = GameResult(results=[
+        SetResult(phaseData=[""] + champions + ["team1"], team1Side="blue", team2Side="red", winner="team1"),
+    ])
+    archive.append_match(
+        game_code,
+        Game(gameCode=game_code, createdAt=1),
+        GameSetting(version="14.1.1", draftType="tournament", playerType="1v1", matchFormat="bo1", timeLimit=False),
+        GameStatus(lastUpdatedAt=2, phaseData=[""] * 22),
+        result,
+    )
+
+
+def test_failed_write_is_rolled_back_and_retried(tmp_path, monkeypatch):
+    archive = MatchArchive(str(tmp_path))
+    append(archive, "0000000a", [f"A{i}" for i in range(20)])
+    archive.flush()
+
+    append(archive, "0000000b", [f"B{i}" for i in range(20)])
+    sizes = {name: os.path.getsize(tmp_path / name) for name in os.listdir(tmp_path)}
+    calls = []
+
+    def failing_fsync(fd):
+        calls.append(fd)
+        if len(calls) == 4:  # 사전 일부와 열 일부를 기록한 뒤 실패
+            raise OSError(28, "No space left on device")
+    monkeypatch.setattr(archive_module.os, "fsync", failing_fsync)
+    with pytest.raises(OSError):
+        asyncio.run(archive.flush_async())
+
+    assert {name: os.path.getsize(tmp_path / name) for name in sizes} == sizes
+    assert archive.rows == 1 and archive.pending_rows == 1 and archive.write_errors == 1
+
+    monkeypatch.undo()
+    asyncio.run(archive.close())
+    reopened = MatchArchive(str(tmp_path))
+    reopened.open()
+    codes = reopened.scan(("gameCode",))["gameCode"].tolist()
+    assert codes == [0xa, 0xb]
+    assert reopened.summary(top=1)["sets"] == 2
+    assert "B0" in reopened.dictionaries["champion"].ids
+
+
+def test_full_dictionary_stops_archiving(tmp_path, monkeypatch):
+    monkeypatch.setitem(archive_module.DICTIONARY_LIMITS, "champion", 30)
+    archive = MatchArchive(str(tmp_path))
+    append(archive, "0000000a", [f"A{i}" for i in range(20)])
+    with pytest.raises(ArchiveFull):
+        append(archive, "0000000b", [f"B{i}" for i in range(20)])
+
+    assert archive.pending_rows == 1
+    assert archive.metrics()["full"]
+    with pytest.raises(ArchiveFull):
+        append(archive, "0000000c", [f"A{i}" for i in range(20)])
+    archive.flush()
+    assert archive.rows == 1
@@ -0,0 +1,26 @@
+import asyncio
+import time
+
+from services.report_pool import ReportPool
+
+
+def test_worker_timeout_keeps_other_reports_running():
+    async def scenario():
+        pool = ReportPool(workers=2, max_pending=4, timeout_seconds=1.0)
+        try:
+            await pool.run(time.sleep, 0)
+            executor = pool.executor
+
+            async def in_flight():
+                await asyncio.sleep(0.5)  # 느린 작업이 중단될 때 실행 중인 작업
+                return await pool.run(time.sleep, 0.9)
+
+            slow, other = await asyncio.gather(pool.run(time.sleep, 5), in_flight(), return_exceptions=True)
+            assert isinstance(slow, asyncio.TimeoutError)
+            assert other is None
+            assert pool.executor is executor
+            assert pool.metrics()["timedOut"] == 1 and pool.metrics()["failed"] == 0
+        finally:
+            pool.shutdown()
+
+    asyncio.run(scenario())
@@ -0,0 +1,59 @@
+import numpy as np
+
+from models import SetResult
+from services.champion_search import ChampionIndex
+from services.stats_service import StatsService
+
+VERSION = "14.1.1"
+CHAMPIONS = [f"Champion{i}" for i in range(1, 21)]
+
+
+class StubCatalog:
+    def __init__(self, champions):
+        self.index = ChampionIndex(VERSION, [
+            {"id": name, "name": name, "nameKo": name, "image": ""} for name in champions
+        ])
+
+    def cached_index(self, version):
+        return self.index if version == VERSION else None
+
+
+def make_set(picks, winner="team1"):
+    return SetResult(phaseData=[""] + picks + [winner], team1Side="blue", team2Side="red", winner=winner)
+
+
+def test_ignores_champions_and_versions_outside_catalog():
+    stats = StatsService()
+    stats.catalog = StubCatalog(CHAMPIONS)
+
+    assert not stats.record_set("0.0.fake", "tournament", make_set(CHAMPIONS))
+    assert stats.record_set(VERSION, "tournament", make_set(["fake"] * 5 + CHAMPIONS[5:]))
+
+    assert "fake" not in stats.champions.ids
+    assert set(stats.buckets) == {(VERSION, "tournament")}
+    assert stats.aggregate()["sets"] == 1
+
+
+def test_caps_versions_and_champions():
+    stats = StatsService(max_versions=2)
+    stats.champions.max_size = 20
+    for version in ("1", "2", "3"):
+        stats.record_set(version, "tournament", make_set([f"{version}-{c}" for c in CHAMPIONS]))
+
+    assert stats.versions == {"1", "2"}
+    assert len(stats.champions) == 20
+
+
+def test_counts_repeated_champions_in_a_team():
+    stats = StatsService()
+    picks = list(CHAMPIONS)
+    picks[6] = picks[9] = "Champion7"  # 블루 1픽, 블루 2픽 (페이즈 7, 10)
+    stats.record_set(VERSION, "tournament", make_set(picks))
+
+    result = stats.aggregate()
+    champion = stats.champions.get("Champion7")
+    assert result["vectors"]["picks"][champion] == 2
+    assert result["matrices"]["synergyGames"][champion, champion] == 4
+
+    stats.record_set(VERSION, "tournament", make_set(picks), sign=-1)
+    assert not np.any(stats.aggregate()["matrices"]["synergyGames"])
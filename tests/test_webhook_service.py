@@ -0,0 +1,165 @@
+"""WebhookDispatcher 테스트 (로컬 aiohttp 스텁 수신 서버로 전송)"""
+import asyncio
+import hashlib
+import hmac
+import json
+
+from aiohttp import web
+
+from services.webhook_service import WebhookDispatcher
+
+
+class StubReceiver:
+    """받은 요청을 경로별로 기록하고, statuses에 넣어 둔 응답 코드를 차례로 돌려주는 수신 서버"""
+
+    def __init__(self):
+        self.requests = []  # (경로, 헤더, 본문)
+        self.statuses = []
+        self.runner = None
+        self.base_url = None
+
+    async def handle(self, request: web.Request):
+        body = await request.read()
+        self.requests.append((request.path, dict(request.headers), body))
+        status = self.statuses.pop(0) if self.statuses else 200
+        return web.Response(status=status)
+
+    async def __aenter__(self):
+        app = web.Application()
+        app.router.add_post("/{name}", self.handle)
+        self.runner = web.AppRunner(app)
+        await self.runner.setup()
+        site = web.TCPSite(self.runner, "127.0.0.1", 0)
+        await site.start()
+        port = self.runner.addresses[0][1]
+        self.base_url = f"http://127.0.0.1:{port}"
+        return self
+
+    async def __aexit__(self, *exc):
+        await self.runner.cleanup()
+
+    def events(self, path: str) -> list:
+        return [event for p, _, body in self.requests if p == path for event in json.loads(body)["events"]]
+
+
+def make_dispatcher(**overrides) -> WebhookDispatcher:
+    dispatcher = WebhookDispatcher()
+    dispatcher.batch_seconds = 0.05
+    dispatcher.backoff_base = 0.01
+    dispatcher.backoff_max = 0.05
+    dispatcher.timeout_seconds = 5
+    for name, value in overrides.items():
+        setattr(dispatcher, name, value)
+    return dispatcher
+
+
+async def wait_for(condition, timeout: float = 5.0):
+    deadline = asyncio.get_running_loop().time() + timeout
+    while not condition():
+        if asyncio.get_running_loop().time() > deadline:
+            raise AssertionError("시간 안에 조건을 만족하지 않음")
+        await asyncio.sleep(0.01)
+
+
+def run(coro):
+    return asyncio.run(coro)
+
+
+def test_batches_events_per_destination():
+    async def scenario():
+        async with StubReceiver() as receiver:
+            dispatcher = make_dispatcher()
+            dispatcher.subscribe(f"{receiver.base_url}/a", game_code="g1")
+            dispatcher.subscribe(f"{receiver.base_url}/a")  # 같은 대상의 전체 구독은 한 번만 전송
+            dispatcher.subscribe(f"{receiver.base_url}/b", game_code="g1", events=["match_finished"])
+
+            dispatcher.publish("g1", "side_choice_phase", {"set": 1})
+            dispatcher.publish("g1", "side_choice_phase", {"set": 2})
+            dispatcher.publish("g1", "match_finished", {"set": 3})
+            await wait_for(lambda: len(receiver.events("/a")) == 3 and len(receiver.events("/b")) == 1)
+            await dispatcher.close()
+
+            paths = [path for path, _, _ in receiver.requests]
+            assert paths.count("/a") == 1  # 세 이벤트가 한 요청으로 묶임
+            assert paths.count("/b") == 1
+            assert [e["data"]["set"] for e in receiver.events("/a")] == [1, 2, 3]
+            assert receiver.events("/b")[0]["event"] == "match_finished"
+            assert receiver.events("/b")[0]["id"] == receiver.events("/a")[2]["id"]
+
+    run(scenario())
+
+
+def test_signs_body_with_hmac_sha256():
+    async def scenario():
+        async with StubReceiver() as receiver:
+            dispatcher = make_dispatcher()
+            dispatcher.subscribe(f"{receiver.base_url}/signed", secret="s3cret")
+            dispatcher.subscribe(f"{receiver.base_url}/plain")
+            dispatcher.publish("g1", "match_finished", {"winner": "team1"})
+            await wait_for(lambda: len(receiver.requests) == 2)
+            await dispatcher.close()
+
+            requests = {path: (headers, body) for path, headers, body in receiver.requests}
+            headers, body = requests["/signed"]
+            expected = hmac.new(b"s3cret", body, hashlib.sha256).hexdigest()
+            assert headers["X-Webhook-Signature"] == f"sha256={expected}"
+            assert "X-Webhook-Signature" not in requests["/plain"][0]
+
+    run(scenario())
+
+
+def test_retries_with_backoff_after_server_error():
+    async def scenario():
+        async with StubReceiver() as receiver:
+            receiver.statuses = [503, 500]
+            dispatcher = make_dispatcher()
+            dispatcher.subscribe(f"{receiver.base_url}/flaky")
+            delays = []
+            backoff = dispatcher._backoff
+            dispatcher._backoff = lambda attempt: delays.append(backoff(attempt)) or delays[-1]
+
+            dispatcher.publish("g1", "match_finished", {"set": 1})
+            await wait_for(lambda: dispatcher.metrics()["destinations"][0]["delivered"] == 1)
+            metrics = dispatcher.metrics()["destinations"][0]
+            await dispatcher.close()
+
+            assert len(receiver.requests) == 3
+            assert len({body for _, _, body in receiver.requests}) == 1  # 같은 본문으로 재전송
+            assert metrics["retries"] == 2
+            assert metrics["failed"] == 0
+            assert metrics["lastStatus"] == 200
+            assert len(delays) == 2
+            assert all(0 < delay <= dispatcher.backoff_max for delay in delays)
+
+    run(scenario())
+
+
+def test_gives_up_after_max_attempts():
+    async def scenario():
+        async with StubReceiver() as receiver:
+            receiver.statuses = [502] * 10
+            dispatcher = make_dispatcher(max_attempts=3)
+            dispatcher.subscribe(f"{receiver.base_url}/down")
+            dispatcher.publish("g1", "match_finished", {"set": 1})
+            await wait_for(lambda: dispatcher.metrics()["destinations"][0]["failed"] == 1)
+            await dispatcher.close()
+            assert len(receiver.requests) == 3
+
+    run(scenario())
+
+
+def test_bounded_queue_drops_oldest_events():
+    async def scenario():
+        async with StubReceiver() as receiver:
+            dispatcher = make_dispatcher(queue_size=3)
+            dispatcher.subscribe(f"{receiver.base_url}/slow")
+            # publish는 큐에 넣기만 하므로 작업 태스크가 돌기 전에 큐가 넘침
+            for i in range(5):
+                dispatcher.publish("g1", "side_choice_phase", {"set": i})
+            assert dispatcher.metrics()["destinations"][0]["dropped"] == 2
+
+            await wait_for(lambda: len(receiver.events("/slow")) == 3)
+            await dispatcher.close()
+            assert [e["data"]["set"] for e in receiver.events("/slow")] == [2, 3, 4]
+
+    run(scenario())